@@ -0,0 +1,55 @@
+"""
+Add generated tickers_texts column to companies.
+
+Revision ID: 003
+Revises: 002
+Create Date: 2025-02-10 09:00:00.000000
+"""
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '003'
+down_revision = '002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Store ticker symbols as text[] so single-ticker lookups use a plain array GIN index."""
+
+    # Generated columns cannot contain subqueries, so the JSONB -> text[] projection
+    # lives in an IMMUTABLE SQL function.
+    op.execute(
+        """
+        CREATE FUNCTION company_ticker_symbols(tickers jsonb) RETURNS text[]
+        LANGUAGE sql IMMUTABLE PARALLEL SAFE
+        AS $$
+            SELECT array_agg(elem ->> 'ticker')
+            FROM jsonb_array_elements(
+                CASE WHEN jsonb_typeof(tickers) = 'array' THEN tickers ELSE '[]'::jsonb END
+            ) AS elem
+            WHERE elem ->> 'ticker' IS NOT NULL
+        $$
+        """
+    )
+    op.add_column(
+        'companies',
+        sa.Column(
+            'tickers_texts',
+            postgresql.ARRAY(sa.Text()),
+            sa.Computed('company_ticker_symbols(tickers)', persisted=True),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        'ix_companies_tickers_texts', 'companies', ['tickers_texts'], unique=False, postgresql_using='gin'
+    )
+
+
+def downgrade() -> None:
+    """Drop the generated tickers_texts column and its helper function."""
+    op.drop_index('ix_companies_tickers_texts', table_name='companies')
+    op.drop_column('companies', 'tickers_texts')
+    op.execute('DROP FUNCTION company_ticker_symbols(jsonb)')
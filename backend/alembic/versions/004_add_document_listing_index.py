@@ -0,0 +1,38 @@
+"""
+Add a document listing index.
+
+Revision ID: 004
+Revises: 003
+Create Date: 2025-02-17 09:00:00.000000
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '004'
+down_revision = '003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Index the newest-first document listing."""
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_documents_company_id_fiscal_year_created_at',
+            'documents',
+            ['company_id', sa.text('fiscal_year DESC'), sa.text('created_at DESC')],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Drop the document listing index."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_documents_company_id_fiscal_year_created_at',
+            table_name='documents',
+            postgresql_concurrently=True,
+        )
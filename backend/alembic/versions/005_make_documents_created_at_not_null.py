@@ -0,0 +1,41 @@
+"""
+Make documents.created_at NOT NULL.
+
+Revision ID: 005
+Revises: 004
+Create Date: 2025-02-24 09:00:00.000000
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '005'
+down_revision = '004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Backfill missing creation times so created_at can key the document listing cursor."""
+    # A NULL created_at compares as unknown in the (fiscal_year, created_at, id)
+    # keyset predicate, so such rows could never be reached by cursor paging.
+    # Their real creation time is unknown; the epoch sorts them last in their year.
+    op.execute("UPDATE documents SET created_at = 'epoch' WHERE created_at IS NULL")
+    op.alter_column(
+        'documents',
+        'created_at',
+        existing_type=sa.DateTime(timezone=True),
+        existing_server_default=sa.text('now()'),
+        nullable=False,
+    )
+
+
+def downgrade() -> None:
+    """Allow NULL creation times again."""
+    op.alter_column(
+        'documents',
+        'created_at',
+        existing_type=sa.DateTime(timezone=True),
+        existing_server_default=sa.text('now()'),
+        nullable=True,
+    )
@@ -1,46 +1,24 @@
 """
-This module provides a factory method to create and configure an instance of the
-FastAPI application, complete with logging, routes, error handling, CORS, and middleware.
+This package holds the FastAPI application and its supporting modules.
 
-The goal of this module is to provide a fully-configured, ready-to-deploy FastAPI application
-that includes Prometheus metrics collection, error handling, and request management.
+``create_app`` is imported from ``app.factory`` on first access, so importing
+any submodule (as Celery workers, Alembic and the repositories do) does not
+load FastAPI, the middleware stack and the metrics exporters.
 
 Author: Patryk Golabek
 Copyright: 2025 Patryk Golabek
 """
 
-import logging
+from typing import TYPE_CHECKING
 
-from fastapi import FastAPI
+from app.utils.lazy_imports import lazy_imports
 
-from config import Settings
+if TYPE_CHECKING:
+    from app.factory import create_app
 
-from .app_builder import FastAPIAppBuilder
-from .utils.logger import AppLogger
+# Exported name -> submodule defining it
+_LAZY_IMPORTS = {"create_app": "app.factory"}
 
+__all__ = ["create_app"]
 
-def create_app() -> FastAPI:
-    """
-    Factory method to create, configure, and return an instance of the FastAPI application.
-
-    The method sets up the application with logging, error handling, routing, middleware,
-    and external service integrations, ensuring the app is ready for deployment.
-
-    Returns:
-        FastAPI: The configured FastAPI application instance.
-    """
-    # Initialize and configure the AppLogger before passing it to the builder
-    AppLogger.initialize_logger(log_level=logging.INFO)
-
-    builder = FastAPIAppBuilder(settings=Settings(), logger=AppLogger.logger)
-    app = (
-        builder.setup_settings()  # Initialize settings
-        .setup_logging()  # Configure logging
-        .setup_metrics()  # Setup Prometheus metrics
-        .setup_error_handlers()  # Configure error handlers
-        .setup_api_routes()  # Register API v1 routes
-        .setup_routes()  # Define basic routes
-        .setup_middleware()  # Configure middleware
-        .build()
-    )
-    return app
+lazy_imports(__name__, _LAZY_IMPORTS)
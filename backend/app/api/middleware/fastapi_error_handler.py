@@ -12,6 +12,7 @@ import logging
 from fastapi import FastAPI, HTTPException, Request, status
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
+from sqlalchemy.exc import IntegrityError
 
 from app.core.exceptions.api_exceptions import (
     ApiError,
@@ -26,6 +27,26 @@ from app.core.exceptions.api_exceptions import (
 )
 
 
+def _constraint_name(exc: Exception) -> str | None:
+    """Get the name of the database constraint an IntegrityError violated.
+
+    Args:
+        exc (Exception): The SQLAlchemy IntegrityError.
+
+    Returns:
+        Optional[str]: Constraint name reported by psycopg or asyncpg, if any.
+    """
+    orig = exc.orig if isinstance(exc, IntegrityError) else None
+    if orig is None:
+        return None
+    diag = getattr(orig, "diag", None)
+    if diag is not None:
+        name = getattr(diag, "constraint_name", None)
+    else:
+        name = getattr(orig.__cause__, "constraint_name", None)
+    return name if isinstance(name, str) else None
+
+
 class ProblemDetails(BaseModel):
     """
     Pydantic model for RFC 7807 Problem Details.
@@ -99,6 +120,8 @@ class ErrorHandler:
         self.app.add_exception_handler(ApiError, self.custom_error_handler)
         # Register HTTPException handler
         self.app.add_exception_handler(HTTPException, self.http_exception_handler)
+        # Register database constraint violation handler
+        self.app.add_exception_handler(IntegrityError, self.integrity_error_handler)
         # Register general exception handler last (least specific)
         self.app.add_exception_handler(Exception, self.general_exception_handler)
         self.logger.info("Default exception handlers have been registered successfully.")
@@ -318,6 +341,38 @@ class ErrorHandler:
             detail=exc.detail or "An HTTP exception occurred.",
         )
 
+    async def integrity_error_handler(self, request: Request, exc: Exception) -> JSONResponse:
+        """
+        Handle database constraint violations raised by SQLAlchemy.
+
+        Typed as taking any exception to match Starlette's handler signature;
+        it is only registered for IntegrityError.
+
+        Args:
+            request (Request): The incoming request.
+            exc (Exception): The IntegrityError exception instance.
+
+        Returns:
+            JSONResponse: A ProblemDetails response with status 409.
+        """
+        constraint = _constraint_name(exc)
+        self.logger.warning(
+            f"Integrity error: {getattr(exc, 'orig', exc)} | Path: {request.url.path} | Method: {request.method}"
+        )
+        detail = (
+            f"Request conflicts with database constraint '{constraint}'."
+            if constraint
+            else "Request conflicts with the current state of the database."
+        )
+        return await self._create_problem_response(
+            request=request,
+            exc=exc,
+            status_code=status.HTTP_409_CONFLICT,
+            type_=ErrorType.CONFLICT.value,
+            title="Conflict",
+            detail=detail,
+        )
+
     async def general_exception_handler(self, request: Request, exc: Exception) -> JSONResponse:
         """
         Handle all uncaught exceptions.
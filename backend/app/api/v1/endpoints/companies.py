@@ -7,18 +7,34 @@ Copyright: 2025 Patryk Golabek
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Path, Query, status
+from fastapi import APIRouter, Depends, Path, Query, Response, status
 from fastapi.responses import JSONResponse
 
 from app.core.exceptions.service_exceptions import BaseServiceError
 from app.core.exceptions.translators import translate_service_exception_to_api
-from app.schemas.company import CompanyCreate, CompanyResponse, CompanyUpdate
+from app.schemas.company import CompanyCreate, CompanyDomain, CompanyResponse, CompanyUpdate
 from app.services.company import CompanyService
 from app.services.dependencies import get_company_service
 
 router = APIRouter(prefix="/companies", tags=["Companies"])
 
 
+def _company_json_response(company: CompanyDomain) -> Response:
+    """Serialize a company straight to a JSON response.
+
+    Returning a Response skips FastAPI's response-model validation and
+    ``jsonable_encoder`` pass; ``response_model`` still documents the schema.
+    CompanyResponse adds no fields to CompanyDomain, so the bodies are identical.
+
+    Args:
+        company: Company to serialize.
+
+    Returns:
+        JSON response with the serialized company.
+    """
+    return Response(content=company.model_dump_json(), media_type="application/json")
+
+
 @router.post(
     "",
     response_model=CompanyResponse,
@@ -62,7 +78,7 @@ async def list_companies(
     limit: Annotated[
         int, Query(ge=1, le=100, description="Maximum number of records to return")
     ] = 100,
-) -> list[CompanyResponse]:
+) -> Response:
     """List all companies with pagination.
 
     Args:
@@ -73,8 +89,8 @@ async def list_companies(
     Returns:
         List of companies.
     """
-    companies = await company_service.get_all_companies(skip=skip, limit=limit)
-    return [CompanyResponse.model_validate(company) for company in companies]
+    content = await company_service.get_all_companies_json(skip=skip, limit=limit)
+    return Response(content=content, media_type="application/json")
 
 
 @router.get(
@@ -86,7 +102,7 @@ async def list_companies(
 async def get_company(
     company_id: Annotated[int, Path(description="Company ID")],
     company_service: Annotated[CompanyService, Depends(get_company_service)],
-) -> CompanyResponse:
+) -> Response:
     """Get a company by ID.
 
     Args:
@@ -102,7 +118,7 @@ async def get_company(
     """
     try:
         company = await company_service.get_company(company_id)
-        return CompanyResponse.model_validate(company)
+        return _company_json_response(company)
     except BaseServiceError as e:
         translate_service_exception_to_api(e)
 
@@ -116,7 +132,7 @@ async def get_company(
 async def get_company_by_ticker(
     ticker: Annotated[str, Path(description="Stock ticker symbol")],
     company_service: Annotated[CompanyService, Depends(get_company_service)],
-) -> CompanyResponse:
+) -> Response:
     """Get a company by ticker symbol.
 
     Args:
@@ -132,7 +148,7 @@ async def get_company_by_ticker(
     """
     try:
         company = await company_service.get_company_by_ticker(ticker)
-        return CompanyResponse.model_validate(company)
+        return _company_json_response(company)
     except BaseServiceError as e:
         translate_service_exception_to_api(e)
 
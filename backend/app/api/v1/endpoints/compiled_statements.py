@@ -7,12 +7,15 @@ Copyright: 2025 Patryk Golabek
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Path, status
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Body, Depends, Path, status
+from fastapi.responses import JSONResponse, Response
+from pydantic import TypeAdapter
 
 from app.schemas.extraction import (
+    CompiledStatementBatchGet,
     CompiledStatementCreate,
     CompiledStatementResponse,
+    CompiledStatementSummary,
     CompiledStatementUpdate,
 )
 from app.services.compiled_statement import CompiledStatementService
@@ -20,6 +23,35 @@ from app.services.dependencies import get_compiled_statement_service
 
 router = APIRouter(prefix="/compiled-statements", tags=["Compiled Statements"])
 
+# Upper bound on statements accepted by one bulk request
+MAX_BULK_COMPILED_STATEMENTS = 500
+
+_RESPONSE_LIST_ADAPTER = TypeAdapter(list[CompiledStatementResponse])
+_SUMMARY_LIST_ADAPTER = TypeAdapter(list[CompiledStatementSummary])
+
+
+def _compiled_statement_json_response(
+    compiled_statement: CompiledStatementResponse, status_code: int = status.HTTP_200_OK
+) -> Response:
+    """Serialize a compiled statement straight to a JSON response.
+
+    pydantic-core writes the JSON in one pass, instead of FastAPI revalidating
+    the model and building an intermediate dict of the whole ``data`` tree for
+    the encoder. ``response_model`` still documents the schema.
+
+    Args:
+        compiled_statement: Compiled statement to serialize.
+        status_code: HTTP status code of the response.
+
+    Returns:
+        JSON response with the serialized compiled statement.
+    """
+    return Response(
+        content=compiled_statement.model_dump_json(),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
 
 @router.post(
     "",
@@ -33,7 +65,7 @@ async def create_or_update_compiled_statement(
     compiled_statement_service: Annotated[
         CompiledStatementService, Depends(get_compiled_statement_service)
     ],
-) -> CompiledStatementResponse:
+) -> Response:
     """Create or update a compiled statement.
 
     Args:
@@ -46,7 +78,75 @@ async def create_or_update_compiled_statement(
     compiled_statement = await compiled_statement_service.upsert_compiled_statement(
         compiled_statement_data
     )
-    return compiled_statement
+    return _compiled_statement_json_response(compiled_statement, status.HTTP_201_CREATED)
+
+
+@router.post(
+    "/bulk",
+    response_model=list[CompiledStatementResponse],
+    status_code=status.HTTP_201_CREATED,
+    summary="Create or update compiled statements in bulk",
+    description=(
+        "Create or update many compiled statements in one request. "
+        "Fails with 404 without writing anything if any company does not exist."
+    ),
+)
+async def bulk_create_or_update_compiled_statements(
+    compiled_statements_data: Annotated[
+        list[CompiledStatementCreate], Body(max_length=MAX_BULK_COMPILED_STATEMENTS)
+    ],
+    compiled_statement_service: Annotated[
+        CompiledStatementService, Depends(get_compiled_statement_service)
+    ],
+) -> Response:
+    """Create or update many compiled statements.
+
+    Args:
+        compiled_statements_data: Compiled statements to store.
+        compiled_statement_service: Compiled statement service (injected).
+
+    Returns:
+        Stored compiled statements.
+    """
+    compiled_statements = await compiled_statement_service.bulk_upsert_compiled_statements(
+        compiled_statements_data
+    )
+    return Response(
+        content=_RESPONSE_LIST_ADAPTER.dump_json(compiled_statements),
+        status_code=status.HTTP_201_CREATED,
+        media_type="application/json",
+    )
+
+
+@router.post(
+    "/batch-get",
+    response_model=list[CompiledStatementResponse],
+    summary="Get compiled statements by IDs",
+    description=(
+        "Get several compiled statements by ID in one request. "
+        "Unknown IDs are omitted from the result."
+    ),
+)
+async def batch_get_compiled_statements(
+    batch: CompiledStatementBatchGet,
+    compiled_statement_service: Annotated[
+        CompiledStatementService, Depends(get_compiled_statement_service)
+    ],
+) -> Response:
+    """Get several compiled statements by ID.
+
+    Args:
+        batch: Compiled statement IDs to fetch.
+        compiled_statement_service: Compiled statement service (injected).
+
+    Returns:
+        Found compiled statements, in the order the IDs were given.
+    """
+    compiled_statements = await compiled_statement_service.get_compiled_statements_by_ids(batch.ids)
+    return Response(
+        content=_RESPONSE_LIST_ADAPTER.dump_json(compiled_statements),
+        media_type="application/json",
+    )
 
 
 @router.get(
@@ -60,7 +160,7 @@ async def get_compiled_statement(
     compiled_statement_service: Annotated[
         CompiledStatementService, Depends(get_compiled_statement_service)
     ],
-) -> CompiledStatementResponse:
+) -> Response:
     """Get a compiled statement by ID.
 
     Args:
@@ -73,7 +173,7 @@ async def get_compiled_statement(
     compiled_statement = await compiled_statement_service.get_compiled_statement(
         compiled_statement_id
     )
-    return compiled_statement
+    return _compiled_statement_json_response(compiled_statement)
 
 
 @router.get(
@@ -87,20 +187,53 @@ async def list_compiled_statements_by_company(
     compiled_statement_service: Annotated[
         CompiledStatementService, Depends(get_compiled_statement_service)
     ],
-) -> list[CompiledStatementResponse]:
+) -> Response:
     """List all compiled statements for a company.
 
+    The stored statement data is forwarded as-is, so the response is returned
+    pre-serialized rather than validated against ``CompiledStatementResponse``.
+
     Args:
         company_id: Company ID.
         compiled_statement_service: Compiled statement service (injected).
 
     Returns:
-        List of compiled statements.
+        JSON response with the list of compiled statements.
     """
-    compiled_statements = await compiled_statement_service.get_compiled_statements_by_company(
+    content = await compiled_statement_service.get_compiled_statements_by_company_json(company_id)
+    return Response(content=content, media_type="application/json")
+
+
+@router.get(
+    "/companies/{company_id}/summaries",
+    response_model=list[CompiledStatementSummary],
+    summary="List compiled statement summaries for a company",
+    description=(
+        "Get the ID, statement type and last update time of every compiled statement "
+        "for a company, without the statement data."
+    ),
+)
+async def list_compiled_statement_summaries_by_company(
+    company_id: Annotated[int, Path(description="Company ID")],
+    compiled_statement_service: Annotated[
+        CompiledStatementService, Depends(get_compiled_statement_service)
+    ],
+) -> Response:
+    """List compiled statement metadata for a company.
+
+    Args:
+        company_id: Company ID.
+        compiled_statement_service: Compiled statement service (injected).
+
+    Returns:
+        JSON response with the list of compiled statement summaries.
+    """
+    summaries = await compiled_statement_service.get_compiled_statement_summaries_by_company(
         company_id
     )
-    return compiled_statements
+    return Response(
+        content=_SUMMARY_LIST_ADAPTER.dump_json(summaries), media_type="application/json"
+    )
 
 
 @router.get(
@@ -115,23 +248,24 @@ async def get_compiled_statement_by_company_and_type(
     compiled_statement_service: Annotated[
         CompiledStatementService, Depends(get_compiled_statement_service)
     ],
-) -> CompiledStatementResponse:
+) -> Response:
     """Get a compiled statement by company and statement type.
 
+    Cached statements are forwarded as stored, so the response is returned
+    pre-serialized rather than validated against ``CompiledStatementResponse``.
+
     Args:
         company_id: Company ID.
         statement_type: Statement type.
         compiled_statement_service: Compiled statement service (injected).
 
     Returns:
-        Compiled statement data.
+        JSON response with the compiled statement.
     """
-    compiled_statement = (
-        await compiled_statement_service.get_compiled_statement_by_company_and_type(
-            company_id, statement_type
-        )
+    content = await compiled_statement_service.get_compiled_statement_by_company_and_type_json(
+        company_id, statement_type
     )
-    return compiled_statement
+    return Response(content=content, media_type="application/json")
 
 
 @router.put(
@@ -146,7 +280,7 @@ async def update_compiled_statement(
     compiled_statement_service: Annotated[
         CompiledStatementService, Depends(get_compiled_statement_service)
     ],
-) -> CompiledStatementResponse:
+) -> Response:
     """Update a compiled statement.
 
     Args:
@@ -160,7 +294,7 @@ async def update_compiled_statement(
     compiled_statement = await compiled_statement_service.update_compiled_statement(
         compiled_statement_id, compiled_statement_data
     )
-    return compiled_statement
+    return _compiled_statement_json_response(compiled_statement)
 
 
 @router.delete(
@@ -12,12 +12,34 @@ from fastapi import APIRouter, Depends, HTTPException, Path, Query, status
 from fastapi.responses import JSONResponse, Response
 
 from app.core.storage import IStorageService
-from app.schemas.document import DocumentCreate, DocumentResponse, DocumentUpdate
+from app.schemas.document import (
+    DocumentBatchGetByCompany,
+    DocumentCreate,
+    DocumentResponse,
+    DocumentUpdate,
+)
 from app.services.dependencies import get_document_service, get_storage_service
 from app.services.document import DocumentService
 
 router = APIRouter(prefix="/documents", tags=["Documents"])
 
+# Carries the cursor of the next page of a listing; absent on the last page
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def _page_response(content: bytes, next_cursor: str | None) -> Response:
+    """Build a listing response, adding the next page's cursor when there is one.
+
+    Args:
+        content: Serialized JSON array of documents.
+        next_cursor: Cursor token of the next page, or None on the last page.
+
+    Returns:
+        JSON response with the listing.
+    """
+    headers = {NEXT_CURSOR_HEADER: next_cursor} if next_cursor is not None else None
+    return Response(content=content, media_type="application/json", headers=headers)
+
 
 @router.post(
     "",
@@ -66,11 +88,41 @@ async def get_document(
     return document
 
 
+@router.post(
+    "/companies/batch-get",
+    response_model=dict[int, list[DocumentResponse]],
+    summary="Get documents for several companies",
+    description=(
+        "Get the documents of several companies in one request, keyed by company ID. "
+        "Fails with 404 if any company does not exist."
+    ),
+)
+async def batch_get_documents_by_company(
+    batch: DocumentBatchGetByCompany,
+    document_service: Annotated[DocumentService, Depends(get_document_service)],
+) -> Response:
+    """Get the documents of several companies.
+
+    Args:
+        batch: Company IDs whose documents to fetch.
+        document_service: Document service (injected).
+
+    Returns:
+        JSON response mapping each company ID to its documents.
+    """
+    content = await document_service.get_documents_for_companies_json(batch.company_ids)
+    return Response(content=content, media_type="application/json")
+
+
 @router.get(
     "/companies/{company_id}",
     response_model=list[DocumentResponse],
     summary="List documents for a company",
-    description="Get a paginated list of all documents for a specific company.",
+    description=(
+        "Get a paginated list of all documents for a specific company. When more "
+        f"documents may follow, the {NEXT_CURSOR_HEADER} response header holds the "
+        "cursor to pass as `after` for the next page."
+    ),
 )
 async def list_documents_by_company(
     company_id: Annotated[int, Path(description="Company ID")],
@@ -79,22 +131,26 @@ async def list_documents_by_company(
     limit: Annotated[
         int, Query(ge=1, le=100, description="Maximum number of records to return")
     ] = 100,
-) -> list[DocumentResponse]:
+    after: Annotated[
+        str | None, Query(description="Cursor of the previous page; replaces skip")
+    ] = None,
+) -> Response:
     """List all documents for a company with pagination.
 
     Args:
         company_id: Company ID.
         skip: Number of records to skip.
         limit: Maximum number of records to return.
+        after: Cursor from the previous page's next-cursor header.
         document_service: Document service (injected).
 
     Returns:
         List of documents.
     """
-    documents = await document_service.get_documents_by_company(
-        company_id=company_id, skip=skip, limit=limit
+    content, next_cursor = await document_service.get_documents_by_company_json(
+        company_id=company_id, skip=skip, limit=limit, after=after
     )
-    return documents
+    return _page_response(content, next_cursor)
 
 
 @router.get(
@@ -107,7 +163,7 @@ async def get_documents_by_company_and_year(
     company_id: Annotated[int, Path(description="Company ID")],
     fiscal_year: Annotated[int, Path(description="Fiscal year", ge=1900, le=2100)],
     document_service: Annotated[DocumentService, Depends(get_document_service)],
-) -> list[DocumentResponse]:
+) -> Response:
     """Get documents for a company by fiscal year.
 
     Args:
@@ -118,17 +174,21 @@ async def get_documents_by_company_and_year(
     Returns:
         List of documents.
     """
-    documents = await document_service.get_documents_by_company_and_year(
+    content = await document_service.get_documents_by_company_and_year_json(
         company_id=company_id, fiscal_year=fiscal_year
     )
-    return documents
+    return Response(content=content, media_type="application/json")
 
 
 @router.get(
     "/companies/{company_id}/type/{document_type}",
     response_model=list[DocumentResponse],
     summary="Get documents by company and type",
-    description="Get all documents for a company by document type.",
+    description=(
+        "Get all documents for a company by document type. When more documents may "
+        f"follow, the {NEXT_CURSOR_HEADER} response header holds the cursor to pass "
+        "as `after` for the next page."
+    ),
 )
 async def get_documents_by_company_and_type(
     company_id: Annotated[int, Path(description="Company ID")],
@@ -138,7 +198,10 @@ async def get_documents_by_company_and_type(
     limit: Annotated[
         int, Query(ge=1, le=100, description="Maximum number of records to return")
     ] = 100,
-) -> list[DocumentResponse]:
+    after: Annotated[
+        str | None, Query(description="Cursor of the previous page; replaces skip")
+    ] = None,
+) -> Response:
     """Get documents for a company by document type.
 
     Args:
@@ -146,18 +209,20 @@ async def get_documents_by_company_and_type(
         document_type: Document type.
         skip: Number of records to skip.
         limit: Maximum number of records to return.
+        after: Cursor from the previous page's next-cursor header.
         document_service: Document service (injected).
 
     Returns:
         List of documents.
     """
-    documents = await document_service.get_documents_by_company_and_type(
+    content, next_cursor = await document_service.get_documents_by_company_and_type_json(
         company_id=company_id,
         document_type=document_type,
         skip=skip,
         limit=limit,
+        after=after,
     )
-    return documents
+    return _page_response(content, next_cursor)
 
 
 @router.put(
@@ -276,39 +341,33 @@ async def download_storage_pdf(
     Raises:
         HTTPException: If file not found or retrieval fails.
     """
-    try:
-        # URL decode the object key in case it was encoded
-        decoded_object_key = unquote(object_key)
-
-        # Check if file exists
-        if not await storage_service.file_exists(decoded_object_key):
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"PDF file not found: {decoded_object_key}",
-            )
+    # URL decode the object key in case it was encoded
+    decoded_object_key = unquote(object_key)
 
-        # Get file content
+    # Both storage backends raise FileNotFoundError for a missing object, so the
+    # read itself is the existence check
+    try:
         file_content = await storage_service.get_file(decoded_object_key)
-
-        # Extract filename from object key
-        filename = decoded_object_key.split("/")[-1] or "document.pdf"
-
-        # Return PDF file with proper headers
-        return Response(
-            content=file_content,
-            media_type="application/pdf",
-            headers={
-                "Content-Disposition": f'inline; filename="{filename}"',
-                "Content-Length": str(len(file_content)),
-            },
-        )
     except FileNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e),
+            detail=f"PDF file not found: {decoded_object_key}",
         ) from e
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to retrieve PDF file: {str(e)}",
+            detail=f"Failed to retrieve PDF file: {e}",
         ) from e
+
+    # Extract filename from object key
+    filename = decoded_object_key.split("/")[-1] or "document.pdf"
+
+    # Return PDF file with proper headers
+    return Response(
+        content=file_content,
+        media_type="application/pdf",
+        headers={
+            "Content-Disposition": f'inline; filename="{filename}"',
+            "Content-Length": str(len(file_content)),
+        },
+    )
@@ -8,14 +8,23 @@ Copyright: 2025 Patryk Golabek
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, Path, status
-from fastapi.responses import JSONResponse
-
-from app.schemas.extraction import ExtractionCreate, ExtractionResponse, ExtractionUpdate
+from fastapi.responses import JSONResponse, Response
+from pydantic import TypeAdapter
+
+from app.schemas.extraction import (
+    ExtractionBatchGetByDocument,
+    ExtractionCreate,
+    ExtractionResponse,
+    ExtractionSummary,
+    ExtractionUpdate,
+)
 from app.services.dependencies import get_extraction_service
 from app.services.extraction import ExtractionService
 
 router = APIRouter(prefix="/extractions", tags=["Extractions"])
 
+_SUMMARY_LIST_ADAPTER = TypeAdapter(list[ExtractionSummary])
+
 
 @router.post(
     "",
@@ -64,6 +73,32 @@ async def get_extraction(
     return extraction
 
 
+@router.post(
+    "/documents/batch-get",
+    response_model=dict[int, list[ExtractionResponse]],
+    summary="Get extractions for several documents",
+    description=(
+        "Get the extractions of several documents in one request, keyed by document ID. "
+        "Fails with 404 if any document does not exist."
+    ),
+)
+async def batch_get_extractions_by_document(
+    batch: ExtractionBatchGetByDocument,
+    extraction_service: Annotated[ExtractionService, Depends(get_extraction_service)],
+) -> Response:
+    """Get the extractions of several documents.
+
+    Args:
+        batch: Document IDs whose extractions to fetch.
+        extraction_service: Extraction service (injected).
+
+    Returns:
+        JSON response mapping each document ID to its extractions.
+    """
+    content = await extraction_service.get_extractions_for_documents_json(batch.document_ids)
+    return Response(content=content, media_type="application/json")
+
+
 @router.get(
     "/documents/{document_id}",
     response_model=list[ExtractionResponse],
@@ -73,18 +108,49 @@ async def get_extraction(
 async def list_extractions_by_document(
     document_id: Annotated[int, Path(description="Document ID")],
     extraction_service: Annotated[ExtractionService, Depends(get_extraction_service)],
-) -> list[ExtractionResponse]:
+) -> Response:
     """List all extractions for a document.
 
+    The stored extraction data is forwarded as-is, so the response is returned
+    pre-serialized rather than validated against ``ExtractionResponse``.
+
     Args:
         document_id: Document ID.
         extraction_service: Extraction service (injected).
 
     Returns:
-        List of extractions.
+        JSON response with the list of extractions.
     """
-    extractions = await extraction_service.get_extractions_by_document(document_id)
-    return extractions
+    content = await extraction_service.get_extractions_by_document_json(document_id)
+    return Response(content=content, media_type="application/json")
+
+
+@router.get(
+    "/documents/{document_id}/summaries",
+    response_model=list[ExtractionSummary],
+    summary="List extraction summaries for a document",
+    description=(
+        "Get the ID, statement type and creation time of every extraction "
+        "for a document, without the raw extraction data."
+    ),
+)
+async def list_extraction_summaries_by_document(
+    document_id: Annotated[int, Path(description="Document ID")],
+    extraction_service: Annotated[ExtractionService, Depends(get_extraction_service)],
+) -> Response:
+    """List extraction metadata for a document.
+
+    Args:
+        document_id: Document ID.
+        extraction_service: Extraction service (injected).
+
+    Returns:
+        JSON response with the list of extraction summaries.
+    """
+    summaries = await extraction_service.get_extraction_summaries_by_document(document_id)
+    return Response(
+        content=_SUMMARY_LIST_ADAPTER.dump_json(summaries), media_type="application/json"
+    )
 
 
 @router.get(
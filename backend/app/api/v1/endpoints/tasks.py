@@ -5,8 +5,9 @@ Author: Patryk Golabek
 Copyright: 2025 Patryk Golabek
 """
 
-from typing import Annotated
+from typing import Annotated, Any
 
+from celery import Task
 from fastapi import APIRouter, HTTPException, Path, status
 from pydantic import BaseModel, Field
 
@@ -38,6 +39,34 @@ class TaskStatusResponse(BaseModel):
     error: str | None = Field(None, description="Error message if failed")
 
 
+def _enqueue(task: Task, *args: Any, message: str, failure: str) -> TaskResponse:
+    """Queue a Celery task and describe it as pending.
+
+    Sending to the broker is the only step of a trigger route that can fail, so
+    its translation to a 500 lives here rather than in every route body.
+
+    Args:
+        task: Celery task to queue.
+        *args: Positional arguments for the task.
+        message: Human-readable message for the response.
+        failure: Start of the error detail if the task cannot be queued.
+
+    Returns:
+        Task response with the queued task's ID and ``PENDING`` status.
+
+    Raises:
+        HTTPException: If the task cannot be queued.
+    """
+    try:
+        result = task.delay(*args)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"{failure}: {e}",
+        ) from e
+    return TaskResponse(task_id=result.id, status="PENDING", message=message)
+
+
 @router.post(
     "/companies/{company_id}/extract",
     response_model=TaskResponse,
@@ -64,18 +93,12 @@ async def trigger_extract_company_financial_data(
     Returns:
         Task response with task ID and status.
     """
-    try:
-        task = extract_company_financial_data.delay(company_id)
-        return TaskResponse(
-            task_id=task.id,
-            status="PENDING",
-            message=f"Financial data extraction started for company {company_id}",
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to trigger extraction task: {str(e)}",
-        ) from e
+    return _enqueue(
+        extract_company_financial_data,
+        company_id,
+        message=f"Financial data extraction started for company {company_id}",
+        failure="Failed to trigger extraction task",
+    )
 
 
 @router.post(
@@ -96,18 +119,12 @@ async def trigger_scrape_investor_relations(
     Returns:
         Task response with task ID and status.
     """
-    try:
-        task = scrape_investor_relations.delay(company_id)
-        return TaskResponse(
-            task_id=task.id,
-            status="PENDING",
-            message=f"Scraping started for company {company_id}",
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to trigger scraping task: {str(e)}",
-        ) from e
+    return _enqueue(
+        scrape_investor_relations,
+        company_id,
+        message=f"Scraping started for company {company_id}",
+        failure="Failed to trigger scraping task",
+    )
 
 
 @router.post(
@@ -128,18 +145,12 @@ async def trigger_download_pdf(
     Returns:
         Task response with task ID and status.
     """
-    try:
-        task = download_pdf.delay(document_id)
-        return TaskResponse(
-            task_id=task.id,
-            status="PENDING",
-            message=f"PDF download started for document {document_id}",
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to trigger download task: {str(e)}",
-        ) from e
+    return _enqueue(
+        download_pdf,
+        document_id,
+        message=f"PDF download started for document {document_id}",
+        failure="Failed to trigger download task",
+    )
 
 
 @router.post(
@@ -160,18 +171,12 @@ async def trigger_classify_document(
     Returns:
         Task response with task ID and status.
     """
-    try:
-        task = classify_document.delay(document_id)
-        return TaskResponse(
-            task_id=task.id,
-            status="PENDING",
-            message=f"Classification started for document {document_id}",
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to trigger classification task: {str(e)}",
-        ) from e
+    return _enqueue(
+        classify_document,
+        document_id,
+        message=f"Classification started for document {document_id}",
+        failure="Failed to trigger classification task",
+    )
 
 
 @router.post(
@@ -192,18 +197,12 @@ async def trigger_extract_financial_statements(
     Returns:
         Task response with task ID and status.
     """
-    try:
-        task = extract_financial_statements.delay(document_id)
-        return TaskResponse(
-            task_id=task.id,
-            status="PENDING",
-            message=f"Financial statement extraction started for document {document_id}",
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to trigger extraction task: {str(e)}",
-        ) from e
+    return _enqueue(
+        extract_financial_statements,
+        document_id,
+        message=f"Financial statement extraction started for document {document_id}",
+        failure="Failed to trigger extraction task",
+    )
 
 
 @router.post(
@@ -224,18 +223,12 @@ async def trigger_process_document(
     Returns:
         Task response with task ID and status.
     """
-    try:
-        task = process_document.delay(document_id)
-        return TaskResponse(
-            task_id=task.id,
-            status="PENDING",
-            message=f"Document processing started for document {document_id}",
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to trigger processing task: {str(e)}",
-        ) from e
+    return _enqueue(
+        process_document,
+        document_id,
+        message=f"Document processing started for document {document_id}",
+        failure="Failed to trigger processing task",
+    )
 
 
 @router.post(
@@ -256,18 +249,12 @@ async def trigger_process_all_documents(
     Returns:
         Task response with task ID and status.
     """
-    try:
-        task = process_all_documents.delay(company_id)
-        return TaskResponse(
-            task_id=task.id,
-            status="PENDING",
-            message=f"Batch document processing started for company {company_id}",
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to trigger batch processing task: {str(e)}",
-        ) from e
+    return _enqueue(
+        process_all_documents,
+        company_id,
+        message=f"Batch document processing started for company {company_id}",
+        failure="Failed to trigger batch processing task",
+    )
 
 
 @router.post(
@@ -288,18 +275,12 @@ async def trigger_recompile_company_statements(
     Returns:
         Task response with task ID and status.
     """
-    try:
-        task = recompile_company_statements.delay(company_id)
-        return TaskResponse(
-            task_id=task.id,
-            status="PENDING",
-            message=f"Statement recompilation started for company {company_id}",
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to trigger recompilation task: {str(e)}",
-        ) from e
+    return _enqueue(
+        recompile_company_statements,
+        company_id,
+        message=f"Statement recompilation started for company {company_id}",
+        failure="Failed to trigger recompilation task",
+    )
 
 
 @router.get(
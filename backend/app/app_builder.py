@@ -18,7 +18,7 @@ from fastapi import FastAPI, Request
 from fastapi import __version__ as fastapi_version
 from fastapi.encoders import jsonable_encoder
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, JSONResponse, ORJSONResponse
 from prometheus_client import Info
 from starlette_exporter import PrometheusMiddleware, handle_metrics
 from starlette_exporter.optional_metrics import request_body_size, response_body_size
@@ -57,7 +57,11 @@ class FastAPIAppBuilder:
         # Some libs require env vars
         self._set_environment_variables()
 
-        self.fast_api = FastAPI(lifespan=LifespanManager(self.settings, self.logger).lifespan)
+        # Serialize API responses with orjson instead of the stdlib json module
+        self.fast_api = FastAPI(
+            lifespan=LifespanManager(self.settings, self.logger).lifespan,
+            default_response_class=ORJSONResponse,
+        )
 
     def _set_environment_variables(self) -> None:
         """Set the required environment variables for external dependencies
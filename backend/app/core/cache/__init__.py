@@ -0,0 +1,16 @@
+"""
+Redis-backed caches for hot read paths.
+
+Author: Patryk Golabek
+Copyright: 2025 Patryk Golabek
+"""
+
+from app.core.cache.compiled_statement_cache import (
+    CompiledStatementCache,
+    create_compiled_statement_cache,
+)
+
+__all__ = [
+    "CompiledStatementCache",
+    "create_compiled_statement_cache",
+]
@@ -0,0 +1,140 @@
+"""
+Redis cache of serialized compiled statements.
+
+Author: Patryk Golabek
+Copyright: 2025 Patryk Golabek
+"""
+
+import logging
+from typing import TYPE_CHECKING, cast
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+if TYPE_CHECKING:
+    from config import Settings
+
+logger = logging.getLogger(__name__)
+
+# Keep Redis stalls short, so an unreachable cache degrades to database reads
+_SOCKET_TIMEOUT = 0.5
+
+
+class CompiledStatementCache:
+    """Cache of serialized compiled statements keyed by company and statement type.
+
+    Entries live in Redis, so every API process and Celery worker shares them
+    and a single DEL invalidates a statement everywhere. Each entry also expires
+    after ``ttl`` seconds as a safety net for missed invalidations. Redis errors
+    are logged and treated as cache misses; the cache never fails a request.
+
+    Args:
+        client: Async Redis client.
+        ttl: Lifetime of an entry in seconds.
+    """
+
+    def __init__(self, client: Redis, ttl: int):
+        self.client = client
+        self.ttl = ttl
+
+    @staticmethod
+    def key(company_id: int, statement_type: str) -> str:
+        """Get the Redis key of a compiled statement.
+
+        Args:
+            company_id: Company ID.
+            statement_type: Type of financial statement.
+
+        Returns:
+            Redis key.
+        """
+        return f"cs:{company_id}:{statement_type}"
+
+    async def get(self, company_id: int, statement_type: str) -> bytes | None:
+        """Get a cached compiled statement.
+
+        Args:
+            company_id: Company ID.
+            statement_type: Type of financial statement.
+
+        Returns:
+            Serialized compiled statement, or None on a miss or Redis error.
+        """
+        try:
+            # The client does not decode responses, so values come back as bytes
+            return cast(bytes | None, await self.client.get(self.key(company_id, statement_type)))
+        except RedisError as e:
+            logger.warning("Compiled statement cache read failed: %r", e)
+            return None
+
+    async def set(self, company_id: int, statement_type: str, payload: bytes | str) -> None:
+        """Cache a serialized compiled statement.
+
+        Args:
+            company_id: Company ID.
+            statement_type: Type of financial statement.
+            payload: Serialized compiled statement.
+        """
+        try:
+            await self.client.set(self.key(company_id, statement_type), payload, ex=self.ttl)
+        except RedisError as e:
+            logger.warning("Compiled statement cache write failed: %r", e)
+
+    async def invalidate(self, *keys: tuple[int, str]) -> None:
+        """Drop cached compiled statements with one DEL.
+
+        Args:
+            *keys: (company ID, statement type) pairs to drop.
+        """
+        if not keys:
+            return
+        try:
+            await self.client.delete(*(self.key(*key) for key in keys))
+        except RedisError as e:
+            logger.warning("Compiled statement cache invalidation failed: %r", e)
+
+    async def invalidate_company(self, company_id: int) -> None:
+        """Drop every cached compiled statement of a company.
+
+        Used when the company itself is deleted, cascading to statements of
+        any type. The keys are found with SCAN, which walks the whole keyspace,
+        so this suits rare writes only.
+
+        Args:
+            company_id: Company ID.
+        """
+        try:
+            keys = [key async for key in self.client.scan_iter(match=self.key(company_id, "*"))]
+            if keys:
+                await self.client.delete(*keys)
+        except RedisError as e:
+            logger.warning("Compiled statement cache invalidation failed: %r", e)
+
+    async def aclose(self) -> None:
+        """Close the Redis connection pool."""
+        await self.client.aclose()
+
+
+def create_compiled_statement_cache(settings: "Settings") -> CompiledStatementCache | None:
+    """Create a compiled statement cache from application settings.
+
+    Creating the client does not connect; connections are opened on first use.
+
+    Args:
+        settings: Application settings.
+
+    Returns:
+        CompiledStatementCache instance, or None if the cache is disabled.
+    """
+    if not settings.compiled_statement_cache_enabled:
+        return None
+    client = Redis(
+        host=settings.redis_host,
+        port=settings.redis_port,
+        db=settings.redis_db,
+        password=settings.redis_password or None,
+        max_connections=settings.redis_max_connections,
+        socket_timeout=_SOCKET_TIMEOUT,
+        socket_connect_timeout=_SOCKET_TIMEOUT,
+    )
+    return CompiledStatementCache(client, ttl=settings.compiled_statement_cache_ttl)
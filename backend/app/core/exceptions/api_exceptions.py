@@ -28,6 +28,7 @@ class ErrorType(Enum):
     NOT_FOUND = "https://httpstatuses.com/404"
     UNSUPPORTED_MEDIA_TYPE = "https://httpstatuses.com/415"
     FORBIDDEN = "https://httpstatuses.com/403"
+    CONFLICT = "https://httpstatuses.com/409"
 
 
 class ApiError(HTTPException):
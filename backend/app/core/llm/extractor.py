@@ -8,10 +8,11 @@ Author: Patryk Golabek
 Copyright: 2025 Patryk Golabek
 """
 
-import json
 import logging
 from typing import Any
 
+import orjson
+
 from app.core.llm.client import OpenRouterClient
 from app.core.llm.models import ExtractionMetadata, FinancialLineItem, FinancialStatementExtraction
 from app.core.llm.prompts import SYSTEM_PROMPT, get_prompt_for_statement_type
@@ -109,8 +110,8 @@ class FinancialStatementExtractor:
                 raise ValueError("Empty response from LLM")
 
             try:
-                response_data = json.loads(content)
-            except json.JSONDecodeError as e:
+                response_data = orjson.loads(content)
+            except orjson.JSONDecodeError as e:
                 logger.error(f"Failed to parse LLM response as JSON: {e}")
                 logger.debug(f"Response content (first 1000 chars): {content[:1000]}")
                 raise ValueError(f"Invalid JSON response from LLM: {e}") from e
@@ -128,7 +129,7 @@ class FinancialStatementExtractor:
                     f"line_items value: {line_items_raw}"
                 )
                 # Log full response structure for debugging (truncated to avoid huge logs)
-                response_str = json.dumps(response_data, indent=2)
+                response_str = orjson.dumps(response_data, option=orjson.OPT_INDENT_2).decode()
                 if len(response_str) > 3000:
                     logger.debug(f"Full LLM response (truncated):\n{response_str[:3000]}...")
                 else:
@@ -220,7 +221,7 @@ class FinancialStatementExtractor:
             logger.error(f"line_items value: {raw_line_items} (type: {type(raw_line_items)})")
 
             # Log full response for debugging (truncated to avoid huge logs)
-            response_str = json.dumps(response_data, indent=2)
+            response_str = orjson.dumps(response_data, option=orjson.OPT_INDENT_2).decode()
             if len(response_str) > 5000:
                 logger.error(f"Full LLM response (truncated):\n{response_str[:5000]}...")
             else:
@@ -22,6 +22,8 @@ from crawl4ai import AsyncWebCrawler, BrowserConfig, CacheMode, CrawlerRunConfig
 from crawl4ai.extraction_strategy import LLMExtractionStrategy
 from pydantic import BaseModel, Field
 
+from config import get_settings
+
 logger = logging.getLogger(__name__)
 
 
@@ -90,9 +92,7 @@ class ScrapingService:
 
         # Get model from config if not provided
         if openrouter_model is None:
-            from config import Settings
-
-            settings = Settings()
+            settings = get_settings()
             openrouter_model = settings.open_router_model_scraping
 
         self.openrouter_model = openrouter_model
@@ -14,11 +14,15 @@ import logging
 from abc import ABC, abstractmethod
 from datetime import datetime
 from pathlib import Path
+from typing import TYPE_CHECKING, Self
 
 from minio import Minio
 from minio.error import S3Error
 from pydantic import BaseModel, Field
 
+if TYPE_CHECKING:
+    from config import Settings
+
 logger = logging.getLogger(__name__)
 
 
@@ -36,6 +40,26 @@ class StorageServiceConfig(BaseModel):
         description="Base path for legacy local storage",
     )
 
+    @classmethod
+    def from_settings(cls, settings: "Settings") -> Self:
+        """Build the storage configuration from application settings.
+
+        Args:
+            settings: Application settings.
+
+        Returns:
+            StorageServiceConfig instance.
+        """
+        return cls(
+            enabled=settings.minio_enabled,
+            endpoint=settings.minio_endpoint,
+            access_key=settings.minio_access_key,
+            secret_key=settings.minio_secret_key,
+            bucket_name=settings.minio_bucket_name,
+            use_ssl=settings.minio_use_ssl,
+            base_storage_path=Path(settings.pdf_storage_base_path),
+        )
+
 
 class IStorageService(ABC):
     """Abstract interface for storage service."""
@@ -15,6 +15,7 @@ from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.base import AsyncSessionLocal
+from app.db.hooks import commit, discard_after_commit
 from app.db.repositories import (
     CompanyRepository,
     CompiledStatementRepository,
@@ -27,6 +28,11 @@ async def get_db_session() -> AsyncGenerator[AsyncSession]:
     """Dependency function to get an async database session.
 
     Creates a new session per request and ensures it's closed after the request completes.
+    FastAPI resolves this dependency once per request, so every repository in the
+    request shares the session and all of its reads and writes run in one
+    transaction that is committed once. Hooks registered with
+    ``app.db.hooks.after_commit`` run after that commit, and are dropped if
+    the transaction rolls back.
 
     Yields:
         AsyncSession: Async database session.
@@ -37,8 +43,9 @@ async def get_db_session() -> AsyncGenerator[AsyncSession]:
     async with AsyncSessionLocal() as session:
         try:
             yield session
-            await session.commit()
+            await commit(session)
         except Exception:
+            discard_after_commit(session)
             await session.rollback()
             raise
 
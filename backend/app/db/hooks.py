@@ -0,0 +1,62 @@
+"""
+Hooks run once a session's transaction has committed.
+
+Caches of database rows may only drop an entry once the write it reflects is
+visible to other sessions. Dropping it earlier lets a concurrent read refill
+the cache with the old row until the entry expires. Services register their
+invalidation on the session, and the code owning the transaction runs it
+after committing.
+
+Author: Patryk Golabek
+Copyright: 2025 Patryk Golabek
+"""
+
+import logging
+from collections.abc import Awaitable, Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+type AfterCommitHook = Callable[[], Awaitable[None]]
+
+# Key of the pending hooks in Session.info
+_AFTER_COMMIT_KEY = "after_commit_hooks"
+
+
+def after_commit(session: AsyncSession, hook: AfterCommitHook) -> None:
+    """Register a hook to run once the session's transaction commits.
+
+    Hooks are dropped without running if the transaction rolls back.
+
+    Args:
+        session: Session whose transaction the hook waits for.
+        hook: Coroutine function to call after the commit.
+    """
+    session.info.setdefault(_AFTER_COMMIT_KEY, []).append(hook)
+
+
+def discard_after_commit(session: AsyncSession) -> None:
+    """Drop the session's pending hooks without running them.
+
+    Args:
+        session: Session whose transaction was rolled back.
+    """
+    session.info.pop(_AFTER_COMMIT_KEY, None)
+
+
+async def commit(session: AsyncSession) -> None:
+    """Commit the session, then run the hooks registered on it.
+
+    The data is already committed when the hooks run, so a failing hook is
+    logged rather than raised.
+
+    Args:
+        session: Session to commit.
+    """
+    await session.commit()
+    for hook in session.info.pop(_AFTER_COMMIT_KEY, ()):
+        try:
+            await hook()
+        except Exception:
+            logger.exception("After-commit hook failed")
@@ -8,8 +8,8 @@ Copyright: 2025 Patryk Golabek
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, Integer, String, Text, func
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import Computed, DateTime, Integer, String, Text, func
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -23,6 +23,7 @@ class Company(Base):
     """Company model representing a tracked company."""
 
     __tablename__ = "companies"
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     name: Mapped[str] = mapped_column(String, nullable=False)
@@ -30,6 +31,10 @@ class Company(Base):
     tickers: Mapped[list[dict[str, str]] | None] = mapped_column(
         JSONB(astext_type=Text()), nullable=True
     )
+    # Read-only projection of tickers[*].ticker maintained by PostgreSQL (migration 003)
+    tickers_texts: Mapped[list[str] | None] = mapped_column(
+        ARRAY(Text), Computed("company_ticker_symbols(tickers)", persisted=True), nullable=True
+    )
     ir_url: Mapped[str] = mapped_column(String, nullable=False)
     created_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=True
@@ -22,6 +22,7 @@ class Document(Base):
     """Document model representing a PDF document or annual report."""
 
     __tablename__ = "documents"
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     company_id: Mapped[int] = mapped_column(
@@ -31,8 +32,9 @@ class Document(Base):
     fiscal_year: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
     document_type: Mapped[str] = mapped_column(String(length=50), nullable=False)
     file_path: Mapped[str | None] = mapped_column(String, nullable=True)
-    created_at: Mapped[datetime | None] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), nullable=True
+    # NOT NULL since migration 005, as it keys the listing cursor
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
     )
 
     # Relationships
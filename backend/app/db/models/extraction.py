@@ -20,9 +20,15 @@ if TYPE_CHECKING:
 
 
 class Extraction(Base):
-    """Extraction model for storing raw LLM extraction data."""
+    """Extraction model for storing raw LLM extraction data.
+
+    ``raw_data`` is deliberately left without a GIN index: it is only ever read
+    whole (by document and statement type), never filtered by JSONB path, so
+    an index would cost storage on large LLM payloads without serving a query.
+    """
 
     __tablename__ = "extractions"
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     document_id: Mapped[int] = mapped_column(
@@ -43,9 +49,15 @@ class Extraction(Base):
 
 
 class CompiledStatement(Base):
-    """CompiledStatement model for storing compiled multi-year financial statements."""
+    """CompiledStatement model for storing compiled multi-year financial statements.
+
+    ``data`` carries no JSONB index; lookups go through ``company_id`` and
+    ``statement_type``. Add a path-scoped ``jsonb_path_ops`` index only for a
+    key that a query actually filters on.
+    """
 
     __tablename__ = "compiled_statements"
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     company_id: Mapped[int] = mapped_column(
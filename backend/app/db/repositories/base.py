@@ -5,14 +5,103 @@ Author: Patryk Golabek
 Copyright: 2025 Patryk Golabek
 """
 
-from typing import Any, TypeVar
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Hashable
+from functools import cache
+from typing import Any, TypeVar, cast
 
 from pydantic import BaseModel
+from sqlalchemy import (
+    ARRAY,
+    Date,
+    DateTime,
+    Integer,
+    Select,
+    Table,
+    any_,
+    bindparam,
+    exists,
+    func,
+    select,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.base import AsyncSessionLocal
 
 T = TypeVar("T", bound=BaseModel)
+R = TypeVar("R")
+
+# Seconds a cached lookup stays valid within one repository instance
+LOOKUP_CACHE_TTL = 30.0
+
+
+def select_by_ids(model: type[Any]) -> Select[Any]:
+    """Build a batch lookup of ``model`` rows by primary key.
+
+    The statement binds a single ``ids`` integer array and matches it with
+    ``id = ANY(:ids)``, so the SQL text is identical for any number of IDs.
+    Rows come back in the order of the input array.
+
+    Args:
+        model: Mapped model class with an integer ``id`` primary key.
+
+    Returns:
+        Select statement expecting an ``ids`` parameter.
+    """
+    ids = bindparam("ids", type_=ARRAY(Integer))
+    return select(model).where(model.id == any_(ids)).order_by(func.array_position(ids, model.id))
+
+
+def select_existing_ids(model: type[Any]) -> Select[Any]:
+    """Build a batch existence check for ``model`` rows by primary key.
+
+    The statement binds a single ``ids`` integer array and matches it with
+    ``id = ANY(:ids)``, returning only the IDs that exist, so one query answers
+    for any number of IDs.
+
+    Args:
+        model: Mapped model class with an integer ``id`` primary key.
+
+    Returns:
+        Select statement expecting an ``ids`` parameter.
+    """
+    return select(model.id).where(model.id == any_(bindparam("ids", type_=ARRAY(Integer))))
+
+
+def select_exists_by_id(model: type[Any]) -> Select[Any]:
+    """Build an existence check for a ``model`` row by primary key.
+
+    ``SELECT EXISTS (SELECT 1 ... WHERE id = :id)`` returns a single boolean,
+    so guards do not pull the whole row, JSONB columns included, over the wire.
+
+    Args:
+        model: Mapped model class with an integer ``id`` primary key.
+
+    Returns:
+        Select statement expecting an ``id`` parameter.
+    """
+    return select(exists().where(model.id == bindparam("id", type_=Integer)))
+
+
+@cache
+def _column_layout(table: Table) -> tuple[tuple[str, ...], frozenset[str]]:
+    """Get the column names of a table and the subset holding date/time values.
+
+    Computed once per table so that model-to-dict conversion does not reflect
+    over the table metadata for every row.
+
+    Args:
+        table: SQLAlchemy table backing a model.
+
+    Returns:
+        Tuple of (column names, names of date/datetime columns).
+    """
+    names = tuple(column.name for column in table.columns)
+    temporal = frozenset(
+        column.name for column in table.columns if isinstance(column.type, (Date, DateTime))
+    )
+    return names, temporal
 
 
 class BaseRepository:
@@ -26,6 +115,8 @@ class BaseRepository:
         """
         self._session = session
         self._session_owned = session is None
+        self._inflight: dict[Hashable, asyncio.Task[Any]] = {}
+        self._lookup_cache: dict[Hashable, tuple[float, Any]] = {}
 
     @property
     def session(self) -> AsyncSession:
@@ -40,6 +131,59 @@ class BaseRepository:
             await self._session.close()
             self._session = None
 
+    async def _coalesce(self, key: Hashable, loader: Callable[[], Awaitable[R]]) -> R:
+        """Share one in-flight read between concurrent callers asking for the same key.
+
+        The first caller runs ``loader``; callers arriving before it completes
+        await the same task instead of issuing another round trip. Nothing is
+        kept once the read finishes, so results are never served stale.
+
+        Args:
+            key: Identity of the read, e.g. ``("company", 42)``.
+            loader: Zero-argument coroutine function performing the read.
+
+        Returns:
+            Result of the shared read.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(loader())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shield so one cancelled caller does not cancel the read for the others
+        return await asyncio.shield(task)
+
+    async def _cached(self, key: Hashable, loader: Callable[[], Awaitable[R | None]]) -> R | None:
+        """Serve a repeated lookup from this repository's short-lived cache.
+
+        The cache lives only as long as the repository instance, i.e. one
+        session, so it never hands ORM objects to another session. Entries
+        expire after ``LOOKUP_CACHE_TTL`` seconds and are dropped by
+        ``_invalidate_cache`` whenever this repository writes. Writes through
+        other repositories, including rows removed by ON DELETE CASCADE, do
+        not invalidate it. Misses are not cached, so a row created meanwhile
+        is found by the next lookup.
+
+        Args:
+            key: Identity of the lookup, e.g. ``("company_and_type", 1, "balance_sheet")``.
+            loader: Zero-argument coroutine function performing the lookup.
+
+        Returns:
+            Cached or freshly loaded result, or None if the row does not exist.
+        """
+        entry = self._lookup_cache.get(key)
+        now = time.monotonic()
+        if entry is not None and entry[0] > now:
+            return cast(R, entry[1])
+        value = await self._coalesce(key, loader)
+        if value is not None:
+            self._lookup_cache[key] = (now + LOOKUP_CACHE_TTL, value)
+        return value
+
+    def _invalidate_cache(self) -> None:
+        """Drop all cached lookups after a write through this repository."""
+        self._lookup_cache.clear()
+
     def _model_to_schema(self, model: Any, schema_class: type[T]) -> T:
         """Convert SQLAlchemy model to Pydantic schema.
 
@@ -57,24 +201,6 @@ class BaseRepository:
             raise ValueError("Cannot convert None to schema")
         return schema_class.model_validate(model)
 
-    async def _handle_db_operation(self, operation_name: str) -> None:
-        """Handle database operations and translate SQLAlchemy exceptions.
-
-        This is a context manager helper that can be used to wrap database operations.
-        For now, we'll rely on individual methods to catch and translate exceptions.
-
-        Args:
-            operation_name: Name of the operation being performed.
-
-        Raises:
-            DatabaseIntegrityError: If integrity constraint is violated.
-            DatabaseConnectionError: If connection fails.
-            DatabaseTransactionError: If transaction fails.
-        """
-        # This method is a placeholder for future use if we want to
-        # add automatic exception translation at the base level
-        pass
-
     async def _model_to_dict(self, model: Any) -> dict[str, Any]:
         """Convert SQLAlchemy model to dictionary.
 
@@ -84,11 +210,12 @@ class BaseRepository:
         Returns:
             Dictionary representation of the model.
         """
+        names, temporal = _column_layout(model.__table__)
         result = {}
-        for column in model.__table__.columns:
-            value = getattr(model, column.name)
+        for name in names:
+            value = getattr(model, name)
             # Handle datetime serialization
-            if hasattr(value, "isoformat"):
+            if value is not None and name in temporal:
                 value = value.isoformat()
-            result[column.name] = value
+            result[name] = value
         return result
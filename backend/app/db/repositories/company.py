@@ -5,9 +5,15 @@ Author: Patryk Golabek
 Copyright: 2025 Patryk Golabek
 """
 
-from sqlalchemy import select
-from sqlalchemy.dialects.postgresql import JSONB
+from collections.abc import AsyncIterator, Iterable, Sequence
+from itertools import combinations
+from typing import Any
+
+from sqlalchemy import Integer, Text, bindparam, delete, or_, select, update
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.exc import IntegrityError, OperationalError
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.util import identity_key
 
 from app.core.exceptions.db_exceptions import (
     DatabaseConnectionError,
@@ -15,7 +21,74 @@ from app.core.exceptions.db_exceptions import (
     DatabaseTransactionError,
 )
 from app.db.models.company import Company
-from app.db.repositories.base import BaseRepository
+from app.db.models.document import Document
+from app.db.repositories.base import (
+    BaseRepository,
+    select_by_ids,
+    select_existing_ids,
+    select_exists_by_id,
+)
+
+_EXISTS = select_exists_by_id(Company)
+_GET_EXISTING_IDS = select_existing_ids(Company)
+_GET_BY_IDS = select_by_ids(Company)
+_GET_ALL = (
+    select(Company)
+    .order_by(Company.id)
+    .offset(bindparam("skip", type_=Integer))
+    .limit(bindparam("limit", type_=Integer))
+)
+_GET_ALL_WITH_RELATIONS = _GET_ALL.options(
+    selectinload(Company.documents).selectinload(Document.extractions),
+    selectinload(Company.compiled_statements),
+)
+_ITER_ALL = select(Company).order_by(Company.id)
+# The returned ID tells a deleted row apart from an unknown one
+_DELETE = delete(Company).where(Company.id == bindparam("company_id")).returning(Company.id)
+
+# Listing columns matching CompanyDomain, read as plain rows
+_GET_ALL_ROWS = (
+    select(
+        Company.id,
+        Company.name,
+        Company.ir_url,
+        Company.primary_ticker,
+        Company.tickers,
+        Company.created_at,
+    )
+    .order_by(Company.id)
+    .offset(bindparam("skip", type_=Integer))
+    .limit(bindparam("limit", type_=Integer))
+)
+
+# Ticker lookup built once: the primary ticker or any listed ticker, preferring a
+# primary match over a secondary listing. ``tickers`` is ``[ticker]`` as text[],
+# matching the GIN index on tickers_texts. The comparison is NULL for companies
+# without a primary ticker, which PostgreSQL sorts first under DESC.
+_GET_BY_TICKER = (
+    select(Company)
+    .where(
+        or_(
+            Company.primary_ticker == bindparam("ticker"),
+            Company.tickers_texts.contains(bindparam("tickers", type_=ARRAY(Text))),
+        )
+    )
+    .order_by((Company.primary_ticker == bindparam("ticker")).desc().nulls_last(), Company.id)
+    .limit(1)
+)
+
+# Prebuilt UPDATE ... RETURNING per subset of updatable columns, as in DocumentRepository;
+# the returned row doubles as the existence check
+_UPDATABLE_COLUMNS = ("name", "ir_url", "primary_ticker", "tickers")
+_UPDATE_BY_COLUMNS = {
+    columns: update(Company)
+    .where(Company.id == bindparam("company_id"))
+    .values({column: bindparam(f"new_{column}") for column in columns})
+    .returning(Company)
+    .execution_options(populate_existing=True)
+    for size in range(1, len(_UPDATABLE_COLUMNS) + 1)
+    for columns in combinations(_UPDATABLE_COLUMNS, size)
+}
 
 
 class CompanyRepository(BaseRepository):
@@ -53,7 +126,6 @@ class CompanyRepository(BaseRepository):
             )
             self.session.add(company)
             await self.session.flush()
-            await self.session.refresh(company)
             return company
         except IntegrityError as e:
             raise DatabaseIntegrityError(
@@ -76,7 +148,60 @@ class CompanyRepository(BaseRepository):
         Returns:
             Company model instance, or None if not found.
         """
-        return await self.session.get(Company, company_id)
+        return await self._coalesce(
+            ("company", company_id), lambda: self.session.get(Company, company_id)
+        )
+
+    async def exists(self, company_id: int) -> bool:
+        """Check whether a company exists without loading it.
+
+        A company this session has already loaded answers without a query, and
+        concurrent checks for the same ID within the request share one query.
+
+        Args:
+            company_id: Company ID.
+
+        Returns:
+            True if the company exists, False otherwise.
+        """
+        if identity_key(Company, company_id) in self.session.identity_map:
+            return True
+        return await self._coalesce(
+            ("company_exists", company_id),
+            lambda: self._fetch_exists(company_id),
+        )
+
+    async def _fetch_exists(self, company_id: int) -> bool:
+        """Run the ``SELECT EXISTS`` check for a company."""
+        return bool(await self.session.scalar(_EXISTS, {"id": company_id}))
+
+    async def get_many_by_ids(self, company_ids: list[int]) -> dict[int, Company]:
+        """Get companies by IDs in a single query.
+
+        Args:
+            company_ids: Company IDs. Unknown IDs are omitted from the result.
+
+        Returns:
+            Dictionary mapping company ID to Company model instance.
+        """
+        if not company_ids:
+            return {}
+        result = await self.session.scalars(_GET_BY_IDS, {"ids": company_ids})
+        return {company.id: company for company in result}
+
+    async def existing_ids(self, company_ids: Iterable[int]) -> set[int]:
+        """Get which of the given company IDs exist, in a single query.
+
+        Args:
+            company_ids: Company IDs to check.
+
+        Returns:
+            Subset of ``company_ids`` that belong to existing companies.
+        """
+        ids = list(company_ids)
+        if not ids:
+            return set()
+        return set(await self.session.scalars(_GET_EXISTING_IDS, {"ids": ids}))
 
     async def get_by_ticker(self, ticker: str) -> Company | None:
         """Get company by ticker symbol.
@@ -87,34 +212,66 @@ class CompanyRepository(BaseRepository):
         Returns:
             Company model instance, or None if not found.
         """
-        # First try primary_ticker
-        stmt = select(Company).where(Company.primary_ticker == ticker)
-        result = await self.session.execute(stmt)
-        company = result.scalar_one_or_none()
+        return await self._coalesce(("ticker", ticker), lambda: self._fetch_by_ticker(ticker))
 
-        if company is not None:
-            return company
+    async def _fetch_by_ticker(self, ticker: str) -> Company | None:
+        """Look up a company by primary ticker or any listed ticker in one query."""
+        result = await self.session.execute(_GET_BY_TICKER, {"ticker": ticker, "tickers": [ticker]})
+        return result.scalar_one_or_none()
 
-        # Then try JSONB tickers array
-        stmt = select(Company).where(Company.tickers.contains([{"ticker": ticker}], type_=JSONB))
-        result = await self.session.execute(stmt)
-        company = result.scalar_one_or_none()
-
-        return company
-
-    async def get_all(self, skip: int = 0, limit: int = 100) -> list[Company]:
+    async def get_all(
+        self, skip: int = 0, limit: int = 100, with_relations: bool = False
+    ) -> Sequence[Company]:
         """Get all companies with pagination.
 
         Args:
             skip: Number of records to skip.
             limit: Maximum number of records to return.
+            with_relations: Eagerly load documents (with their extractions) and
+                compiled statements in batched SELECT ... IN queries instead of
+                one lazy load per company.
 
         Returns:
             List of Company model instances.
         """
-        stmt = select(Company).order_by(Company.id).offset(skip).limit(limit)
-        result = await self.session.execute(stmt)
-        return list(result.scalars().all())
+        stmt = _GET_ALL_WITH_RELATIONS if with_relations else _GET_ALL
+        result = await self.session.execute(stmt, {"skip": skip, "limit": limit})
+        return result.scalars().all()
+
+    async def get_all_rows(self, skip: int = 0, limit: int = 100) -> list[dict[str, Any]]:
+        """Get a page of companies as plain row dictionaries.
+
+        Reads the columns straight off the driver rows, skipping ORM instance
+        construction and identity-map bookkeeping for read-only listings.
+
+        Args:
+            skip: Number of records to skip.
+            limit: Maximum number of records to return.
+
+        Returns:
+            List of dictionaries keyed by column name, ordered by ID.
+        """
+        result = await self.session.execute(_GET_ALL_ROWS, {"skip": skip, "limit": limit})
+        return [dict(row) for row in result.mappings()]
+
+    async def iter_all(self, batch_size: int = 500) -> AsyncIterator[Company]:
+        """Iterate over all companies without materializing the full result.
+
+        Rows are streamed through a server-side cursor and fetched in batches,
+        so memory stays bounded for exports and other whole-table passes.
+
+        Args:
+            batch_size: Number of rows fetched from the cursor per round trip.
+
+        Yields:
+            Company model instances ordered by ID.
+        """
+        result = await self.session.stream_scalars(
+            _ITER_ALL, execution_options={"yield_per": batch_size}
+        )
+        async for partition in result.partitions():
+            for company in partition:
+                yield company
 
     async def update(
         self,
@@ -141,23 +298,22 @@ class CompanyRepository(BaseRepository):
             DatabaseConnectionError: If database connection fails.
             DatabaseTransactionError: If transaction fails.
         """
-        company = await self.session.get(Company, company_id)
-        if company is None:
-            return None
+        values = {
+            column: value
+            for column, value in zip(
+                _UPDATABLE_COLUMNS, (name, ir_url, primary_ticker, tickers), strict=True
+            )
+            if value is not None
+        }
+        if not values:
+            return await self.session.get(Company, company_id)
 
         try:
-            if name is not None:
-                company.name = name
-            if ir_url is not None:
-                company.ir_url = ir_url
-            if primary_ticker is not None:
-                company.primary_ticker = primary_ticker
-            if tickers is not None:
-                company.tickers = tickers
-
-            await self.session.flush()
-            await self.session.refresh(company)
-            return company
+            result = await self.session.execute(
+                _UPDATE_BY_COLUMNS[tuple(values)],
+                {"company_id": company_id, **{f"new_{c}": v for c, v in values.items()}},
+            )
+            return result.scalar_one_or_none()
         except IntegrityError as e:
             raise DatabaseIntegrityError(
                 message=f"Failed to update company: {str(e.orig)}",
@@ -179,10 +335,6 @@ class CompanyRepository(BaseRepository):
         Returns:
             True if company was deleted, False otherwise.
         """
-        company = await self.session.get(Company, company_id)
-        if company is None:
-            return False
-
-        await self.session.delete(company)
-        await self.session.flush()
-        return True
+        # Documents and compiled statements go with it via ON DELETE CASCADE
+        result = await self.session.execute(_DELETE, {"company_id": company_id})
+        return result.scalar_one_or_none() is not None
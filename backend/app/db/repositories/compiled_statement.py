@@ -5,17 +5,159 @@ Author: Patryk Golabek
 Copyright: 2025 Patryk Golabek
 """
 
+import hashlib
+from collections.abc import Sequence
 from typing import Any
 
-from sqlalchemy import select
-
+import orjson
+from sqlalchemy import (
+    Text,
+    bindparam,
+    cast,
+    delete,
+    exists,
+    func,
+    insert,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.dml import ReturningInsert
+
+from app.db.models.company import Company
 from app.db.models.extraction import CompiledStatement
-from app.db.repositories.base import BaseRepository
+from app.db.repositories.base import BaseRepository, select_by_ids, select_exists_by_id
+
+# Built once at import time; each call only supplies the bound parameters
+_GET_BY_IDS = select_by_ids(CompiledStatement)
+_EXISTS = select_exists_by_id(CompiledStatement)
+_INSERT = (
+    insert(CompiledStatement)
+    .values(
+        company_id=bindparam("company_id"),
+        statement_type=bindparam("statement_type"),
+        data=bindparam("data"),
+    )
+    .returning(CompiledStatement)
+)
+_GET_BY_COMPANY = (
+    select(CompiledStatement)
+    .where(CompiledStatement.company_id == bindparam("company_id"))
+    .order_by(CompiledStatement.statement_type)
+)
+# Hot lookup built once so every call reuses the same statement and cache key
+_GET_BY_COMPANY_AND_TYPE = select(CompiledStatement).where(
+    CompiledStatement.company_id == bindparam("company_id"),
+    CompiledStatement.statement_type == bindparam("statement_type"),
+)
+# Listing without the JSONB payload, for callers that only need to know what exists
+_GET_METADATA_BY_COMPANY = (
+    select(
+        CompiledStatement.id,
+        CompiledStatement.company_id,
+        CompiledStatement.statement_type,
+        CompiledStatement.updated_at,
+    )
+    .where(CompiledStatement.company_id == bindparam("company_id"))
+    .order_by(CompiledStatement.statement_type)
+)
+# Same rows as get_by_company, but with ``data`` left as the JSON text stored in Postgres
+_GET_BY_COMPANY_RAW = (
+    select(
+        CompiledStatement.id,
+        CompiledStatement.company_id,
+        CompiledStatement.statement_type,
+        cast(CompiledStatement.data, Text).label("data"),
+        CompiledStatement.updated_at,
+    )
+    .where(CompiledStatement.company_id == bindparam("company_id"))
+    .order_by(CompiledStatement.statement_type)
+)
+
+
+# The returned row doubles as the existence check
+_UPDATE_DATA = (
+    update(CompiledStatement)
+    .where(CompiledStatement.id == bindparam("compiled_statement_id"))
+    .values(data=bindparam("data"))
+    .returning(CompiledStatement)
+    .execution_options(populate_existing=True)
+)
+_DELETE = (
+    delete(CompiledStatement)
+    .where(CompiledStatement.id == bindparam("compiled_statement_id"))
+    .returning(CompiledStatement.company_id, CompiledStatement.statement_type)
+)
+
+
+def _build_upsert() -> ReturningInsert[CompiledStatement]:
+    """Build the single-row upsert that only inserts when the company exists."""
+    company_id = bindparam("company_id", type_=CompiledStatement.company_id.type)
+    source = select(
+        company_id,
+        bindparam("statement_type", type_=CompiledStatement.statement_type.type),
+        bindparam("data", type_=CompiledStatement.data.type),
+    ).where(exists().where(Company.id == company_id))
+    stmt = pg_insert(CompiledStatement).from_select(
+        ["company_id", "statement_type", "data"], source
+    )
+    return (
+        stmt.on_conflict_do_update(
+            constraint="uq_company_statement_type",
+            set_={"data": stmt.excluded.data, "updated_at": func.now()},
+            where=CompiledStatement.data.is_distinct_from(stmt.excluded.data),
+        )
+        .returning(CompiledStatement)
+        .execution_options(populate_existing=True)
+    )
+
+
+_UPSERT = _build_upsert()
+
+# Multi-row upsert for bulk_upsert; rows whose data is unchanged are left alone
+# and therefore not returned
+_BULK_INSERT = pg_insert(CompiledStatement)
+_BULK_UPSERT = (
+    _BULK_INSERT.on_conflict_do_update(
+        constraint="uq_company_statement_type",
+        set_={"data": _BULK_INSERT.excluded.data, "updated_at": func.now()},
+        where=CompiledStatement.data.is_distinct_from(_BULK_INSERT.excluded.data),
+    )
+    .returning(CompiledStatement)
+    .execution_options(populate_existing=True)
+)
+
+
+def _data_digest(data: dict[str, Any]) -> bytes:
+    """Hash compiled data independently of key order."""
+    payload = orjson.dumps(data, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    return hashlib.blake2b(payload, digest_size=16).digest()
 
 
 class CompiledStatementRepository(BaseRepository):
     """Repository for managing CompiledStatement database operations."""
 
+    def __init__(self, session: AsyncSession | None = None):
+        """Initialize repository with database session.
+
+        Args:
+            session: Optional async session. If None, creates a new session.
+        """
+        super().__init__(session)
+        # (company_id, statement_type) -> (data digest, row) of upserts made here
+        self._upserted: dict[tuple[int, str], tuple[bytes, CompiledStatement]] = {}
+
+    def _forget_upserts(self, *keys: tuple[int, str]) -> None:
+        """Forget remembered upserts of statements rewritten by another write.
+
+        Args:
+            *keys: (company_id, statement_type) pairs just written.
+        """
+        for key in keys:
+            self._upserted.pop(key, None)
+
     async def create(
         self,
         company_id: int,
@@ -32,16 +174,35 @@ class CompiledStatementRepository(BaseRepository):
         Returns:
             CompiledStatement model instance.
         """
-        compiled_statement = CompiledStatement(
-            company_id=company_id,
-            statement_type=statement_type,
-            data=data,
-        )
-        self.session.add(compiled_statement)
-        await self.session.flush()
-        await self.session.refresh(compiled_statement)
+        params = {"company_id": company_id, "statement_type": statement_type, "data": data}
+        compiled_statement = (await self.session.scalars(_INSERT, params)).one()
+        self._invalidate_cache()
+        self._forget_upserts((company_id, statement_type))
         return compiled_statement
 
+    async def bulk_create(
+        self, compiled_statements: list[dict[str, Any]]
+    ) -> Sequence[CompiledStatement]:
+        """Create many compiled statements with a single multi-row INSERT ... RETURNING.
+
+        Args:
+            compiled_statements: Compiled statement field dictionaries with
+                ``company_id``, ``statement_type`` and ``data`` keys.
+
+        Returns:
+            Created CompiledStatement model instances, in the same order as
+            ``compiled_statements``.
+        """
+        if not compiled_statements:
+            return []
+        stmt = insert(CompiledStatement).returning(CompiledStatement, sort_by_parameter_order=True)
+        result = await self.session.scalars(stmt, compiled_statements)
+        self._invalidate_cache()
+        self._forget_upserts(
+            *((cs["company_id"], cs["statement_type"]) for cs in compiled_statements)
+        )
+        return result.all()
+
     async def get_by_id(self, compiled_statement_id: int) -> CompiledStatement | None:
         """Get compiled statement by ID.
 
@@ -53,7 +214,51 @@ class CompiledStatementRepository(BaseRepository):
         """
         return await self.session.get(CompiledStatement, compiled_statement_id)
 
-    async def get_by_company(self, company_id: int) -> list[CompiledStatement]:
+    async def exists(self, compiled_statement_id: int) -> bool:
+        """Check whether a compiled statement exists without loading it.
+
+        Args:
+            compiled_statement_id: Compiled statement ID.
+
+        Returns:
+            True if the compiled statement exists, False otherwise.
+        """
+        return bool(await self.session.scalar(_EXISTS, {"id": compiled_statement_id}))
+
+    async def get_by_ids(self, compiled_statement_ids: list[int]) -> Sequence[CompiledStatement]:
+        """Get compiled statements by IDs in a single query.
+
+        Args:
+            compiled_statement_ids: Compiled statement IDs. Unknown IDs are omitted
+                from the result.
+
+        Returns:
+            List of CompiledStatement model instances in the order of
+            ``compiled_statement_ids``.
+        """
+        if not compiled_statement_ids:
+            return []
+        result = await self.session.scalars(_GET_BY_IDS, {"ids": compiled_statement_ids})
+        return result.all()
+
+    async def get_many_by_ids(
+        self, compiled_statement_ids: list[int]
+    ) -> dict[int, CompiledStatement]:
+        """Get compiled statements by IDs in a single query.
+
+        Args:
+            compiled_statement_ids: Compiled statement IDs. Unknown IDs are omitted
+                from the result.
+
+        Returns:
+            Dictionary mapping compiled statement ID to CompiledStatement model instance.
+        """
+        return {
+            compiled_statement.id: compiled_statement
+            for compiled_statement in await self.get_by_ids(compiled_statement_ids)
+        }
+
+    async def get_by_company(self, company_id: int) -> Sequence[CompiledStatement]:
         """Get all compiled statements for a company.
 
         Args:
@@ -62,13 +267,36 @@ class CompiledStatementRepository(BaseRepository):
         Returns:
             List of CompiledStatement model instances.
         """
-        stmt = (
-            select(CompiledStatement)
-            .where(CompiledStatement.company_id == company_id)
-            .order_by(CompiledStatement.statement_type)
-        )
-        result = await self.session.execute(stmt)
-        return list(result.scalars().all())
+        result = await self.session.scalars(_GET_BY_COMPANY, {"company_id": company_id})
+        return result.all()
+
+    async def get_metadata_by_company(self, company_id: int) -> list[dict[str, Any]]:
+        """Get compiled statement metadata for a company without the ``data`` payload.
+
+        Args:
+            company_id: Company ID.
+
+        Returns:
+            List of row dictionaries with ``id``, ``company_id``, ``statement_type``
+            and ``updated_at``.
+        """
+        result = await self.session.execute(_GET_METADATA_BY_COMPANY, {"company_id": company_id})
+        return [dict(row) for row in result.mappings()]
+
+    async def get_by_company_raw(self, company_id: int) -> list[dict[str, Any]]:
+        """Get all compiled statements for a company without decoding their data.
+
+        Intended for read paths that only forward ``data`` to a client, so the
+        JSONB document is never parsed into Python objects and re-serialized.
+
+        Args:
+            company_id: Company ID.
+
+        Returns:
+            List of row dictionaries whose ``data`` value is a JSON string.
+        """
+        result = await self.session.execute(_GET_BY_COMPANY_RAW, {"company_id": company_id})
+        return [dict(row) for row in result.mappings()]
 
     async def get_by_company_and_type(
         self, company_id: int, statement_type: str
@@ -82,12 +310,15 @@ class CompiledStatementRepository(BaseRepository):
         Returns:
             CompiledStatement model instance, or None if not found.
         """
-        stmt = select(CompiledStatement).where(
-            CompiledStatement.company_id == company_id,
-            CompiledStatement.statement_type == statement_type,
-        )
-        result = await self.session.execute(stmt)
-        return result.scalar_one_or_none()
+
+        async def load() -> CompiledStatement | None:
+            result = await self.session.execute(
+                _GET_BY_COMPANY_AND_TYPE,
+                {"company_id": company_id, "statement_type": statement_type},
+            )
+            return result.scalar_one_or_none()
+
+        return await self._cached(("company_and_type", company_id, statement_type), load)
 
     async def update(
         self,
@@ -103,15 +334,16 @@ class CompiledStatementRepository(BaseRepository):
         Returns:
             CompiledStatement model instance, or None if not found.
         """
-        compiled_statement = await self.session.get(CompiledStatement, compiled_statement_id)
-        if compiled_statement is None:
-            return None
+        if data is None:
+            return await self.session.get(CompiledStatement, compiled_statement_id)
 
-        if data is not None:
-            compiled_statement.data = data
-
-        await self.session.flush()
-        await self.session.refresh(compiled_statement)
+        result = await self.session.scalars(
+            _UPDATE_DATA, {"compiled_statement_id": compiled_statement_id, "data": data}
+        )
+        compiled_statement = result.one_or_none()
+        self._invalidate_cache()
+        if compiled_statement is not None:
+            self._forget_upserts((compiled_statement.company_id, compiled_statement.statement_type))
         return compiled_statement
 
     async def upsert(
@@ -119,11 +351,17 @@ class CompiledStatementRepository(BaseRepository):
         company_id: int,
         statement_type: str,
         data: dict[str, Any],
-    ) -> CompiledStatement:
+    ) -> CompiledStatement | None:
         """Insert or update a compiled statement.
 
-        If a compiled statement exists for the company and statement type, it will be updated.
-        Otherwise, a new one will be created.
+        Runs a single INSERT ... SELECT ... ON CONFLICT DO UPDATE whose SELECT
+        only yields a row when the company exists, so an unknown company is
+        reported without a separate lookup. An existing row is only rewritten
+        when its data actually changes, so recompiling an unchanged statement
+        writes no new row version or WAL. Repeating an upsert this repository
+        already made with identical data skips the database entirely; the memo
+        lives as long as the repository's session and is dropped per statement
+        by the repository's other writes to it.
 
         Args:
             company_id: ID of the company this compiled statement belongs to.
@@ -131,39 +369,86 @@ class CompiledStatementRepository(BaseRepository):
             data: Compiled financial data as dictionary.
 
         Returns:
-            CompiledStatement model instance.
+            CompiledStatement model instance, or None if the company does not exist.
         """
-        # Try to get existing statement using direct query to get model
-        stmt = select(CompiledStatement).where(
-            CompiledStatement.company_id == company_id,
-            CompiledStatement.statement_type == statement_type,
-        )
-        result = await self.session.execute(stmt)
-        existing = result.scalar_one_or_none()
+        key = (company_id, statement_type)
+        digest = _data_digest(data)
+        previous = self._upserted.get(key)
+        if previous is not None and previous[0] == digest:
+            return previous[1]
+
+        params = {"company_id": company_id, "statement_type": statement_type, "data": data}
+        compiled_statement = (await self.session.scalars(_UPSERT, params)).one_or_none()
+        self._invalidate_cache()
+        if compiled_statement is None:
+            # Either the row exists with identical data and the update was skipped,
+            # or the company does not exist and nothing was inserted
+            result = await self.session.scalars(
+                _GET_BY_COMPANY_AND_TYPE,
+                {"company_id": company_id, "statement_type": statement_type},
+            )
+            compiled_statement = result.one_or_none()
+            if compiled_statement is None:
+                return None
+
+        self._upserted[key] = (digest, compiled_statement)
+        return compiled_statement
+
+    async def bulk_upsert(
+        self, compiled_statements: list[dict[str, Any]]
+    ) -> list[CompiledStatement]:
+        """Insert or update many compiled statements in one round trip.
 
-        if existing is not None:
-            # Update existing
-            existing.data = data
-            await self.session.flush()
-            await self.session.refresh(existing)
-            return existing
+        All rows go through a single multi-row INSERT ... ON CONFLICT DO UPDATE.
+        Rows left untouched because their data is unchanged are read back with
+        one follow-up query. When the same (company, statement type) appears
+        more than once, the last occurrence wins. The companies must exist.
 
-        # Create new
-        return await self.create(company_id, statement_type, data)
+        Args:
+            compiled_statements: Compiled statement field dictionaries with
+                ``company_id``, ``statement_type`` and ``data`` keys.
 
-    async def delete(self, compiled_statement_id: int) -> bool:
+        Returns:
+            One CompiledStatement model instance per distinct (company, statement
+            type), in order of first appearance.
+        """
+        rows = {(row["company_id"], row["statement_type"]): row for row in compiled_statements}
+        if not rows:
+            return []
+
+        result = await self.session.scalars(_BULK_UPSERT, list(rows.values()))
+        by_key = {(cs.company_id, cs.statement_type): cs for cs in result}
+        self._invalidate_cache()
+        self._forget_upserts(*rows)
+
+        unchanged = [key for key in rows if key not in by_key]
+        if unchanged:
+            stmt = select(CompiledStatement).where(
+                tuple_(CompiledStatement.company_id, CompiledStatement.statement_type).in_(
+                    unchanged
+                )
+            )
+            by_key.update(
+                ((cs.company_id, cs.statement_type), cs) for cs in await self.session.scalars(stmt)
+            )
+        return [by_key[key] for key in rows]
+
+    async def delete(self, compiled_statement_id: int) -> tuple[int, str] | None:
         """Delete a compiled statement by ID.
 
         Args:
             compiled_statement_id: Compiled statement ID.
 
         Returns:
-            True if compiled statement was deleted, False otherwise.
+            (company ID, statement type) of the deleted compiled statement, or
+            None if it was not found.
         """
-        compiled_statement = await self.session.get(CompiledStatement, compiled_statement_id)
-        if compiled_statement is None:
-            return False
-
-        await self.session.delete(compiled_statement)
-        await self.session.flush()
-        return True
+        result = await self.session.execute(
+            _DELETE, {"compiled_statement_id": compiled_statement_id}
+        )
+        deleted = result.one_or_none()
+        self._invalidate_cache()
+        if deleted is None:
+            return None
+        self._forget_upserts((deleted.company_id, deleted.statement_type))
+        return deleted.company_id, deleted.statement_type
@@ -5,10 +5,168 @@ Author: Patryk Golabek
 Copyright: 2025 Patryk Golabek
 """
 
-from sqlalchemy import select
+from collections.abc import Iterable, Sequence
+from datetime import datetime
+from itertools import combinations
+from typing import Any
 
+from sqlalchemy import (
+    ARRAY,
+    DateTime,
+    Insert,
+    Integer,
+    Update,
+    any_,
+    bindparam,
+    delete,
+    exists,
+    insert,
+    select,
+    tuple_,
+    update,
+)
+
+from app.db.models.company import Company
 from app.db.models.document import Document
-from app.db.repositories.base import BaseRepository
+from app.db.repositories.base import (
+    BaseRepository,
+    select_by_ids,
+    select_existing_ids,
+    select_exists_by_id,
+)
+
+# Keyset cursor: (fiscal_year, created_at, id) of the last document on the previous page.
+# created_at is NOT NULL (migration 005); a NULL would drop rows from the row comparison.
+DocumentCursor = tuple[int, datetime, int]
+
+# Listing queries are built once and executed with bound parameters on every call
+_NEWEST_FIRST = (Document.fiscal_year.desc(), Document.created_at.desc(), Document.id.desc())
+_AFTER_CURSOR = tuple_(Document.fiscal_year, Document.created_at, Document.id) < tuple_(
+    bindparam("after_fiscal_year", type_=Integer),
+    bindparam("after_created_at", type_=DateTime(timezone=True)),
+    bindparam("after_id", type_=Integer),
+)
+_GET_BY_IDS = select_by_ids(Document)
+_EXISTS = select_exists_by_id(Document)
+_GET_EXISTING_IDS = select_existing_ids(Document)
+_GET_BY_COMPANY = (
+    select(Document)
+    .where(Document.company_id == bindparam("company_id"))
+    .order_by(*_NEWEST_FIRST)
+    .offset(bindparam("skip", type_=Integer))
+    .limit(bindparam("limit", type_=Integer))
+)
+# Row variants of the listings select plain columns, for read paths that only
+# serialize the result; columns follow DocumentResponse's field order
+_ROW_COLUMNS = (
+    Document.company_id,
+    Document.url,
+    Document.fiscal_year,
+    Document.document_type,
+    Document.file_path,
+    Document.id,
+    Document.created_at,
+)
+_GET_ROWS_BY_COMPANY = _GET_BY_COMPANY.with_only_columns(*_ROW_COLUMNS)
+_GET_ROWS_BY_COMPANIES = (
+    select(*_ROW_COLUMNS)
+    .where(Document.company_id == any_(bindparam("company_ids", type_=ARRAY(Integer))))
+    .order_by(*_NEWEST_FIRST)
+)
+_GET_ROWS_BY_COMPANY_AND_YEAR = (
+    select(*_ROW_COLUMNS)
+    .where(
+        Document.company_id == bindparam("company_id"),
+        Document.fiscal_year == bindparam("fiscal_year"),
+    )
+    .order_by(Document.created_at.desc())
+)
+_GET_ROWS_BY_COMPANY_AND_TYPE = (
+    select(*_ROW_COLUMNS)
+    .where(
+        Document.company_id == bindparam("company_id"),
+        Document.document_type == bindparam("document_type"),
+    )
+    .order_by(*_NEWEST_FIRST)
+    .offset(bindparam("skip", type_=Integer))
+    .limit(bindparam("limit", type_=Integer))
+)
+# Keyset pages start with an index seek past the cursor instead of skipping rows
+_GET_ROWS_BY_COMPANY_AFTER = (
+    select(*_ROW_COLUMNS)
+    .where(Document.company_id == bindparam("company_id"), _AFTER_CURSOR)
+    .order_by(*_NEWEST_FIRST)
+    .limit(bindparam("limit", type_=Integer))
+)
+_GET_ROWS_BY_COMPANY_AND_TYPE_AFTER = (
+    select(*_ROW_COLUMNS)
+    .where(
+        Document.company_id == bindparam("company_id"),
+        Document.document_type == bindparam("document_type"),
+        _AFTER_CURSOR,
+    )
+    .order_by(*_NEWEST_FIRST)
+    .limit(bindparam("limit", type_=Integer))
+)
+_GET_ROW_BY_ID = select(*_ROW_COLUMNS).where(Document.id == bindparam("document_id"))
+
+_UPDATABLE_COLUMNS = ("url", "fiscal_year", "document_type", "file_path")
+
+
+def _build_updates(*returning: Any) -> dict[tuple[str, ...], Update]:
+    """Build one UPDATE ... RETURNING per subset of updatable columns.
+
+    Keyed by the column names in declaration order, so each shape compiles and
+    prepares once.
+    """
+    return {
+        columns: update(Document)
+        .where(Document.id == bindparam("document_id"))
+        .values({column: bindparam(f"new_{column}") for column in columns})
+        .returning(*returning)
+        for size in range(1, len(_UPDATABLE_COLUMNS) + 1)
+        for columns in combinations(_UPDATABLE_COLUMNS, size)
+    }
+
+
+_UPDATE_BY_COLUMNS = {
+    columns: stmt.execution_options(populate_existing=True)
+    for columns, stmt in _build_updates(Document).items()
+}
+_UPDATE_ROW_BY_COLUMNS = _build_updates(*_ROW_COLUMNS)
+# The returned ID tells a deleted row apart from an unknown one
+_DELETE = delete(Document).where(Document.id == bindparam("document_id")).returning(Document.id)
+
+
+def _build_guarded_insert(*returning: Any) -> Insert:
+    """Build the INSERT ... SELECT that only yields a row when the company exists."""
+    company_id = bindparam("company_id", type_=Document.company_id.type)
+    source = select(
+        company_id,
+        bindparam("url", type_=Document.url.type),
+        bindparam("fiscal_year", type_=Document.fiscal_year.type),
+        bindparam("document_type", type_=Document.document_type.type),
+        bindparam("file_path", type_=Document.file_path.type),
+    ).where(exists().where(Company.id == company_id))
+    return (
+        insert(Document)
+        .from_select(["company_id", "url", "fiscal_year", "document_type", "file_path"], source)
+        .returning(*returning)
+    )
+
+
+_GUARDED_INSERT = _build_guarded_insert(Document)
+_GUARDED_INSERT_ROW = _build_guarded_insert(*_ROW_COLUMNS)
+
+
+def _cursor_params(after: DocumentCursor) -> dict[str, Any]:
+    """Get the bound parameters for a keyset cursor."""
+    fiscal_year, created_at, document_id = after
+    return {
+        "after_fiscal_year": fiscal_year,
+        "after_created_at": created_at,
+        "after_id": document_id,
+    }
 
 
 class DocumentRepository(BaseRepository):
@@ -34,17 +192,103 @@ class DocumentRepository(BaseRepository):
         Returns:
             Document model instance.
         """
-        document = Document(
-            company_id=company_id,
-            url=url,
-            fiscal_year=fiscal_year,
-            document_type=document_type,
-            file_path=file_path,
+        stmt = (
+            insert(Document)
+            .values(
+                company_id=company_id,
+                url=url,
+                fiscal_year=fiscal_year,
+                document_type=document_type,
+                file_path=file_path,
+            )
+            .returning(Document)
+        )
+        return (await self.session.scalars(stmt)).one()
+
+    async def create_if_company_exists(
+        self,
+        company_id: int,
+        url: str,
+        fiscal_year: int,
+        document_type: str,
+        file_path: str | None = None,
+    ) -> Document | None:
+        """Create a new document if its company exists, in a single statement.
+
+        Runs one INSERT ... SELECT whose SELECT only yields a row when the
+        company exists, so an unknown company is reported without a separate
+        lookup and without a foreign key violation aborting the transaction.
+
+        Args:
+            company_id: ID of the company this document belongs to.
+            url: URL where the document was found.
+            fiscal_year: Fiscal year of the document.
+            document_type: Type of document (e.g., 'annual_report', 'quarterly_report').
+            file_path: Local file path if downloaded (optional).
+
+        Returns:
+            Document model instance, or None if the company does not exist.
+        """
+        params = {
+            "company_id": company_id,
+            "url": url,
+            "fiscal_year": fiscal_year,
+            "document_type": document_type,
+            "file_path": file_path,
+        }
+        return (await self.session.scalars(_GUARDED_INSERT, params)).one_or_none()
+
+    async def create_row_if_company_exists(
+        self,
+        company_id: int,
+        url: str,
+        fiscal_year: int,
+        document_type: str,
+        file_path: str | None = None,
+    ) -> dict[str, Any] | None:
+        """Create a new document if its company exists and return it as a plain row.
+
+        Same guarded INSERT ... SELECT as ``create_if_company_exists``, but the
+        RETURNING columns are read straight off the driver row, so no ORM
+        instance is constructed or added to the identity map.
+
+        Args:
+            company_id: ID of the company this document belongs to.
+            url: URL where the document was found.
+            fiscal_year: Fiscal year of the document.
+            document_type: Type of document (e.g., 'annual_report', 'quarterly_report').
+            file_path: Local file path if downloaded (optional).
+
+        Returns:
+            Dictionary keyed by column name, or None if the company does not exist.
+        """
+        params = {
+            "company_id": company_id,
+            "url": url,
+            "fiscal_year": fiscal_year,
+            "document_type": document_type,
+            "file_path": file_path,
+        }
+        row = (await self.session.execute(_GUARDED_INSERT_ROW, params)).mappings().one_or_none()
+        return dict(row) if row is not None else None
+
+    async def bulk_create(self, documents: list[dict[str, Any]]) -> Sequence[Document]:
+        """Create many documents with a single multi-row INSERT ... RETURNING.
+
+        Args:
+            documents: Document field dictionaries with ``company_id``, ``url``,
+                ``fiscal_year``, ``document_type`` and optional ``file_path`` keys.
+
+        Returns:
+            Created Document model instances, in the same order as ``documents``.
+        """
+        if not documents:
+            return []
+        stmt = insert(Document).returning(Document, sort_by_parameter_order=True)
+        result = await self.session.scalars(
+            stmt, [{"file_path": None, **document} for document in documents]
         )
-        self.session.add(document)
-        await self.session.flush()
-        await self.session.refresh(document)
-        return document
+        return result.all()
 
     async def get_by_id(self, document_id: int) -> Document | None:
         """Get document by ID.
@@ -57,80 +301,178 @@ class DocumentRepository(BaseRepository):
         """
         return await self.session.get(Document, document_id)
 
+    async def exists(self, document_id: int) -> bool:
+        """Check whether a document exists without loading it.
+
+        Args:
+            document_id: Document ID.
+
+        Returns:
+            True if the document exists, False otherwise.
+        """
+        return bool(await self.session.scalar(_EXISTS, {"id": document_id}))
+
+    async def existing_ids(self, document_ids: Iterable[int]) -> set[int]:
+        """Get which of the given document IDs exist, in a single query.
+
+        Args:
+            document_ids: Document IDs to check.
+
+        Returns:
+            Subset of ``document_ids`` that belong to existing documents.
+        """
+        ids = list(document_ids)
+        if not ids:
+            return set()
+        return set(await self.session.scalars(_GET_EXISTING_IDS, {"ids": ids}))
+
+    async def get_by_ids(self, document_ids: list[int]) -> Sequence[Document]:
+        """Get documents by IDs in a single query.
+
+        Args:
+            document_ids: Document IDs. Unknown IDs are omitted from the result.
+
+        Returns:
+            List of Document model instances in the order of ``document_ids``.
+        """
+        if not document_ids:
+            return []
+        result = await self.session.scalars(_GET_BY_IDS, {"ids": document_ids})
+        return result.all()
+
+    async def get_many_by_ids(self, document_ids: list[int]) -> dict[int, Document]:
+        """Get documents by IDs in a single query.
+
+        Args:
+            document_ids: Document IDs. Unknown IDs are omitted from the result.
+
+        Returns:
+            Dictionary mapping document ID to Document model instance.
+        """
+        return {document.id: document for document in await self.get_by_ids(document_ids)}
+
     async def get_by_company(
+        self, company_id: int, skip: int = 0, limit: int = 100
+    ) -> Sequence[Document]:
+        """Get all documents for a company with pagination.
+
+        Args:
+            company_id: Company ID.
+            skip: Number of records to skip.
+            limit: Maximum number of records to return.
+
+        Returns:
+            List of Document model instances, newest first.
+        """
+        result = await self.session.execute(
+            _GET_BY_COMPANY, {"company_id": company_id, "skip": skip, "limit": limit}
+        )
+        return result.scalars().all()
+
+    async def get_rows_by_company(
         self,
         company_id: int,
         skip: int = 0,
         limit: int = 100,
-    ) -> list[Document]:
-        """Get all documents for a company with pagination.
+        after: DocumentCursor | None = None,
+    ) -> list[dict[str, Any]]:
+        """Get a page of a company's documents as plain row dictionaries.
+
+        Reads the columns straight off the driver rows, skipping ORM instance
+        construction and identity-map bookkeeping for read-only listings.
 
         Args:
             company_id: Company ID.
-            skip: Number of records to skip.
+            skip: Number of records to skip. Ignored when ``after`` is given.
             limit: Maximum number of records to return.
+            after: Keyset cursor of the last document already seen. The page
+                then starts with an index seek instead of skipping rows.
 
         Returns:
-            List of Document model instances.
+            List of dictionaries keyed by column name, newest first.
         """
-        stmt = (
-            select(Document)
-            .where(Document.company_id == company_id)
-            .order_by(Document.fiscal_year.desc(), Document.created_at.desc())
-            .offset(skip)
-            .limit(limit)
-        )
-        result = await self.session.execute(stmt)
-        return list(result.scalars().all())
+        if after is None:
+            result = await self.session.execute(
+                _GET_ROWS_BY_COMPANY, {"company_id": company_id, "skip": skip, "limit": limit}
+            )
+        else:
+            result = await self.session.execute(
+                _GET_ROWS_BY_COMPANY_AFTER,
+                {"company_id": company_id, "limit": limit, **_cursor_params(after)},
+            )
+        return [dict(row) for row in result.mappings()]
 
-    async def get_by_company_and_year(self, company_id: int, fiscal_year: int) -> list[Document]:
-        """Get documents for a company by fiscal year.
+    async def get_many_rows_by_company(
+        self, company_ids: list[int]
+    ) -> dict[int, list[dict[str, Any]]]:
+        """Get all documents for several companies as plain row dictionaries.
+
+        Args:
+            company_ids: Company IDs.
+
+        Returns:
+            Dictionary mapping each requested company ID to its document rows,
+            newest first. Companies without documents map to an empty list.
+        """
+        rows: dict[int, list[dict[str, Any]]] = {company_id: [] for company_id in company_ids}
+        if not company_ids:
+            return rows
+        result = await self.session.execute(_GET_ROWS_BY_COMPANIES, {"company_ids": list(rows)})
+        for row in result.mappings():
+            rows[row["company_id"]].append(dict(row))
+        return rows
+
+    async def get_rows_by_company_and_year(
+        self, company_id: int, fiscal_year: int
+    ) -> list[dict[str, Any]]:
+        """Get a company's documents for a fiscal year as plain row dictionaries.
 
         Args:
             company_id: Company ID.
             fiscal_year: Fiscal year.
 
         Returns:
-            List of Document model instances.
+            List of dictionaries keyed by column name, newest first.
         """
-        stmt = (
-            select(Document)
-            .where(Document.company_id == company_id, Document.fiscal_year == fiscal_year)
-            .order_by(Document.created_at.desc())
+        result = await self.session.execute(
+            _GET_ROWS_BY_COMPANY_AND_YEAR, {"company_id": company_id, "fiscal_year": fiscal_year}
         )
-        result = await self.session.execute(stmt)
-        return list(result.scalars().all())
+        return [dict(row) for row in result.mappings()]
 
-    async def get_by_company_and_type(
+    async def get_rows_by_company_and_type(
         self,
         company_id: int,
         document_type: str,
         skip: int = 0,
         limit: int = 100,
-    ) -> list[Document]:
-        """Get documents for a company by document type.
+        after: DocumentCursor | None = None,
+    ) -> list[dict[str, Any]]:
+        """Get a page of a company's documents of one type as plain row dictionaries.
 
         Args:
             company_id: Company ID.
             document_type: Type of document.
-            skip: Number of records to skip.
+            skip: Number of records to skip. Ignored when ``after`` is given.
             limit: Maximum number of records to return.
+            after: Keyset cursor of the last document already seen.
 
         Returns:
-            List of Document model instances.
+            List of dictionaries keyed by column name, newest first.
         """
-        stmt = (
-            select(Document)
-            .where(
-                Document.company_id == company_id,
-                Document.document_type == document_type,
+        params: dict[str, Any] = {
+            "company_id": company_id,
+            "document_type": document_type,
+            "limit": limit,
+        }
+        if after is None:
+            result = await self.session.execute(
+                _GET_ROWS_BY_COMPANY_AND_TYPE, {**params, "skip": skip}
             )
-            .order_by(Document.fiscal_year.desc(), Document.created_at.desc())
-            .offset(skip)
-            .limit(limit)
-        )
-        result = await self.session.execute(stmt)
-        return list(result.scalars().all())
+        else:
+            result = await self.session.execute(
+                _GET_ROWS_BY_COMPANY_AND_TYPE_AFTER, {**params, **_cursor_params(after)}
+            )
+        return [dict(row) for row in result.mappings()]
 
     async def update(
         self,
@@ -152,22 +494,61 @@ class DocumentRepository(BaseRepository):
         Returns:
             Document model instance, or None if not found.
         """
-        document = await self.session.get(Document, document_id)
-        if document is None:
-            return None
+        values = {
+            column: value
+            for column, value in zip(
+                _UPDATABLE_COLUMNS, (url, fiscal_year, document_type, file_path), strict=True
+            )
+            if value is not None
+        }
+        if not values:
+            return await self.session.get(Document, document_id)
+
+        # Single UPDATE ... RETURNING of just the supplied columns
+        result = await self.session.execute(
+            _UPDATE_BY_COLUMNS[tuple(values)],
+            {"document_id": document_id, **{f"new_{c}": v for c, v in values.items()}},
+        )
+        return result.scalar_one_or_none()
+
+    async def update_row(
+        self,
+        document_id: int,
+        url: str | None = None,
+        fiscal_year: int | None = None,
+        document_type: str | None = None,
+        file_path: str | None = None,
+    ) -> dict[str, Any] | None:
+        """Update a document and return it as a plain row.
 
-        if url is not None:
-            document.url = url
-        if fiscal_year is not None:
-            document.fiscal_year = fiscal_year
-        if document_type is not None:
-            document.document_type = document_type
-        if file_path is not None:
-            document.file_path = file_path
+        Runs the same single UPDATE ... RETURNING as ``update`` without
+        constructing or refreshing an ORM instance.
 
-        await self.session.flush()
-        await self.session.refresh(document)
-        return document
+        Args:
+            document_id: Document ID.
+            url: URL where the document was found (optional).
+            fiscal_year: Fiscal year of the document (optional).
+            document_type: Type of document (optional).
+            file_path: Local file path if downloaded (optional).
+
+        Returns:
+            Dictionary keyed by column name, or None if not found.
+        """
+        values = {
+            column: value
+            for column, value in zip(
+                _UPDATABLE_COLUMNS, (url, fiscal_year, document_type, file_path), strict=True
+            )
+            if value is not None
+        }
+        if values:
+            update_stmt = _UPDATE_ROW_BY_COLUMNS[tuple(values)]
+            params = {"document_id": document_id, **{f"new_{c}": v for c, v in values.items()}}
+            result = await self.session.execute(update_stmt, params)
+        else:
+            result = await self.session.execute(_GET_ROW_BY_ID, {"document_id": document_id})
+        row = result.mappings().one_or_none()
+        return dict(row) if row is not None else None
 
     async def delete(self, document_id: int) -> bool:
         """Delete a document by ID.
@@ -178,10 +559,6 @@ class DocumentRepository(BaseRepository):
         Returns:
             True if document was deleted, False otherwise.
         """
-        document = await self.session.get(Document, document_id)
-        if document is None:
-            return False
-
-        await self.session.delete(document)
-        await self.session.flush()
-        return True
+        # Child rows are removed by the ON DELETE CASCADE foreign keys
+        result = await self.session.execute(_DELETE, {"document_id": document_id})
+        return result.scalar_one_or_none() is not None
@@ -5,12 +5,99 @@ Author: Patryk Golabek
 Copyright: 2025 Patryk Golabek
 """
 
+from collections.abc import Sequence
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import (
+    ARRAY,
+    Insert,
+    Integer,
+    Text,
+    any_,
+    bindparam,
+    cast,
+    delete,
+    exists,
+    insert,
+    select,
+    update,
+)
 
+from app.db.models.document import Document
 from app.db.models.extraction import Extraction
-from app.db.repositories.base import BaseRepository
+from app.db.repositories.base import BaseRepository, select_by_ids, select_exists_by_id
+
+# Built once at import time; each call only supplies the bound parameters
+_GET_BY_IDS = select_by_ids(Extraction)
+_EXISTS = select_exists_by_id(Extraction)
+_GET_BY_DOCUMENT = (
+    select(Extraction)
+    .where(Extraction.document_id == bindparam("document_id"))
+    .order_by(Extraction.created_at.desc())
+)
+_GET_METADATA_BY_DOCUMENT = (
+    select(
+        Extraction.id,
+        Extraction.document_id,
+        Extraction.statement_type,
+        Extraction.created_at,
+    )
+    .where(Extraction.document_id == bindparam("document_id"))
+    .order_by(Extraction.created_at.desc())
+)
+_GET_BY_DOCUMENTS = (
+    select(Extraction)
+    .where(Extraction.document_id == any_(bindparam("document_ids", type_=ARRAY(Integer))))
+    .order_by(Extraction.created_at.desc())
+)
+# raw_data is read as JSON text so it can be forwarded without being decoded
+_RAW_COLUMNS = (
+    Extraction.id,
+    Extraction.document_id,
+    Extraction.statement_type,
+    cast(Extraction.raw_data, Text).label("raw_data"),
+    Extraction.created_at,
+)
+_GET_BY_DOCUMENT_RAW = _GET_BY_DOCUMENT.with_only_columns(*_RAW_COLUMNS)
+_GET_BY_DOCUMENTS_RAW = _GET_BY_DOCUMENTS.with_only_columns(*_RAW_COLUMNS)
+_GET_BY_DOCUMENT_AND_TYPE = (
+    select(Extraction)
+    .where(
+        Extraction.document_id == bindparam("document_id"),
+        Extraction.statement_type == bindparam("statement_type"),
+    )
+    .order_by(Extraction.created_at.desc())
+    .limit(1)
+)
+# The returned row doubles as the existence check
+_UPDATE_RAW_DATA = (
+    update(Extraction)
+    .where(Extraction.id == bindparam("extraction_id"))
+    .values(raw_data=bindparam("raw_data"))
+    .returning(Extraction)
+    .execution_options(populate_existing=True)
+)
+_DELETE = (
+    delete(Extraction).where(Extraction.id == bindparam("extraction_id")).returning(Extraction.id)
+)
+
+
+def _build_guarded_insert() -> Insert:
+    """Build the INSERT ... SELECT that only yields a row when the document exists."""
+    document_id = bindparam("document_id", type_=Extraction.document_id.type)
+    source = select(
+        document_id,
+        bindparam("statement_type", type_=Extraction.statement_type.type),
+        bindparam("raw_data", type_=Extraction.raw_data.type),
+    ).where(exists().where(Document.id == document_id))
+    return (
+        insert(Extraction)
+        .from_select(["document_id", "statement_type", "raw_data"], source)
+        .returning(Extraction)
+    )
+
+
+_GUARDED_INSERT = _build_guarded_insert()
 
 
 class ExtractionRepository(BaseRepository):
@@ -32,16 +119,62 @@ class ExtractionRepository(BaseRepository):
         Returns:
             Extraction model instance.
         """
-        extraction = Extraction(
-            document_id=document_id,
-            statement_type=statement_type,
-            raw_data=raw_data,
+        stmt = (
+            insert(Extraction)
+            .values(document_id=document_id, statement_type=statement_type, raw_data=raw_data)
+            .returning(Extraction)
         )
-        self.session.add(extraction)
-        await self.session.flush()
-        await self.session.refresh(extraction)
+        extraction = (await self.session.scalars(stmt)).one()
+        self._invalidate_cache()
+        return extraction
+
+    async def create_if_document_exists(
+        self,
+        document_id: int,
+        statement_type: str,
+        raw_data: dict[str, Any],
+    ) -> Extraction | None:
+        """Create a new extraction if its document exists, in a single statement.
+
+        Runs one INSERT ... SELECT whose SELECT only yields a row when the
+        document exists, so an unknown document is reported without a separate
+        lookup and without a foreign key violation aborting the transaction.
+
+        Args:
+            document_id: ID of the document this extraction belongs to.
+            statement_type: Type of financial statement (e.g., 'income_statement', 'balance_sheet').
+            raw_data: Raw extracted data as dictionary.
+
+        Returns:
+            Extraction model instance, or None if the document does not exist.
+        """
+        params = {
+            "document_id": document_id,
+            "statement_type": statement_type,
+            "raw_data": raw_data,
+        }
+        extraction = (await self.session.scalars(_GUARDED_INSERT, params)).one_or_none()
+        if extraction is not None:
+            self._invalidate_cache()
         return extraction
 
+    async def bulk_create(self, extractions: list[dict[str, Any]]) -> Sequence[Extraction]:
+        """Create many extractions with a single multi-row INSERT ... RETURNING.
+
+        Args:
+            extractions: Extraction field dictionaries with ``document_id``,
+                ``statement_type`` and ``raw_data`` keys.
+
+        Returns:
+            Created Extraction model instances, in the same order as ``extractions``.
+        """
+        if not extractions:
+            return []
+        stmt = insert(Extraction).returning(Extraction, sort_by_parameter_order=True)
+        result = await self.session.scalars(stmt, extractions)
+        self._invalidate_cache()
+        return result.all()
+
     async def get_by_id(self, extraction_id: int) -> Extraction | None:
         """Get extraction by ID.
 
@@ -53,7 +186,43 @@ class ExtractionRepository(BaseRepository):
         """
         return await self.session.get(Extraction, extraction_id)
 
-    async def get_by_document(self, document_id: int) -> list[Extraction]:
+    async def exists(self, extraction_id: int) -> bool:
+        """Check whether an extraction exists without loading it.
+
+        Args:
+            extraction_id: Extraction ID.
+
+        Returns:
+            True if the extraction exists, False otherwise.
+        """
+        return bool(await self.session.scalar(_EXISTS, {"id": extraction_id}))
+
+    async def get_by_ids(self, extraction_ids: list[int]) -> Sequence[Extraction]:
+        """Get extractions by IDs in a single query.
+
+        Args:
+            extraction_ids: Extraction IDs. Unknown IDs are omitted from the result.
+
+        Returns:
+            List of Extraction model instances in the order of ``extraction_ids``.
+        """
+        if not extraction_ids:
+            return []
+        result = await self.session.scalars(_GET_BY_IDS, {"ids": extraction_ids})
+        return result.all()
+
+    async def get_many_by_ids(self, extraction_ids: list[int]) -> dict[int, Extraction]:
+        """Get extractions by IDs in a single query.
+
+        Args:
+            extraction_ids: Extraction IDs. Unknown IDs are omitted from the result.
+
+        Returns:
+            Dictionary mapping extraction ID to Extraction model instance.
+        """
+        return {extraction.id: extraction for extraction in await self.get_by_ids(extraction_ids)}
+
+    async def get_by_document(self, document_id: int) -> Sequence[Extraction]:
         """Get all extractions for a document.
 
         Args:
@@ -62,13 +231,76 @@ class ExtractionRepository(BaseRepository):
         Returns:
             List of Extraction model instances.
         """
-        stmt = (
-            select(Extraction)
-            .where(Extraction.document_id == document_id)
-            .order_by(Extraction.created_at.desc())
-        )
-        result = await self.session.execute(stmt)
-        return list(result.scalars().all())
+        result = await self.session.execute(_GET_BY_DOCUMENT, {"document_id": document_id})
+        return result.scalars().all()
+
+    async def get_many_by_document(self, document_ids: list[int]) -> dict[int, list[Extraction]]:
+        """Get all extractions for several documents in a single query.
+
+        Args:
+            document_ids: Document IDs.
+
+        Returns:
+            Dictionary mapping each requested document ID to its extractions,
+            newest first. Documents without extractions map to an empty list.
+        """
+        extractions: dict[int, list[Extraction]] = {document_id: [] for document_id in document_ids}
+        if not document_ids:
+            return extractions
+        result = await self.session.scalars(_GET_BY_DOCUMENTS, {"document_ids": list(extractions)})
+        for extraction in result:
+            extractions[extraction.document_id].append(extraction)
+        return extractions
+
+    async def get_by_document_raw(self, document_id: int) -> list[dict[str, Any]]:
+        """Get all extractions for a document without decoding their data.
+
+        Intended for read paths that only forward ``raw_data`` to a client, so
+        the JSONB document is never parsed into Python objects and re-serialized.
+
+        Args:
+            document_id: Document ID.
+
+        Returns:
+            List of row dictionaries whose ``raw_data`` value is a JSON string,
+            newest first.
+        """
+        result = await self.session.execute(_GET_BY_DOCUMENT_RAW, {"document_id": document_id})
+        return [dict(row) for row in result.mappings()]
+
+    async def get_many_by_document_raw(
+        self, document_ids: list[int]
+    ) -> dict[int, list[dict[str, Any]]]:
+        """Get all extractions for several documents without decoding their data.
+
+        Args:
+            document_ids: Document IDs.
+
+        Returns:
+            Dictionary mapping each requested document ID to its extraction rows,
+            whose ``raw_data`` value is a JSON string, newest first. Documents
+            without extractions map to an empty list.
+        """
+        rows: dict[int, list[dict[str, Any]]] = {document_id: [] for document_id in document_ids}
+        if not document_ids:
+            return rows
+        result = await self.session.execute(_GET_BY_DOCUMENTS_RAW, {"document_ids": list(rows)})
+        for row in result.mappings():
+            rows[row["document_id"]].append(dict(row))
+        return rows
+
+    async def get_metadata_by_document(self, document_id: int) -> list[dict[str, Any]]:
+        """Get extraction metadata for a document without the ``raw_data`` payload.
+
+        Args:
+            document_id: Document ID.
+
+        Returns:
+            List of row dictionaries with ``id``, ``document_id``, ``statement_type``
+            and ``created_at``, newest first.
+        """
+        result = await self.session.execute(_GET_METADATA_BY_DOCUMENT, {"document_id": document_id})
+        return [dict(row) for row in result.mappings()]
 
     async def get_by_document_and_type(
         self, document_id: int, statement_type: str
@@ -82,17 +314,15 @@ class ExtractionRepository(BaseRepository):
         Returns:
             Extraction model instance, or None if not found.
         """
-        stmt = (
-            select(Extraction)
-            .where(
-                Extraction.document_id == document_id,
-                Extraction.statement_type == statement_type,
+
+        async def load() -> Extraction | None:
+            result = await self.session.execute(
+                _GET_BY_DOCUMENT_AND_TYPE,
+                {"document_id": document_id, "statement_type": statement_type},
             )
-            .order_by(Extraction.created_at.desc())
-            .limit(1)
-        )
-        result = await self.session.execute(stmt)
-        return result.scalar_one_or_none()
+            return result.scalar_one_or_none()
+
+        return await self._cached(("document_and_type", document_id, statement_type), load)
 
     async def update(
         self,
@@ -108,16 +338,14 @@ class ExtractionRepository(BaseRepository):
         Returns:
             Extraction model instance, or None if not found.
         """
-        extraction = await self.session.get(Extraction, extraction_id)
-        if extraction is None:
-            return None
-
-        if raw_data is not None:
-            extraction.raw_data = raw_data
+        if raw_data is None:
+            return await self.session.get(Extraction, extraction_id)
 
-        await self.session.flush()
-        await self.session.refresh(extraction)
-        return extraction
+        result = await self.session.scalars(
+            _UPDATE_RAW_DATA, {"extraction_id": extraction_id, "raw_data": raw_data}
+        )
+        self._invalidate_cache()
+        return result.one_or_none()
 
     async def delete(self, extraction_id: int) -> bool:
         """Delete an extraction by ID.
@@ -128,10 +356,6 @@ class ExtractionRepository(BaseRepository):
         Returns:
             True if extraction was deleted, False otherwise.
         """
-        extraction = await self.session.get(Extraction, extraction_id)
-        if extraction is None:
-            return False
-
-        await self.session.delete(extraction)
-        await self.session.flush()
-        return True
+        result = await self.session.execute(_DELETE, {"extraction_id": extraction_id})
+        self._invalidate_cache()
+        return result.scalar_one_or_none() is not None
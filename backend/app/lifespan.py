@@ -8,10 +8,13 @@ Author: Patryk Golabek
 Copyright: 2025 Patryk Golabek
 """
 
+import asyncio
 import logging
-from contextlib import asynccontextmanager
+from contextlib import AsyncExitStack, asynccontextmanager
 
 from fastapi import FastAPI
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import QueuePool
 
 from app.db.base import async_engine
 from config import Settings
@@ -36,13 +39,90 @@ class LifespanManager:
         self.logger = logger
         self.settings = settings
 
+    async def _warm_pool(self, engine: AsyncEngine) -> None:
+        """
+        Open pool connections up front so early requests skip the connection handshake.
+
+        The connections are held open together, so the pool ends up with that
+        many distinct idle connections. No more than the pool size are opened,
+        since overflow connections are closed rather than kept once returned.
+        Startup waits for them for at most ``db_pool_warm_timeout`` seconds. A
+        failure or timeout is logged and startup continues; the pool then
+        connects lazily as before.
+
+        Args:
+            engine (AsyncEngine): The async engine whose pool should be warmed.
+        """
+        count = self.settings.db_pool_warm_connections
+        if count == 0:
+            return
+        if isinstance(engine.pool, QueuePool):
+            count = min(count, engine.pool.size())
+        try:
+            # The task group cancels and awaits the remaining connects when one
+            # fails, so every connection opened has been pushed onto the stack
+            # by the time the stack closes them
+            async with (
+                asyncio.timeout(self.settings.db_pool_warm_timeout),
+                AsyncExitStack() as stack,
+                asyncio.TaskGroup() as group,
+            ):
+                for _ in range(count):
+                    group.create_task(stack.enter_async_context(engine.connect()))
+            self.logger.info("Database pool warmed with %d connections.", count)
+        except Exception as e:
+            self.logger.warning("Database pool warm-up failed: %r", e)
+
+    async def _warm_storage(self) -> None:
+        """
+        Build the shared storage service before the first request needs it.
+
+        Creating the MinIO client checks the bucket with blocking HTTP calls, so
+        this runs it in a worker thread at startup rather than on the event loop
+        inside a request. A failure is logged and the service is built on first
+        use instead.
+        """
+        if not self.settings.minio_enabled:
+            return
+        # Imported here, like the API routers, so importing the app package does
+        # not load every service module
+        from app.services.dependencies import get_shared_storage_service
+
+        try:
+            await asyncio.to_thread(get_shared_storage_service)
+            self.logger.info("Storage service initialized.")
+        except Exception as e:
+            self.logger.warning("Storage service warm-up failed: %r", e)
+
+    async def _close_cache(self) -> None:
+        """
+        Close the Redis connections of the shared compiled statement cache.
+
+        The cache is only closed if a request built it, and is dropped so a
+        later build opens a new client. A failure is logged and shutdown
+        continues.
+        """
+        from app.services.dependencies import get_shared_compiled_statement_cache
+
+        if get_shared_compiled_statement_cache.cache_info().currsize == 0:
+            return
+        cache = get_shared_compiled_statement_cache()
+        get_shared_compiled_statement_cache.cache_clear()
+        if cache is None:
+            return
+        try:
+            await cache.aclose()
+        except Exception as e:
+            self.logger.warning("Compiled statement cache close failed: %r", e)
+
     @asynccontextmanager
     async def lifespan(self, app: FastAPI):
         """
         Lifespan event handler to initialize and cleanup resources.
 
         This context manager stores the async database engine in app state
-        and ensures proper cleanup of resources upon application shutdown.
+        and ensures proper cleanup of resources upon application shutdown,
+        including the shared compiled statement cache's Redis client.
 
         Args:
             app (FastAPI): The FastAPI application instance.
@@ -54,6 +134,9 @@ class LifespanManager:
             # Store the async engine in app state for repository access
             app.state.async_engine = async_engine
             self.logger.info("Database async engine initialized successfully.")
+            self.logger.info("Database pool at startup: %s", async_engine.pool.status())
+            await self._warm_pool(async_engine)
+            await self._warm_storage()
 
             # Yield control to the application to start processing
             yield
@@ -63,5 +146,8 @@ class LifespanManager:
             raise
         finally:
             # Cleanup async engine
+            pool_status = async_engine.pool.status()
             await async_engine.dispose()
+            await self._close_cache()
+            self.logger.info("Database pool at shutdown: %s", pool_status)
             self.logger.info("Application is shutting down...")
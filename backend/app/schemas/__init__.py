@@ -2,41 +2,84 @@
 Pydantic schemas for request/response validation.
 
 This module exports all Pydantic schemas used for API request/response validation.
+Schemas are imported from their submodule on first access, so importing one
+schema module does not build the validators of every other one.
 
 Author: Patryk Golabek
 Copyright: 2025 Patryk Golabek
 """
 
-from app.schemas.company import (
-    CompanyCreate,
-    CompanyResponse,
-    CompanyUpdate,
-)
-from app.schemas.document import (
-    DocumentCreate,
-    DocumentResponse,
-    DocumentUpdate,
-)
-from app.schemas.extraction import (
-    CompiledStatementCreate,
-    CompiledStatementResponse,
-    CompiledStatementUpdate,
-    ExtractionCreate,
-    ExtractionResponse,
-    ExtractionUpdate,
-)
+from typing import TYPE_CHECKING
+
+from app.utils.lazy_imports import lazy_imports
+
+if TYPE_CHECKING:
+    from app.schemas.company import (
+        CompanyCreate,
+        CompanyDomain,
+        CompanyResponse,
+        CompanyUpdate,
+    )
+    from app.schemas.document import (
+        DocumentBatchGetByCompany,
+        DocumentCreate,
+        DocumentResponse,
+        DocumentUpdate,
+    )
+    from app.schemas.extraction import (
+        CompiledStatementBatchGet,
+        CompiledStatementCreate,
+        CompiledStatementResponse,
+        CompiledStatementSummary,
+        CompiledStatementUpdate,
+        ExtractionBatchGetByDocument,
+        ExtractionCreate,
+        ExtractionResponse,
+        ExtractionSummary,
+        ExtractionUpdate,
+    )
+
+# Exported name -> submodule defining it
+_LAZY_IMPORTS = {
+    "CompanyCreate": "app.schemas.company",
+    "CompanyDomain": "app.schemas.company",
+    "CompanyResponse": "app.schemas.company",
+    "CompanyUpdate": "app.schemas.company",
+    "DocumentBatchGetByCompany": "app.schemas.document",
+    "DocumentCreate": "app.schemas.document",
+    "DocumentResponse": "app.schemas.document",
+    "DocumentUpdate": "app.schemas.document",
+    "ExtractionBatchGetByDocument": "app.schemas.extraction",
+    "ExtractionCreate": "app.schemas.extraction",
+    "ExtractionResponse": "app.schemas.extraction",
+    "ExtractionSummary": "app.schemas.extraction",
+    "ExtractionUpdate": "app.schemas.extraction",
+    "CompiledStatementBatchGet": "app.schemas.extraction",
+    "CompiledStatementCreate": "app.schemas.extraction",
+    "CompiledStatementResponse": "app.schemas.extraction",
+    "CompiledStatementSummary": "app.schemas.extraction",
+    "CompiledStatementUpdate": "app.schemas.extraction",
+}
 
 __all__ = [
     "CompanyCreate",
+    "CompanyDomain",
     "CompanyResponse",
     "CompanyUpdate",
+    "DocumentBatchGetByCompany",
     "DocumentCreate",
     "DocumentResponse",
     "DocumentUpdate",
+    "ExtractionBatchGetByDocument",
     "ExtractionCreate",
     "ExtractionResponse",
+    "ExtractionSummary",
     "ExtractionUpdate",
+    "CompiledStatementBatchGet",
     "CompiledStatementCreate",
     "CompiledStatementResponse",
+    "CompiledStatementSummary",
     "CompiledStatementUpdate",
 ]
+
+lazy_imports(__name__, _LAZY_IMPORTS)
@@ -52,7 +52,13 @@ class CompanyDomain(CompanyBase):
     id: int = Field(..., description="Company ID")
     created_at: datetime | None = Field(None, description="Creation timestamp")
 
-    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+    model_config = ConfigDict(
+        from_attributes=True,
+        populate_by_name=True,
+        frozen=True,
+        revalidate_instances="never",
+        extra="ignore",
+    )
 
 
 class CompanyResponse(CompanyDomain):
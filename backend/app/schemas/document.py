@@ -9,6 +9,9 @@ from datetime import datetime
 
 from pydantic import BaseModel, ConfigDict, Field
 
+# Upper bound on company IDs accepted by one batch document lookup
+MAX_BATCH_COMPANY_IDS = 100
+
 
 class DocumentBase(BaseModel):
     """Base schema for Document with common fields."""
@@ -39,10 +42,24 @@ class DocumentUpdate(BaseModel):
     file_path: str | None = Field(None, description="Local file path if downloaded")
 
 
+class DocumentBatchGetByCompany(BaseModel):
+    """Schema for fetching the documents of several companies in one request."""
+
+    company_ids: list[int] = Field(
+        ..., description="Company IDs whose documents to fetch", max_length=MAX_BATCH_COMPANY_IDS
+    )
+
+
 class DocumentResponse(DocumentBase):
     """Schema for document response."""
 
     id: int = Field(..., description="Document ID")
     created_at: datetime | None = Field(None, description="Creation timestamp")
 
-    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+    model_config = ConfigDict(
+        from_attributes=True,
+        populate_by_name=True,
+        frozen=True,
+        revalidate_instances="never",
+        extra="ignore",
+    )
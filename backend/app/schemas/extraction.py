@@ -10,6 +10,9 @@ from typing import Any
 
 from pydantic import BaseModel, ConfigDict, Field
 
+# Upper bound on IDs accepted by one batch lookup
+MAX_BATCH_GET_IDS = 500
+
 
 # Extraction schemas
 class ExtractionBase(BaseModel):
@@ -34,13 +37,43 @@ class ExtractionUpdate(BaseModel):
     raw_data: dict[str, Any] | None = Field(None, description="Raw extracted data as dictionary")
 
 
+class ExtractionBatchGetByDocument(BaseModel):
+    """Schema for fetching the extractions of several documents in one request."""
+
+    document_ids: list[int] = Field(
+        ..., description="Document IDs whose extractions to fetch", max_length=MAX_BATCH_GET_IDS
+    )
+
+
+class ExtractionSummary(BaseModel):
+    """Schema for extraction metadata without the ``raw_data`` payload."""
+
+    id: int = Field(..., description="Extraction ID")
+    document_id: int = Field(..., description="Document ID")
+    statement_type: str = Field(..., description="Statement type")
+    created_at: datetime | None = Field(None, description="Creation timestamp")
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        frozen=True,
+        revalidate_instances="never",
+        extra="ignore",
+    )
+
+
 class ExtractionResponse(ExtractionBase):
     """Schema for extraction response."""
 
     id: int = Field(..., description="Extraction ID")
     created_at: datetime | None = Field(None, description="Creation timestamp")
 
-    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+    model_config = ConfigDict(
+        from_attributes=True,
+        populate_by_name=True,
+        frozen=True,
+        revalidate_instances="never",
+        extra="ignore",
+    )
 
 
 # CompiledStatement schemas
@@ -66,10 +99,40 @@ class CompiledStatementUpdate(BaseModel):
     data: dict[str, Any] | None = Field(None, description="Compiled financial data as dictionary")
 
 
+class CompiledStatementBatchGet(BaseModel):
+    """Schema for fetching several compiled statements by ID in one request."""
+
+    ids: list[int] = Field(
+        ..., description="Compiled statement IDs to fetch", max_length=MAX_BATCH_GET_IDS
+    )
+
+
+class CompiledStatementSummary(BaseModel):
+    """Schema for compiled statement metadata without the ``data`` payload."""
+
+    id: int = Field(..., description="Compiled statement ID")
+    company_id: int = Field(..., description="Company ID")
+    statement_type: str = Field(..., description="Statement type")
+    updated_at: datetime | None = Field(None, description="Last update timestamp")
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        frozen=True,
+        revalidate_instances="never",
+        extra="ignore",
+    )
+
+
 class CompiledStatementResponse(CompiledStatementBase):
     """Schema for compiled statement response."""
 
     id: int = Field(..., description="Compiled statement ID")
     updated_at: datetime | None = Field(None, description="Last update timestamp")
 
-    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+    model_config = ConfigDict(
+        from_attributes=True,
+        populate_by_name=True,
+        frozen=True,
+        revalidate_instances="never",
+        extra="ignore",
+    )
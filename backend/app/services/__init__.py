@@ -2,16 +2,30 @@
 Service layer for business logic.
 
 This module exports all service classes that contain business logic
-and coordinate between repositories and API endpoints.
+and coordinate between repositories and API endpoints. Services are imported
+from their submodule on first access.
 
 Author: Patryk Golabek
 Copyright: 2025 Patryk Golabek
 """
 
-from app.services.company import CompanyService
-from app.services.compiled_statement import CompiledStatementService
-from app.services.document import DocumentService
-from app.services.extraction import ExtractionService
+from typing import TYPE_CHECKING
+
+from app.utils.lazy_imports import lazy_imports
+
+if TYPE_CHECKING:
+    from app.services.company import CompanyService
+    from app.services.compiled_statement import CompiledStatementService
+    from app.services.document import DocumentService
+    from app.services.extraction import ExtractionService
+
+# Exported name -> submodule defining it
+_LAZY_IMPORTS = {
+    "CompanyService": "app.services.company",
+    "DocumentService": "app.services.document",
+    "ExtractionService": "app.services.extraction",
+    "CompiledStatementService": "app.services.compiled_statement",
+}
 
 __all__ = [
     "CompanyService",
@@ -19,3 +33,5 @@ __all__ = [
     "ExtractionService",
     "CompiledStatementService",
 ]
+
+lazy_imports(__name__, _LAZY_IMPORTS)
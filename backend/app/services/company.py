@@ -5,24 +5,127 @@ Author: Patryk Golabek
 Copyright: 2025 Patryk Golabek
 """
 
+from collections.abc import AsyncIterator, Iterable
+from functools import partial
+
+import orjson
+from pydantic import TypeAdapter
+
+from app.core.cache import CompiledStatementCache
 from app.core.exceptions.db_exceptions import BaseDatabaseError
 from app.core.exceptions.service_exceptions import EntityNotFoundError, ServiceUnavailableError
 from app.core.exceptions.translators import translate_db_exception_to_service
+from app.db.hooks import after_commit
 from app.db.models.company import Company
 from app.db.repositories.company import CompanyRepository
 from app.schemas.company import CompanyCreate, CompanyDomain, CompanyUpdate
+from app.utils.ttl_cache import TTLCache
+
+# Validates a whole page of rows in one pydantic-core call
+_DOMAIN_LIST_ADAPTER = TypeAdapter(list[CompanyDomain])
+
+# Process-wide caches of detached CompanyDomain objects for the per-request lookups.
+# Writes through this process evict entries once they commit; the TTL bounds
+# staleness for writes made by other processes.
+COMPANY_CACHE_TTL = 60.0
+_COMPANIES_BY_ID: TTLCache[int, CompanyDomain] = TTLCache(maxsize=1024, ttl=COMPANY_CACHE_TTL)
+_COMPANIES_BY_TICKER: TTLCache[str, CompanyDomain] = TTLCache(maxsize=1024, ttl=COMPANY_CACHE_TTL)
+# IDs confirmed by existence checks, which never load the row itself
+_KNOWN_COMPANY_IDS: TTLCache[int, bool] = TTLCache(maxsize=10_000, ttl=COMPANY_CACHE_TTL)
+
+
+def clear_company_cache() -> None:
+    """Drop every cached company lookup."""
+    _COMPANIES_BY_ID.clear()
+    _COMPANIES_BY_TICKER.clear()
+    _KNOWN_COMPANY_IDS.clear()
+
+
+async def company_exists(repository: CompanyRepository, company_id: int) -> bool:
+    """Check that a company exists, answering from the caches when possible.
+
+    On a miss the database is asked with ``SELECT EXISTS`` rather than loading
+    the row. Only confirmed IDs are cached, so a company created elsewhere is
+    visible at once.
+
+    Args:
+        repository: Repository to query on a cache miss.
+        company_id: Company ID.
+
+    Returns:
+        True if the company exists, False otherwise.
+    """
+    if _is_known_company(company_id):
+        return True
+    if not await repository.exists(company_id):
+        return False
+    _KNOWN_COMPANY_IDS.set(company_id, True)
+    return True
+
+
+async def _evict_company(company_id: int | None) -> None:
+    """Evict cached lookups made stale by a committed write.
+
+    Ticker lookups are dropped wholesale, since a write can move a ticker
+    between companies or change which company it resolves to first.
+
+    Args:
+        company_id: ID of the written company, if it already existed.
+    """
+    if company_id is not None:
+        _COMPANIES_BY_ID.pop(company_id)
+        _KNOWN_COMPANY_IDS.pop(company_id)
+    _COMPANIES_BY_TICKER.clear()
+
+
+def _is_known_company(company_id: int) -> bool:
+    """Check whether a company ID is confirmed by one of the caches."""
+    return bool(_KNOWN_COMPANY_IDS.get(company_id)) or _COMPANIES_BY_ID.get(company_id) is not None
+
+
+async def missing_company_ids(
+    repository: CompanyRepository, company_ids: Iterable[int]
+) -> set[int]:
+    """Find which of several companies do not exist, answering from the caches when possible.
+
+    Only the IDs no cache can confirm are sent to the database, in one query.
+
+    Args:
+        repository: Repository to query for the unconfirmed IDs.
+        company_ids: Company IDs to check.
+
+    Returns:
+        Subset of ``company_ids`` that do not belong to existing companies.
+    """
+    unknown = {company_id for company_id in company_ids if not _is_known_company(company_id)}
+    if not unknown:
+        return set()
+    found = await repository.existing_ids(unknown)
+    for company_id in found:
+        _KNOWN_COMPANY_IDS.set(company_id, True)
+    return unknown - found
 
 
 class CompanyService:
     """Service for managing company business logic."""
 
-    def __init__(self, company_repository: CompanyRepository):
+    # Built per request, so instances carry no __dict__
+    __slots__ = ("repository", "statement_cache")
+
+    def __init__(
+        self,
+        company_repository: CompanyRepository,
+        statement_cache: CompiledStatementCache | None = None,
+    ):
         """Initialize service with repository.
 
         Args:
             company_repository: Repository for company database operations.
+            statement_cache: Optional Redis cache of compiled statements. Deleting
+                a company drops its cached statements, which the delete cascades to.
         """
         self.repository = company_repository
+        self.statement_cache = statement_cache
 
     def _model_to_domain(self, company: Company) -> CompanyDomain:
         """Convert Company model to CompanyDomain schema.
@@ -35,6 +138,17 @@ class CompanyService:
         """
         return CompanyDomain.model_validate(company)
 
+    def _evict(self, company_id: int | None = None) -> None:
+        """Evict cached lookups made stale by a write, once the write commits.
+
+        Evicting earlier would let a concurrent lookup refill the caches with
+        the old row until the entry expires.
+
+        Args:
+            company_id: ID of the written company, if it already existed.
+        """
+        after_commit(self.repository.session, partial(_evict_company, company_id))
+
     async def create_company(self, company_data: CompanyCreate) -> CompanyDomain:
         """Create a new company.
 
@@ -55,6 +169,7 @@ class CompanyService:
                 primary_ticker=company_data.primary_ticker,
                 tickers=company_data.tickers,
             )
+            self._evict()
             return self._model_to_domain(company)
         except BaseDatabaseError as e:
             raise translate_db_exception_to_service(e) from e
@@ -77,13 +192,18 @@ class CompanyService:
             EntityNotFoundError: If company not found.
             ServiceUnavailableError: If database operation fails.
         """
+        cached = _COMPANIES_BY_ID.get(company_id)
+        if cached is not None:
+            return cached
         try:
             company = await self.repository.get_by_id(company_id)
             if not company:
                 raise EntityNotFoundError(entity_name="Company", entity_id=company_id)
-            return self._model_to_domain(company)
+            domain = self._model_to_domain(company)
         except BaseDatabaseError as e:
             raise translate_db_exception_to_service(e) from e
+        _COMPANIES_BY_ID.set(company_id, domain)
+        return domain
 
     async def get_company_by_ticker(self, ticker: str) -> CompanyDomain:
         """Get company by ticker symbol.
@@ -98,13 +218,19 @@ class CompanyService:
             EntityNotFoundError: If company not found.
             ServiceUnavailableError: If database operation fails.
         """
+        cached = _COMPANIES_BY_TICKER.get(ticker)
+        if cached is not None:
+            return cached
         try:
             company = await self.repository.get_by_ticker(ticker)
             if not company:
                 raise EntityNotFoundError(entity_name="Company", entity_id=ticker)
-            return self._model_to_domain(company)
+            domain = self._model_to_domain(company)
         except BaseDatabaseError as e:
             raise translate_db_exception_to_service(e) from e
+        _COMPANIES_BY_TICKER.set(ticker, domain)
+        _COMPANIES_BY_ID.set(domain.id, domain)
+        return domain
 
     async def get_all_companies(self, skip: int = 0, limit: int = 100) -> list[CompanyDomain]:
         """Get all companies with pagination.
@@ -116,8 +242,43 @@ class CompanyService:
         Returns:
             List of CompanyDomain representing companies.
         """
-        companies = await self.repository.get_all(skip=skip, limit=limit)
-        return [self._model_to_domain(company) for company in companies]
+        rows = await self.repository.get_all_rows(skip=skip, limit=limit)
+        return _DOMAIN_LIST_ADAPTER.validate_python(rows)
+
+    async def get_all_companies_json(self, skip: int = 0, limit: int = 100) -> bytes:
+        """Get a page of companies serialized as a JSON array.
+
+        The rows hold exactly the CompanyDomain columns, already typed by the
+        database, so they are encoded by orjson without building models. The
+        output matches CompanyDomain serialization, including ``Z`` for UTC.
+
+        Args:
+            skip: Number of records to skip.
+            limit: Maximum number of records to return.
+
+        Returns:
+            UTF-8 encoded JSON array of companies.
+        """
+        rows = await self.repository.get_all_rows(skip=skip, limit=limit)
+        return orjson.dumps(rows, option=orjson.OPT_UTC_Z)
+
+    async def iter_companies(self, batch_size: int = 500) -> AsyncIterator[CompanyDomain]:
+        """Iterate over all companies through a server-side cursor.
+
+        Rows are converted as they arrive, so memory stays bounded by
+        ``batch_size`` however large the table is. The caller must keep the
+        repository's session open until iteration finishes; request-scoped
+        sessions are closed before a streamed response body is sent, so this
+        suits exports and background jobs rather than StreamingResponse.
+
+        Args:
+            batch_size: Number of rows fetched from the cursor per round trip.
+
+        Yields:
+            CompanyDomain instances ordered by ID.
+        """
+        async for company in self.repository.iter_all(batch_size=batch_size):
+            yield self._model_to_domain(company)
 
     async def update_company(self, company_id: int, company_data: CompanyUpdate) -> CompanyDomain:
         """Update a company.
@@ -135,11 +296,6 @@ class CompanyService:
             ServiceUnavailableError: If database operation fails.
         """
         try:
-            # Check if company exists
-            existing = await self.repository.get_by_id(company_id)
-            if not existing:
-                raise EntityNotFoundError(entity_name="Company", entity_id=company_id)
-
             company = await self.repository.update(
                 company_id=company_id,
                 name=company_data.name,
@@ -148,10 +304,8 @@ class CompanyService:
                 tickers=company_data.tickers,
             )
             if not company:
-                raise ServiceUnavailableError(
-                    message="Failed to update company",
-                    service_name="company_service",
-                )
+                raise EntityNotFoundError(entity_name="Company", entity_id=company_id)
+            self._evict(company_id)
             return self._model_to_domain(company)
         except BaseDatabaseError as e:
             raise translate_db_exception_to_service(e) from e
@@ -164,19 +318,17 @@ class CompanyService:
 
         Raises:
             EntityNotFoundError: If company not found.
-            ServiceUnavailableError: If deletion fails.
+            ServiceUnavailableError: If database operation fails.
         """
         try:
-            # Check if company exists
-            existing = await self.repository.get_by_id(company_id)
-            if not existing:
-                raise EntityNotFoundError(entity_name="Company", entity_id=company_id)
-
             deleted = await self.repository.delete(company_id)
             if not deleted:
-                raise ServiceUnavailableError(
-                    message="Failed to delete company",
-                    service_name="company_service",
-                )
+                raise EntityNotFoundError(entity_name="Company", entity_id=company_id)
         except BaseDatabaseError as e:
             raise translate_db_exception_to_service(e) from e
+        self._evict(company_id)
+        if self.statement_cache is not None:
+            after_commit(
+                self.repository.session,
+                partial(self.statement_cache.invalidate_company, company_id),
+            )
@@ -5,34 +5,55 @@ Author: Patryk Golabek
 Copyright: 2025 Patryk Golabek
 """
 
+from functools import partial
+
+import orjson
 from fastapi import HTTPException, status
+from pydantic import TypeAdapter
 
+from app.core.cache import CompiledStatementCache
+from app.db.hooks import after_commit
 from app.db.models.extraction import CompiledStatement
 from app.db.repositories.company import CompanyRepository
 from app.db.repositories.compiled_statement import CompiledStatementRepository
 from app.schemas.extraction import (
     CompiledStatementCreate,
     CompiledStatementResponse,
+    CompiledStatementSummary,
     CompiledStatementUpdate,
 )
+from app.services.company import company_exists, missing_company_ids
+from app.services.errors import all_not_found, not_found
+
+# Validates a company's statements in one pydantic-core call
+_RESPONSE_LIST_ADAPTER = TypeAdapter(list[CompiledStatementResponse])
+_SUMMARY_LIST_ADAPTER = TypeAdapter(list[CompiledStatementSummary])
+_RESPONSE_ADAPTER = TypeAdapter(CompiledStatementResponse)
 
 
 class CompiledStatementService:
     """Service for managing compiled statement business logic."""
 
+    # Built per request, so instances carry no __dict__
+    __slots__ = ("compiled_statement_repository", "company_repository", "statement_cache")
+
     def __init__(
         self,
         compiled_statement_repository: CompiledStatementRepository,
         company_repository: CompanyRepository,
+        statement_cache: CompiledStatementCache | None = None,
     ):
         """Initialize service with repositories.
 
         Args:
             compiled_statement_repository: Repository for compiled statement database operations.
             company_repository: Repository for company database operations.
+            statement_cache: Optional Redis cache for lookups by company and
+                statement type. Writes through this service invalidate it.
         """
         self.compiled_statement_repository = compiled_statement_repository
         self.company_repository = company_repository
+        self.statement_cache = statement_cache
 
     def _model_to_response(
         self, compiled_statement: CompiledStatement
@@ -47,6 +68,36 @@ class CompiledStatementService:
         """
         return CompiledStatementResponse.model_validate(compiled_statement)
 
+    def _invalidate(self, *keys: tuple[int, str]) -> None:
+        """Drop written compiled statements from the statement cache once committed.
+
+        Dropping the keys before the commit would let a concurrent read refill
+        them with the old rows, so the DEL is deferred to an after-commit hook.
+
+        Args:
+            *keys: (company ID, statement type) pairs just written.
+        """
+        if self.statement_cache is not None and keys:
+            after_commit(
+                self.compiled_statement_repository.session,
+                partial(self.statement_cache.invalidate, *keys),
+            )
+
+    async def _ensure_company_exists(self, company_id: int) -> None:
+        """Raise a 404 if the company does not exist.
+
+        Only needed to tell an unknown company apart from one without compiled
+        statements; found statements already prove the company exists.
+
+        Args:
+            company_id: Company ID.
+
+        Raises:
+            HTTPException: If company not found.
+        """
+        if not await company_exists(self.company_repository, company_id):
+            raise not_found("Company", company_id)
+
     async def create_compiled_statement(
         self, compiled_statement_data: CompiledStatementCreate
     ) -> CompiledStatementResponse:
@@ -59,30 +110,17 @@ class CompiledStatementService:
             CompiledStatementResponse representing the created compiled statement.
 
         Raises:
-            HTTPException: If company not found or creation fails.
+            HTTPException: If company not found.
         """
-        # Verify company exists
-        company = await self.company_repository.get_by_id(compiled_statement_data.company_id)
-        if not company:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=(f"Company with id {compiled_statement_data.company_id} not found"),
-            )
-
-        try:
-            compiled_statement = await self.compiled_statement_repository.upsert(
-                company_id=compiled_statement_data.company_id,
-                statement_type=compiled_statement_data.statement_type,
-                data=compiled_statement_data.data,
-            )
-            return self._model_to_response(compiled_statement)
-        except HTTPException:
-            raise
-        except Exception as e:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Error creating compiled statement: {str(e)}",
-            ) from e
+        compiled_statement = await self.compiled_statement_repository.upsert(
+            company_id=compiled_statement_data.company_id,
+            statement_type=compiled_statement_data.statement_type,
+            data=compiled_statement_data.data,
+        )
+        if not compiled_statement:
+            raise not_found("Company", compiled_statement_data.company_id)
+        self._invalidate((compiled_statement.company_id, compiled_statement.statement_type))
+        return self._model_to_response(compiled_statement)
 
     async def get_compiled_statement(self, compiled_statement_id: int) -> CompiledStatementResponse:
         """Get compiled statement by ID.
@@ -100,12 +138,28 @@ class CompiledStatementService:
             compiled_statement_id
         )
         if not compiled_statement:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=(f"Compiled statement with id {compiled_statement_id} not found"),
-            )
+            raise not_found("Compiled statement", compiled_statement_id)
         return self._model_to_response(compiled_statement)
 
+    async def get_compiled_statements_by_ids(
+        self, compiled_statement_ids: list[int]
+    ) -> list[CompiledStatementResponse]:
+        """Get several compiled statements by ID in a single query.
+
+        Args:
+            compiled_statement_ids: Compiled statement IDs. Duplicates are fetched
+                once and unknown IDs are omitted from the result.
+
+        Returns:
+            List of CompiledStatementResponse in the order of ``compiled_statement_ids``.
+        """
+        if not compiled_statement_ids:
+            return []
+        compiled_statements = await self.compiled_statement_repository.get_by_ids(
+            list(dict.fromkeys(compiled_statement_ids))
+        )
+        return _RESPONSE_LIST_ADAPTER.validate_python(compiled_statements, from_attributes=True)
+
     async def get_compiled_statements_by_company(
         self, company_id: int
     ) -> list[CompiledStatementResponse]:
@@ -120,22 +174,60 @@ class CompiledStatementService:
         Raises:
             HTTPException: If company not found.
         """
-        # Verify company exists
-        company = await self.company_repository.get_by_id(company_id)
-        if not company:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Company with id {company_id} not found",
-            )
-
         compiled_statements = await self.compiled_statement_repository.get_by_company(company_id)
-        return [self._model_to_response(stmt) for stmt in compiled_statements]
+        if not compiled_statements:
+            await self._ensure_company_exists(company_id)
+        return _RESPONSE_LIST_ADAPTER.validate_python(compiled_statements, from_attributes=True)
+
+    async def get_compiled_statement_summaries_by_company(
+        self, company_id: int
+    ) -> list[CompiledStatementSummary]:
+        """Get compiled statement metadata for a company without loading ``data``.
+
+        Args:
+            company_id: Company ID.
+
+        Returns:
+            List of CompiledStatementSummary for the company's compiled statements.
+
+        Raises:
+            HTTPException: If company not found.
+        """
+        rows = await self.compiled_statement_repository.get_metadata_by_company(company_id)
+        if not rows:
+            await self._ensure_company_exists(company_id)
+        return _SUMMARY_LIST_ADAPTER.validate_python(rows)
+
+    async def get_compiled_statements_by_company_json(self, company_id: int) -> bytes:
+        """Get all compiled statements for a company as a serialized JSON array.
+
+        The stored ``data`` documents are spliced into the output verbatim with
+        ``orjson.Fragment`` instead of being decoded and re-encoded.
+
+        Args:
+            company_id: Company ID.
+
+        Returns:
+            JSON array of compiled statements, encoded as UTF-8 bytes.
+
+        Raises:
+            HTTPException: If company not found.
+        """
+        rows = await self.compiled_statement_repository.get_by_company_raw(company_id)
+        if not rows:
+            await self._ensure_company_exists(company_id)
+        for row in rows:
+            row["data"] = orjson.Fragment(row["data"])
+        return orjson.dumps(rows, option=orjson.OPT_UTC_Z)
 
     async def get_compiled_statement_by_company_and_type(
         self, company_id: int, statement_type: str
     ) -> CompiledStatementResponse:
         """Get compiled statement by company and statement type.
 
+        Served from the statement cache when one is configured; a database hit
+        fills it for later requests.
+
         Args:
             company_id: Company ID.
             statement_type: Type of financial statement.
@@ -146,18 +238,68 @@ class CompiledStatementService:
         Raises:
             HTTPException: If company or compiled statement not found.
         """
-        # Verify company exists
-        company = await self.company_repository.get_by_id(company_id)
-        if not company:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Company with id {company_id} not found",
+        if self.statement_cache is not None:
+            cached = await self.statement_cache.get(company_id, statement_type)
+            if cached is not None:
+                return CompiledStatementResponse.model_validate_json(cached)
+
+        response = await self._load_by_company_and_type(company_id, statement_type)
+        if self.statement_cache is not None:
+            await self.statement_cache.set(
+                company_id, statement_type, _RESPONSE_ADAPTER.dump_json(response)
             )
+        return response
+
+    async def get_compiled_statement_by_company_and_type_json(
+        self, company_id: int, statement_type: str
+    ) -> bytes:
+        """Get a compiled statement by company and statement type as serialized JSON.
+
+        A cached statement is returned as stored, without being parsed and
+        serialized again. A database hit is serialized once, and the same bytes
+        fill the cache and are returned.
+
+        Args:
+            company_id: Company ID.
+            statement_type: Type of financial statement.
+
+        Returns:
+            JSON object of the compiled statement, encoded as UTF-8 bytes.
+
+        Raises:
+            HTTPException: If company or compiled statement not found.
+        """
+        if self.statement_cache is not None:
+            cached = await self.statement_cache.get(company_id, statement_type)
+            if cached is not None:
+                return cached
+
+        response = await self._load_by_company_and_type(company_id, statement_type)
+        payload = _RESPONSE_ADAPTER.dump_json(response)
+        if self.statement_cache is not None:
+            await self.statement_cache.set(company_id, statement_type, payload)
+        return payload
+
+    async def _load_by_company_and_type(
+        self, company_id: int, statement_type: str
+    ) -> CompiledStatementResponse:
+        """Read a compiled statement by company and statement type from the database.
 
+        Args:
+            company_id: Company ID.
+            statement_type: Type of financial statement.
+
+        Returns:
+            CompiledStatementResponse representing the compiled statement.
+
+        Raises:
+            HTTPException: If company or compiled statement not found.
+        """
         compiled_statement = await self.compiled_statement_repository.get_by_company_and_type(
             company_id, statement_type
         )
         if not compiled_statement:
+            await self._ensure_company_exists(company_id)
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=(
@@ -182,34 +324,16 @@ class CompiledStatementService:
             CompiledStatementResponse representing the updated compiled statement.
 
         Raises:
-            HTTPException: If compiled statement not found or update fails.
+            HTTPException: If compiled statement not found.
         """
-        # Check if compiled statement exists
-        existing = await self.compiled_statement_repository.get_by_id(compiled_statement_id)
-        if not existing:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=(f"Compiled statement with id {compiled_statement_id} not found"),
-            )
-
-        try:
-            compiled_statement = await self.compiled_statement_repository.update(
-                compiled_statement_id=compiled_statement_id,
-                data=compiled_statement_data.data,
-            )
-            if not compiled_statement:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail="Failed to update compiled statement",
-                )
-            return self._model_to_response(compiled_statement)
-        except HTTPException:
-            raise
-        except Exception as e:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Error updating compiled statement: {str(e)}",
-            ) from e
+        compiled_statement = await self.compiled_statement_repository.update(
+            compiled_statement_id=compiled_statement_id,
+            data=compiled_statement_data.data,
+        )
+        if not compiled_statement:
+            raise not_found("Compiled statement", compiled_statement_id)
+        self._invalidate((compiled_statement.company_id, compiled_statement.statement_type))
+        return self._model_to_response(compiled_statement)
 
     async def upsert_compiled_statement(
         self, compiled_statement_data: CompiledStatementCreate
@@ -223,30 +347,50 @@ class CompiledStatementService:
             CompiledStatementResponse representing the compiled statement.
 
         Raises:
-            HTTPException: If company not found or upsert fails.
+            HTTPException: If company not found.
         """
-        # Verify company exists
-        company = await self.company_repository.get_by_id(compiled_statement_data.company_id)
-        if not company:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=(f"Company with id {compiled_statement_data.company_id} not found"),
-            )
+        compiled_statement = await self.compiled_statement_repository.upsert(
+            company_id=compiled_statement_data.company_id,
+            statement_type=compiled_statement_data.statement_type,
+            data=compiled_statement_data.data,
+        )
+        if not compiled_statement:
+            raise not_found("Company", compiled_statement_data.company_id)
+        self._invalidate((compiled_statement.company_id, compiled_statement.statement_type))
+        return self._model_to_response(compiled_statement)
 
-        try:
-            compiled_statement = await self.compiled_statement_repository.upsert(
-                company_id=compiled_statement_data.company_id,
-                statement_type=compiled_statement_data.statement_type,
-                data=compiled_statement_data.data,
-            )
-            return self._model_to_response(compiled_statement)
-        except HTTPException:
-            raise
-        except Exception as e:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Error upserting compiled statement: {str(e)}",
-            ) from e
+    async def bulk_upsert_compiled_statements(
+        self, compiled_statements_data: list[CompiledStatementCreate]
+    ) -> list[CompiledStatementResponse]:
+        """Insert or update many compiled statements at once.
+
+        All companies are checked with one query and all statements are written
+        with one multi-row upsert, instead of two round trips per statement.
+
+        Args:
+            compiled_statements_data: Compiled statements to store. For repeated
+                (company, statement type) pairs the last entry wins.
+
+        Returns:
+            List of CompiledStatementResponse, one per distinct (company, statement type).
+
+        Raises:
+            HTTPException: If any company is not found.
+        """
+        if not compiled_statements_data:
+            return []
+
+        missing = await missing_company_ids(
+            self.company_repository, {item.company_id for item in compiled_statements_data}
+        )
+        if missing:
+            raise all_not_found("Companies", missing)
+
+        compiled_statements = await self.compiled_statement_repository.bulk_upsert(
+            [item.model_dump() for item in compiled_statements_data]
+        )
+        self._invalidate(*((cs.company_id, cs.statement_type) for cs in compiled_statements))
+        return _RESPONSE_LIST_ADAPTER.validate_python(compiled_statements, from_attributes=True)
 
     async def delete_compiled_statement(self, compiled_statement_id: int) -> None:
         """Delete a compiled statement by ID.
@@ -255,19 +399,9 @@ class CompiledStatementService:
             compiled_statement_id: Compiled statement ID.
 
         Raises:
-            HTTPException: If compiled statement not found or deletion fails.
+            HTTPException: If compiled statement not found.
         """
-        # Check if compiled statement exists
-        existing = await self.compiled_statement_repository.get_by_id(compiled_statement_id)
-        if not existing:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=(f"Compiled statement with id {compiled_statement_id} not found"),
-            )
-
         deleted = await self.compiled_statement_repository.delete(compiled_statement_id)
         if not deleted:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to delete compiled statement",
-            )
+            raise not_found("Compiled statement", compiled_statement_id)
+        self._invalidate(deleted)
@@ -8,19 +8,15 @@ Author: Patryk Golabek
 Copyright: 2025 Patryk Golabek
 """
 
+from functools import cache
 from typing import Annotated
 
 from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import CompiledStatementCache, create_compiled_statement_cache
 from app.core.storage import IStorageService, StorageServiceConfig, create_storage_service
-from app.db.dependencies import (
-    get_company_repository,
-    get_compiled_statement_repository,
-    get_document_repository,
-    get_extraction_repository,
-)
-
-# Runtime imports needed for type annotations
+from app.db.dependencies import get_db_session
 from app.db.repositories.company import CompanyRepository
 from app.db.repositories.compiled_statement import CompiledStatementRepository
 from app.db.repositories.document import DocumentRepository
@@ -29,96 +25,101 @@ from app.services.company import CompanyService
 from app.services.compiled_statement import CompiledStatementService
 from app.services.document import DocumentService
 from app.services.extraction import ExtractionService
-from config import Settings, get_settings
+from config import get_settings
+
+# The services and their repositories wrap the request's session, so they are
+# built per request. Each service depends on the session directly and builds
+# its repositories inline, keeping FastAPI's per-request dependency graph to
+# two nodes instead of one node per repository.
 
 
 async def get_company_service(
-    company_repository: Annotated[CompanyRepository, Depends(get_company_repository)],
+    session: Annotated[AsyncSession, Depends(get_db_session)],
 ) -> CompanyService:
     """Dependency function to get CompanyService instance.
 
     Args:
-        company_repository: Company repository (injected).
+        session: Async database session (injected).
 
     Returns:
         CompanyService instance.
     """
-    return CompanyService(company_repository)
+    return CompanyService(CompanyRepository(session), get_shared_compiled_statement_cache())
 
 
 async def get_document_service(
-    document_repository: Annotated[DocumentRepository, Depends(get_document_repository)],
-    company_repository: Annotated[CompanyRepository, Depends(get_company_repository)],
+    session: Annotated[AsyncSession, Depends(get_db_session)],
 ) -> DocumentService:
     """Dependency function to get DocumentService instance.
 
     Args:
-        document_repository: Document repository (injected).
-        company_repository: Company repository (injected).
+        session: Async database session (injected).
 
     Returns:
         DocumentService instance.
     """
-    return DocumentService(document_repository, company_repository)
+    return DocumentService(DocumentRepository(session), CompanyRepository(session))
 
 
 async def get_extraction_service(
-    extraction_repository: Annotated[ExtractionRepository, Depends(get_extraction_repository)],
-    document_repository: Annotated[DocumentRepository, Depends(get_document_repository)],
+    session: Annotated[AsyncSession, Depends(get_db_session)],
 ) -> ExtractionService:
     """Dependency function to get ExtractionService instance.
 
     Args:
-        extraction_repository: Extraction repository (injected).
-        document_repository: Document repository (injected).
+        session: Async database session (injected).
 
     Returns:
         ExtractionService instance.
     """
-    return ExtractionService(extraction_repository, document_repository)
+    return ExtractionService(ExtractionRepository(session), DocumentRepository(session))
 
 
 async def get_compiled_statement_service(
-    compiled_statement_repository: Annotated[
-        CompiledStatementRepository, Depends(get_compiled_statement_repository)
-    ],
-    company_repository: Annotated[CompanyRepository, Depends(get_company_repository)],
+    session: Annotated[AsyncSession, Depends(get_db_session)],
 ) -> CompiledStatementService:
     """Dependency function to get CompiledStatementService instance.
 
     Args:
-        compiled_statement_repository: Compiled statement repository (injected).
-        company_repository: Company repository (injected).
+        session: Async database session (injected).
 
     Returns:
         CompiledStatementService instance.
     """
-    return CompiledStatementService(compiled_statement_repository, company_repository)
+    return CompiledStatementService(
+        CompiledStatementRepository(session),
+        CompanyRepository(session),
+        get_shared_compiled_statement_cache(),
+    )
+
+
+@cache
+def get_shared_compiled_statement_cache() -> CompiledStatementCache | None:
+    """Get the process-wide compiled statement cache, building it on first use.
+
+    Returns:
+        CompiledStatementCache instance, or None if the cache is disabled.
+    """
+    return create_compiled_statement_cache(get_settings())
+
 
+@cache
+def get_shared_storage_service() -> IStorageService:
+    """Get the process-wide storage service, building it on first use.
 
-async def get_storage_service(
-    settings: Annotated[Settings, Depends(get_settings)] = None,
-) -> IStorageService:
+    Returns:
+        IStorageService instance.
+    """
+    return create_storage_service(StorageServiceConfig.from_settings(get_settings()))
+
+
+async def get_storage_service() -> IStorageService:
     """Dependency function to get IStorageService instance.
 
-    Args:
-        settings: Application settings (injected).
+    The service is shared across requests, so the MinIO client and its bucket
+    check are set up once per process rather than per request.
 
     Returns:
         IStorageService instance.
     """
-    from pathlib import Path
-
-    if settings is None:
-        settings = Settings()
-
-    config = StorageServiceConfig(
-        enabled=settings.minio_enabled,
-        endpoint=settings.minio_endpoint,
-        access_key=settings.minio_access_key,
-        secret_key=settings.minio_secret_key,
-        bucket_name=settings.minio_bucket_name,
-        use_ssl=settings.minio_use_ssl,
-        base_storage_path=Path(settings.pdf_storage_base_path),
-    )
-    return create_storage_service(config)
+    return get_shared_storage_service()
@@ -5,17 +5,67 @@ Author: Patryk Golabek
 Copyright: 2025 Patryk Golabek
 """
 
+import binascii
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime
+from typing import Any
+
+import orjson
 from fastapi import HTTPException, status
 
 from app.db.models.document import Document
 from app.db.repositories.company import CompanyRepository
-from app.db.repositories.document import DocumentRepository
+from app.db.repositories.document import DocumentCursor, DocumentRepository
 from app.schemas.document import DocumentCreate, DocumentResponse, DocumentUpdate
+from app.services.company import company_exists, missing_company_ids
+from app.services.errors import all_not_found, not_found
+
+
+def encode_cursor(row: dict[str, Any]) -> str:
+    """Encode the keyset cursor of a listed document as an opaque token.
+
+    Args:
+        row: Document row dictionary, the last one on a page.
+
+    Returns:
+        URL-safe token identifying the position after ``row``.
+    """
+    position = (row["fiscal_year"], row["created_at"], row["id"])
+    return urlsafe_b64encode(orjson.dumps(position)).decode()
+
+
+def decode_cursor(token: str) -> DocumentCursor:
+    """Decode a token produced by ``encode_cursor``.
+
+    Args:
+        token: Cursor token sent by the client.
+
+    Returns:
+        Keyset cursor of the last document already seen.
+
+    Raises:
+        HTTPException: If the token is not a valid cursor.
+    """
+    try:
+        fiscal_year, created_at, document_id = orjson.loads(urlsafe_b64decode(token))
+        return int(fiscal_year), datetime.fromisoformat(created_at), int(document_id)
+    except (binascii.Error, ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+        ) from None
+
+
+def _next_cursor(rows: list[dict[str, Any]], limit: int) -> str | None:
+    """Get the cursor of the next page, or None if ``rows`` ended the listing."""
+    return encode_cursor(rows[-1]) if rows and len(rows) == limit else None
 
 
 class DocumentService:
     """Service for managing document business logic."""
 
+    # Built per request, so instances carry no __dict__
+    __slots__ = ("document_repository", "company_repository")
+
     def __init__(
         self,
         document_repository: DocumentRepository,
@@ -41,6 +91,43 @@ class DocumentService:
         """
         return DocumentResponse.model_validate(document)
 
+    async def _ensure_company_exists(self, company_id: int) -> None:
+        """Raise a 404 if the company does not exist.
+
+        Listings only call this when they come back empty, the one case where
+        an unknown company and a company without matching documents look alike.
+        Known companies are answered from the shared company cache.
+
+        Args:
+            company_id: Company ID.
+
+        Raises:
+            HTTPException: If company not found.
+        """
+        if not await company_exists(self.company_repository, company_id):
+            raise not_found("Company", company_id)
+
+    async def _company_listing_json(self, company_id: int, rows: list[dict[str, Any]]) -> bytes:
+        """Serialize a company's document rows, checking the company only if there are none.
+
+        The rows are plain column values, so they are encoded by orjson without
+        building models. The output matches DocumentResponse serialization,
+        including ``Z`` for UTC.
+
+        Args:
+            company_id: Company ID the rows were filtered by.
+            rows: Document row dictionaries returned by the repository.
+
+        Returns:
+            JSON array of documents, encoded as UTF-8 bytes.
+
+        Raises:
+            HTTPException: If there are no rows and the company not found.
+        """
+        if not rows:
+            await self._ensure_company_exists(company_id)
+        return orjson.dumps(rows, option=orjson.OPT_UTC_Z)
+
     async def create_document(self, document_data: DocumentCreate) -> DocumentResponse:
         """Create a new document.
 
@@ -51,32 +138,18 @@ class DocumentService:
             DocumentResponse representing the created document.
 
         Raises:
-            HTTPException: If company not found or document creation fails.
+            HTTPException: If company not found.
         """
-        # Verify company exists
-        company = await self.company_repository.get_by_id(document_data.company_id)
-        if not company:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Company with id {document_data.company_id} not found",
-            )
-
-        try:
-            document = await self.document_repository.create(
-                company_id=document_data.company_id,
-                url=document_data.url,
-                fiscal_year=document_data.fiscal_year,
-                document_type=document_data.document_type,
-                file_path=document_data.file_path,
-            )
-            return self._model_to_response(document)
-        except HTTPException:
-            raise
-        except Exception as e:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Error creating document: {str(e)}",
-            ) from e
+        row = await self.document_repository.create_row_if_company_exists(
+            company_id=document_data.company_id,
+            url=document_data.url,
+            fiscal_year=document_data.fiscal_year,
+            document_type=document_data.document_type,
+            file_path=document_data.file_path,
+        )
+        if row is None:
+            raise not_found("Company", document_data.company_id)
+        return DocumentResponse.model_validate(row)
 
     async def get_document(self, document_id: int) -> DocumentResponse:
         """Get document by ID.
@@ -92,105 +165,112 @@ class DocumentService:
         """
         document = await self.document_repository.get_by_id(document_id)
         if not document:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Document with id {document_id} not found",
-            )
+            raise not_found("Document", document_id)
         return self._model_to_response(document)
 
-    async def get_documents_by_company(
-        self, company_id: int, skip: int = 0, limit: int = 100
-    ) -> list[DocumentResponse]:
-        """Get all documents for a company with pagination.
+    async def get_documents_by_company_json(
+        self, company_id: int, skip: int = 0, limit: int = 100, after: str | None = None
+    ) -> tuple[bytes, str | None]:
+        """Get a page of a company's documents as a serialized JSON array.
 
         Args:
             company_id: Company ID.
-            skip: Number of records to skip.
+            skip: Number of records to skip. Ignored when ``after`` is given.
             limit: Maximum number of records to return.
+            after: Cursor token returned with the previous page.
 
         Returns:
-            List of DocumentResponse representing documents.
+            Tuple of the JSON array of documents, encoded as UTF-8 bytes, and the
+            cursor token of the next page, or None if this page ends the listing.
 
         Raises:
-            HTTPException: If company not found.
+            HTTPException: If the cursor is invalid or company not found.
         """
-        # Verify company exists
-        company = await self.company_repository.get_by_id(company_id)
-        if not company:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Company with id {company_id} not found",
-            )
-
-        documents = await self.document_repository.get_by_company(
-            company_id=company_id, skip=skip, limit=limit
+        rows = await self.document_repository.get_rows_by_company(
+            company_id=company_id,
+            skip=skip,
+            limit=limit,
+            after=decode_cursor(after) if after is not None else None,
         )
-        return [self._model_to_response(doc) for doc in documents]
+        content = await self._company_listing_json(company_id, rows)
+        return content, _next_cursor(rows, limit)
+
+    async def get_documents_for_companies_json(self, company_ids: list[int]) -> bytes:
+        """Get the documents of several companies as a serialized JSON object.
 
-    async def get_documents_by_company_and_year(
+        Runs one existence check and one query, and encodes the plain rows with
+        orjson without building response models.
+
+        Args:
+            company_ids: Company IDs. Duplicates are fetched once.
+
+        Returns:
+            JSON object mapping each company ID to its documents, newest first,
+            encoded as UTF-8 bytes.
+
+        Raises:
+            HTTPException: If any company is not found.
+        """
+        unique_ids = list(dict.fromkeys(company_ids))
+        missing = await missing_company_ids(self.company_repository, unique_ids)
+        if missing:
+            raise all_not_found("Companies", missing)
+        rows = await self.document_repository.get_many_rows_by_company(unique_ids)
+        return orjson.dumps(rows, option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS)
+
+    async def get_documents_by_company_and_year_json(
         self, company_id: int, fiscal_year: int
-    ) -> list[DocumentResponse]:
-        """Get documents for a company by fiscal year.
+    ) -> bytes:
+        """Get a company's documents for a fiscal year as a serialized JSON array.
 
         Args:
             company_id: Company ID.
             fiscal_year: Fiscal year.
 
         Returns:
-            List of DocumentResponse representing documents.
+            JSON array of documents, encoded as UTF-8 bytes.
 
         Raises:
             HTTPException: If company not found.
         """
-        # Verify company exists
-        company = await self.company_repository.get_by_id(company_id)
-        if not company:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Company with id {company_id} not found",
-            )
-
-        documents = await self.document_repository.get_by_company_and_year(
+        rows = await self.document_repository.get_rows_by_company_and_year(
             company_id=company_id, fiscal_year=fiscal_year
         )
-        return [self._model_to_response(doc) for doc in documents]
+        return await self._company_listing_json(company_id, rows)
 
-    async def get_documents_by_company_and_type(
+    async def get_documents_by_company_and_type_json(
         self,
         company_id: int,
         document_type: str,
         skip: int = 0,
         limit: int = 100,
-    ) -> list[DocumentResponse]:
-        """Get documents for a company by document type.
+        after: str | None = None,
+    ) -> tuple[bytes, str | None]:
+        """Get a page of a company's documents of one type as a serialized JSON array.
 
         Args:
             company_id: Company ID.
             document_type: Type of document.
-            skip: Number of records to skip.
+            skip: Number of records to skip. Ignored when ``after`` is given.
             limit: Maximum number of records to return.
+            after: Cursor token returned with the previous page.
 
         Returns:
-            List of DocumentResponse representing documents.
+            Tuple of the JSON array of documents, encoded as UTF-8 bytes, and the
+            cursor token of the next page, or None if this page ends the listing.
 
         Raises:
-            HTTPException: If company not found.
+            HTTPException: If the cursor is invalid or company not found.
         """
-        # Verify company exists
-        company = await self.company_repository.get_by_id(company_id)
-        if not company:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Company with id {company_id} not found",
-            )
-
-        documents = await self.document_repository.get_by_company_and_type(
+        rows = await self.document_repository.get_rows_by_company_and_type(
             company_id=company_id,
             document_type=document_type,
             skip=skip,
             limit=limit,
+            after=decode_cursor(after) if after is not None else None,
         )
-        return [self._model_to_response(doc) for doc in documents]
+        content = await self._company_listing_json(company_id, rows)
+        return content, _next_cursor(rows, limit)
 
     async def update_document(
         self, document_id: int, document_data: DocumentUpdate
@@ -205,37 +285,18 @@ class DocumentService:
             DocumentResponse representing the updated document.
 
         Raises:
-            HTTPException: If document not found or update fails.
+            HTTPException: If document not found.
         """
-        # Check if document exists
-        existing = await self.document_repository.get_by_id(document_id)
-        if not existing:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Document with id {document_id} not found",
-            )
-
-        try:
-            document = await self.document_repository.update(
-                document_id=document_id,
-                url=document_data.url,
-                fiscal_year=document_data.fiscal_year,
-                document_type=document_data.document_type,
-                file_path=document_data.file_path,
-            )
-            if not document:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail="Failed to update document",
-                )
-            return self._model_to_response(document)
-        except HTTPException:
-            raise
-        except Exception as e:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Error updating document: {str(e)}",
-            ) from e
+        row = await self.document_repository.update_row(
+            document_id=document_id,
+            url=document_data.url,
+            fiscal_year=document_data.fiscal_year,
+            document_type=document_data.document_type,
+            file_path=document_data.file_path,
+        )
+        if row is None:
+            raise not_found("Document", document_id)
+        return DocumentResponse.model_validate(row)
 
     async def delete_document(self, document_id: int) -> None:
         """Delete a document by ID.
@@ -244,19 +305,8 @@ class DocumentService:
             document_id: Document ID.
 
         Raises:
-            HTTPException: If document not found or deletion fails.
+            HTTPException: If document not found.
         """
-        # Check if document exists
-        existing = await self.document_repository.get_by_id(document_id)
-        if not existing:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Document with id {document_id} not found",
-            )
-
         deleted = await self.document_repository.delete(document_id)
         if not deleted:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to delete document",
-            )
+            raise not_found("Document", document_id)
@@ -0,0 +1,42 @@
+"""
+HTTP errors raised by the service layer.
+
+Author: Patryk Golabek
+Copyright: 2025 Patryk Golabek
+"""
+
+from collections.abc import Iterable
+
+from fastapi import HTTPException, status
+
+
+def not_found(entity: str, entity_id: int) -> HTTPException:
+    """Build the 404 raised when an entity does not exist.
+
+    Args:
+        entity: Entity name as it should appear in the message, e.g. ``"Document"``.
+        entity_id: ID of the missing entity.
+
+    Returns:
+        HTTPException with a 404 status code.
+    """
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail=f"{entity} with id {entity_id} not found",
+    )
+
+
+def all_not_found(entities: str, entity_ids: Iterable[int]) -> HTTPException:
+    """Build the 404 raised when a batch references entities that do not exist.
+
+    Args:
+        entities: Plural entity name, e.g. ``"Companies"``.
+        entity_ids: IDs of the missing entities.
+
+    Returns:
+        HTTPException with a 404 status code listing the IDs in ascending order.
+    """
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail=f"{entities} not found: {sorted(entity_ids)}",
+    )
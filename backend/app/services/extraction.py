@@ -5,17 +5,30 @@ Author: Patryk Golabek
 Copyright: 2025 Patryk Golabek
 """
 
+import orjson
 from fastapi import HTTPException, status
+from pydantic import TypeAdapter
 
 from app.db.models.extraction import Extraction
 from app.db.repositories.document import DocumentRepository
 from app.db.repositories.extraction import ExtractionRepository
-from app.schemas.extraction import ExtractionCreate, ExtractionResponse, ExtractionUpdate
+from app.schemas.extraction import (
+    ExtractionCreate,
+    ExtractionResponse,
+    ExtractionSummary,
+    ExtractionUpdate,
+)
+from app.services.errors import all_not_found, not_found
+
+_SUMMARY_LIST_ADAPTER = TypeAdapter(list[ExtractionSummary])
 
 
 class ExtractionService:
     """Service for managing extraction business logic."""
 
+    # Built per request, so instances carry no __dict__
+    __slots__ = ("extraction_repository", "document_repository")
+
     def __init__(
         self,
         extraction_repository: ExtractionRepository,
@@ -41,6 +54,21 @@ class ExtractionService:
         """
         return ExtractionResponse.model_validate(extraction)
 
+    async def _ensure_document_exists(self, document_id: int) -> None:
+        """Raise a 404 if the document does not exist.
+
+        Reads only call this when they come back empty, the one case where an
+        unknown document and a document without matching extractions look alike.
+
+        Args:
+            document_id: Document ID.
+
+        Raises:
+            HTTPException: If document not found.
+        """
+        if not await self.document_repository.exists(document_id):
+            raise not_found("Document", document_id)
+
     async def create_extraction(self, extraction_data: ExtractionCreate) -> ExtractionResponse:
         """Create a new extraction.
 
@@ -51,30 +79,16 @@ class ExtractionService:
             ExtractionResponse representing the created extraction.
 
         Raises:
-            HTTPException: If document not found or extraction creation fails.
+            HTTPException: If document not found.
         """
-        # Verify document exists
-        document = await self.document_repository.get_by_id(extraction_data.document_id)
-        if not document:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Document with id {extraction_data.document_id} not found",
-            )
-
-        try:
-            extraction = await self.extraction_repository.create(
-                document_id=extraction_data.document_id,
-                statement_type=extraction_data.statement_type,
-                raw_data=extraction_data.raw_data,
-            )
-            return self._model_to_response(extraction)
-        except HTTPException:
-            raise
-        except Exception as e:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Error creating extraction: {str(e)}",
-            ) from e
+        extraction = await self.extraction_repository.create_if_document_exists(
+            document_id=extraction_data.document_id,
+            statement_type=extraction_data.statement_type,
+            raw_data=extraction_data.raw_data,
+        )
+        if extraction is None:
+            raise not_found("Document", extraction_data.document_id)
+        return self._model_to_response(extraction)
 
     async def get_extraction(self, extraction_id: int) -> ExtractionResponse:
         """Get extraction by ID.
@@ -90,10 +104,7 @@ class ExtractionService:
         """
         extraction = await self.extraction_repository.get_by_id(extraction_id)
         if not extraction:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Extraction with id {extraction_id} not found",
-            )
+            raise not_found("Extraction", extraction_id)
         return self._model_to_response(extraction)
 
     async def get_extractions_by_document(self, document_id: int) -> list[ExtractionResponse]:
@@ -108,17 +119,78 @@ class ExtractionService:
         Raises:
             HTTPException: If document not found.
         """
-        # Verify document exists
-        document = await self.document_repository.get_by_id(document_id)
-        if not document:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Document with id {document_id} not found",
-            )
-
         extractions = await self.extraction_repository.get_by_document(document_id)
+        if not extractions:
+            await self._ensure_document_exists(document_id)
         return [self._model_to_response(ext) for ext in extractions]
 
+    async def get_extraction_summaries_by_document(
+        self, document_id: int
+    ) -> list[ExtractionSummary]:
+        """Get extraction metadata for a document without loading ``raw_data``.
+
+        Args:
+            document_id: Document ID.
+
+        Returns:
+            List of ExtractionSummary for the document's extractions, newest first.
+
+        Raises:
+            HTTPException: If document not found.
+        """
+        rows = await self.extraction_repository.get_metadata_by_document(document_id)
+        if not rows:
+            await self._ensure_document_exists(document_id)
+        return _SUMMARY_LIST_ADAPTER.validate_python(rows)
+
+    async def get_extractions_for_documents_json(self, document_ids: list[int]) -> bytes:
+        """Get the extractions of several documents as a serialized JSON object.
+
+        Runs one existence check and one query. The stored ``raw_data``
+        documents are spliced into the output verbatim with ``orjson.Fragment``.
+
+        Args:
+            document_ids: Document IDs. Duplicates are fetched once.
+
+        Returns:
+            JSON object mapping each document ID to its extractions, newest first,
+            encoded as UTF-8 bytes.
+
+        Raises:
+            HTTPException: If any document is not found.
+        """
+        unique_ids = list(dict.fromkeys(document_ids))
+        missing = set(unique_ids) - await self.document_repository.existing_ids(unique_ids)
+        if missing:
+            raise all_not_found("Documents", missing)
+        rows = await self.extraction_repository.get_many_by_document_raw(unique_ids)
+        for items in rows.values():
+            for row in items:
+                row["raw_data"] = orjson.Fragment(row["raw_data"])
+        return orjson.dumps(rows, option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS)
+
+    async def get_extractions_by_document_json(self, document_id: int) -> bytes:
+        """Get all extractions for a document as a serialized JSON array.
+
+        The stored ``raw_data`` documents are spliced into the output verbatim
+        with ``orjson.Fragment`` instead of being decoded and re-encoded.
+
+        Args:
+            document_id: Document ID.
+
+        Returns:
+            JSON array of extractions, encoded as UTF-8 bytes.
+
+        Raises:
+            HTTPException: If document not found.
+        """
+        rows = await self.extraction_repository.get_by_document_raw(document_id)
+        if not rows:
+            await self._ensure_document_exists(document_id)
+        for row in rows:
+            row["raw_data"] = orjson.Fragment(row["raw_data"])
+        return orjson.dumps(rows, option=orjson.OPT_UTC_Z)
+
     async def get_extraction_by_document_and_type(
         self, document_id: int, statement_type: str
     ) -> ExtractionResponse:
@@ -134,18 +206,11 @@ class ExtractionService:
         Raises:
             HTTPException: If document or extraction not found.
         """
-        # Verify document exists
-        document = await self.document_repository.get_by_id(document_id)
-        if not document:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Document with id {document_id} not found",
-            )
-
         extraction = await self.extraction_repository.get_by_document_and_type(
             document_id, statement_type
         )
         if not extraction:
+            await self._ensure_document_exists(document_id)
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=(
@@ -168,33 +233,14 @@ class ExtractionService:
             ExtractionResponse representing the updated extraction.
 
         Raises:
-            HTTPException: If extraction not found or update fails.
+            HTTPException: If extraction not found.
         """
-        # Check if extraction exists
-        existing = await self.extraction_repository.get_by_id(extraction_id)
-        if not existing:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Extraction with id {extraction_id} not found",
-            )
-
-        try:
-            extraction = await self.extraction_repository.update(
-                extraction_id=extraction_id, raw_data=extraction_data.raw_data
-            )
-            if not extraction:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail="Failed to update extraction",
-                )
-            return self._model_to_response(extraction)
-        except HTTPException:
-            raise
-        except Exception as e:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Error updating extraction: {str(e)}",
-            ) from e
+        extraction = await self.extraction_repository.update(
+            extraction_id=extraction_id, raw_data=extraction_data.raw_data
+        )
+        if not extraction:
+            raise not_found("Extraction", extraction_id)
+        return self._model_to_response(extraction)
 
     async def delete_extraction(self, extraction_id: int) -> None:
         """Delete an extraction by ID.
@@ -203,19 +249,8 @@ class ExtractionService:
             extraction_id: Extraction ID.
 
         Raises:
-            HTTPException: If extraction not found or deletion fails.
+            HTTPException: If extraction not found.
         """
-        # Check if extraction exists
-        existing = await self.extraction_repository.get_by_id(extraction_id)
-        if not existing:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Extraction with id {extraction_id} not found",
-            )
-
         deleted = await self.extraction_repository.delete(extraction_id)
         if not deleted:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to delete extraction",
-            )
+            raise not_found("Extraction", extraction_id)
@@ -1,12 +1,25 @@
 """
 Celery tasks for financial data extraction and processing.
 
-This module exports the Celery app instance and task decorators.
+This module exports the Celery app instance and task decorators. The app is
+imported from its submodule on first access, so importing a submodule such
+as ``app.tasks.metrics`` does not configure Celery and load its transport
+stack.
 
 Author: Patryk Golabek
 Copyright: 2025 Patryk Golabek
 """
 
-from app.tasks.celery_app import celery_app
+from typing import TYPE_CHECKING
+
+from app.utils.lazy_imports import lazy_imports
+
+if TYPE_CHECKING:
+    from app.tasks.celery_app import celery_app
+
+# Exported name -> submodule defining it
+_LAZY_IMPORTS = {"celery_app": "app.tasks.celery_app"}
 
 __all__ = ["celery_app"]
+
+lazy_imports(__name__, _LAZY_IMPORTS)
@@ -11,8 +11,10 @@ import os
 import platform
 from typing import Any
 
+import orjson
 from celery import Celery
 from celery.signals import setup_logging, worker_ready
+from kombu.serialization import register
 
 # Import metrics module to register Prometheus signal handlers
 from app.tasks import metrics  # noqa: F401
@@ -50,6 +52,26 @@ celery_app = Celery(
     ],
 )
 
+
+def _orjson_dumps(value: Any) -> bytes:
+    """Encode a task payload or result with orjson, allowing non-string keys like json."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+
+
+# Task arguments and results are JSON-native dicts (workers already render
+# timestamps as ISO strings), so orjson encodes them instead of kombu's
+# pure-Python JSONEncoder. The codec replaces kombu's own under the "json" name
+# and application/json content type: messages and results look exactly as
+# before, so workers and producers still on kombu's codec accept them and
+# vice versa, in any deployment order.
+register(
+    "json",
+    _orjson_dumps,
+    orjson.loads,
+    content_type="application/json",
+    content_encoding="utf-8",
+)
+
 # Determine worker pool based on platform
 # macOS has issues with prefork pool due to Objective-C runtime
 # Use threads pool on macOS, prefork on Linux
@@ -75,6 +97,12 @@ celery_app.conf.update(
     task_ignore_result=False,
     # Use threads pool on macOS to avoid fork issues
     worker_pool=WORKER_POOL,
+    # Worker processes, also counted when sizing each process's database pool
+    worker_concurrency=(
+        settings.celery_concurrency
+        if settings
+        else Settings.model_fields["celery_concurrency"].default
+    ),
     # Task routing
     task_routes={
         "app.tasks.scraping_tasks.*": {"queue": "scraping"},
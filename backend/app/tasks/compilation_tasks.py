@@ -15,8 +15,13 @@ from celery import Task
 
 from app.tasks.celery_app import celery_app
 from app.tasks.progress import CeleryProgressCallback
-from app.tasks.utils import get_db_context, run_async, validate_task_result
-from app.workers.compilation_worker import CompilationWorker
+from app.tasks.utils import (
+    get_db_context,
+    invalidate_compiled_statements,
+    run_async,
+    validate_task_result,
+)
+from app.workers.compilation_worker import STATEMENT_TYPES, CompilationWorker
 
 logger = logging.getLogger(__name__)
 
@@ -61,7 +66,9 @@ def normalize_and_compile_statements(
         async def _execute_worker():
             async with get_db_context() as session:
                 worker = CompilationWorker(session, progress_callback)
-                return await worker.normalize_and_compile_statements(company_id, statement_type)
+                result = await worker.normalize_and_compile_statements(company_id, statement_type)
+            await invalidate_compiled_statements(company_id, [statement_type])
+            return result
 
         result = run_async(_execute_worker())
 
@@ -117,7 +124,9 @@ def compile_company_statements(self: Task, company_id: int) -> dict[str, Any]:
         async def _execute_worker():
             async with get_db_context() as session:
                 worker = CompilationWorker(session, progress_callback)
-                return await worker.compile_company_statements(company_id)
+                result = await worker.compile_company_statements(company_id)
+            await invalidate_compiled_statements(company_id, STATEMENT_TYPES)
+            return result
 
         overall_result = run_async(_execute_worker())
 
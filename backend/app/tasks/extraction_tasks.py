@@ -13,30 +13,20 @@ from typing import Any
 
 from celery import Task
 
-from app.core.storage import StorageServiceConfig, create_storage_service
 from app.tasks.celery_app import celery_app
 from app.tasks.progress import CeleryProgressCallback
-from app.tasks.utils import get_db_context, run_async, validate_task_result
+from app.tasks.utils import (
+    create_storage_service_from_config,
+    get_db_context,
+    run_async,
+    validate_task_result,
+)
 from app.workers.extraction_worker import ExtractionWorker
-from config import Settings
+from config import get_settings
 
 logger = logging.getLogger(__name__)
 
 
-def create_storage_service_from_config() -> Any:
-    """Create storage service instance from application settings."""
-    settings = Settings()
-    config = StorageServiceConfig(
-        enabled=settings.minio_enabled,
-        endpoint=settings.minio_endpoint,
-        access_key=settings.minio_access_key,
-        secret_key=settings.minio_secret_key,
-        bucket_name=settings.minio_bucket_name,
-        use_ssl=settings.minio_use_ssl,
-    )
-    return create_storage_service(config)
-
-
 @celery_app.task(
     bind=True,
     name="app.tasks.extraction_tasks.extract_financial_statements",
@@ -69,7 +59,7 @@ def extract_financial_statements(self: Task, document_id: int) -> dict[str, Any]
         progress_callback = CeleryProgressCallback(self)
 
         # Get OpenRouter settings
-        settings = Settings()
+        settings = get_settings()
 
         # Create worker with database session
         async def _execute_worker():
@@ -137,7 +127,7 @@ def process_document(self: Task, document_id: int) -> dict[str, Any]:
         progress_callback = CeleryProgressCallback(self)
 
         # Get OpenRouter settings
-        settings = Settings()
+        settings = get_settings()
 
         # Create worker with database session
         async def _execute_worker():
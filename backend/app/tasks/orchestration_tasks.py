@@ -13,31 +13,23 @@ from typing import Any
 
 from celery import Task
 
-from app.core.storage import StorageServiceConfig, create_storage_service
 from app.tasks.celery_app import celery_app
 from app.tasks.progress import CeleryProgressCallback
-from app.tasks.utils import get_db_context, run_async, validate_task_result
+from app.tasks.utils import (
+    create_storage_service_from_config,
+    get_db_context,
+    invalidate_compiled_statements,
+    run_async,
+    validate_task_result,
+)
+from app.workers.compilation_worker import STATEMENT_TYPES
 from app.workers.extraction_worker import ExtractionWorker
 from app.workers.orchestration_worker import OrchestrationWorker
-from config import Settings
+from config import get_settings
 
 logger = logging.getLogger(__name__)
 
 
-def create_storage_service_from_config() -> Any:
-    """Create storage service instance from application settings."""
-    settings = Settings()
-    config = StorageServiceConfig(
-        enabled=settings.minio_enabled,
-        endpoint=settings.minio_endpoint,
-        access_key=settings.minio_access_key,
-        secret_key=settings.minio_secret_key,
-        bucket_name=settings.minio_bucket_name,
-        use_ssl=settings.minio_use_ssl,
-    )
-    return create_storage_service(config)
-
-
 @celery_app.task(
     bind=True,
     name="app.tasks.orchestration_tasks.extract_company_financial_data",
@@ -80,7 +72,9 @@ def extract_company_financial_data(self: Task, company_id: int) -> dict[str, Any
             async with get_db_context() as session:
                 storage_service = create_storage_service_from_config()
                 worker = OrchestrationWorker(session, progress_callback=progress_callback, storage_service=storage_service)
-                return await worker.extract_company_financial_data(company_id)
+                result = await worker.extract_company_financial_data(company_id)
+            await invalidate_compiled_statements(company_id, STATEMENT_TYPES)
+            return result
 
         result = run_async(_execute_worker())
 
@@ -132,7 +126,7 @@ def process_all_documents(self: Task, company_id: int) -> dict[str, Any]:
         progress_callback = CeleryProgressCallback(self)
 
         # Get OpenRouter settings
-        settings = Settings()
+        settings = get_settings()
 
         # Create worker with database session
         async def _execute_worker():
@@ -207,7 +201,9 @@ def recompile_company_statements(self: Task, company_id: int) -> dict[str, Any]:
             async with get_db_context() as session:
                 storage_service = create_storage_service_from_config()
                 worker = OrchestrationWorker(session, progress_callback=progress_callback, storage_service=storage_service)
-                return await worker.recompile_company_statements(company_id)
+                result = await worker.recompile_company_statements(company_id)
+            await invalidate_compiled_statements(company_id, STATEMENT_TYPES)
+            return result
 
         overall_result = run_async(_execute_worker())
 
@@ -14,30 +14,20 @@ from typing import Any
 import httpx
 from celery import Task
 
-from app.core.storage import StorageServiceConfig, create_storage_service
 from app.tasks.celery_app import celery_app
 from app.tasks.progress import CeleryProgressCallback
-from app.tasks.utils import get_db_context, run_async, validate_task_result
+from app.tasks.utils import (
+    create_storage_service_from_config,
+    get_db_context,
+    run_async,
+    validate_task_result,
+)
 from app.workers.scraping_worker import ScrapingWorker
-from config import Settings
+from config import get_settings
 
 logger = logging.getLogger(__name__)
 
 
-def create_storage_service_from_config() -> Any:
-    """Create storage service instance from application settings."""
-    settings = Settings()
-    config = StorageServiceConfig(
-        enabled=settings.minio_enabled,
-        endpoint=settings.minio_endpoint,
-        access_key=settings.minio_access_key,
-        secret_key=settings.minio_secret_key,
-        bucket_name=settings.minio_bucket_name,
-        use_ssl=settings.minio_use_ssl,
-    )
-    return create_storage_service(config)
-
-
 @celery_app.task(
     bind=True,
     name="app.tasks.scraping_tasks.scrape_investor_relations",
@@ -75,7 +65,7 @@ def scrape_investor_relations(self: Task, company_id: int) -> dict[str, Any]:
             async with get_db_context() as session:
                 storage_service = create_storage_service_from_config()
                 worker = ScrapingWorker(session, progress_callback, storage_service)
-                settings = Settings()
+                settings = get_settings()
                 return await worker.scrape_investor_relations(
                     company_id, settings.open_router_api_key
                 )
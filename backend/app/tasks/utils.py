@@ -10,13 +10,19 @@ Copyright: 2025 Patryk Golabek
 import asyncio
 import hashlib
 import logging
+from collections.abc import Iterable
 from contextlib import asynccontextmanager
+from functools import cache
 from pathlib import Path
 from typing import Any
 
 from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 
+from app.core.cache import create_compiled_statement_cache
+from app.core.storage import IStorageService, StorageServiceConfig, create_storage_service
 from app.db.base import AsyncSessionLocal
+from app.db.hooks import commit, discard_after_commit
+from config import get_settings
 
 logger = logging.getLogger(__name__)
 
@@ -49,19 +55,54 @@ def run_async(coro: Any) -> Any:
 async def get_db_context():
     """Async context manager for database operations in tasks.
 
+    Hooks registered with ``app.db.hooks.after_commit`` run after the commit.
+
     Yields:
         AsyncSession instance for database operations.
     """
     async with AsyncSessionLocal() as session:
         try:
             yield session
-            await session.commit()
+            await commit(session)
         except Exception as e:
             logger.error(f"Database operation failed: {e}", exc_info=True)
+            discard_after_commit(session)
             await session.rollback()
             raise
 
 
+async def invalidate_compiled_statements(company_id: int, statement_types: Iterable[str]) -> None:
+    """Drop compiled statements the API has cached, once a task has rewritten them.
+
+    Call after the task's transaction has committed. The Redis client is made
+    per call because async clients are bound to the event loop that created them.
+
+    Args:
+        company_id: Company ID.
+        statement_types: Types of financial statement that were rewritten.
+    """
+    statement_cache = create_compiled_statement_cache(get_settings())
+    if statement_cache is None:
+        return
+    try:
+        await statement_cache.invalidate(*((company_id, t) for t in statement_types))
+    finally:
+        await statement_cache.aclose()
+
+
+@cache
+def create_storage_service_from_config() -> IStorageService:
+    """Get the worker process's storage service, built from application settings.
+
+    Built once per process, so the MinIO client and its bucket check are not
+    repeated for every task.
+
+    Returns:
+        IStorageService instance.
+    """
+    return create_storage_service(StorageServiceConfig.from_settings(get_settings()))
+
+
 def calculate_file_hash(file_path: str | Path) -> str:
     """Calculate SHA256 hash of a file for deduplication.
 
@@ -0,0 +1,54 @@
+"""
+This module lets a package export names that are only imported from their
+submodules on first access, so importing one submodule does not load the
+dependencies of every other one.
+
+Author: Patryk Golabek
+Copyright: 2025 Patryk Golabek
+"""
+
+import sys
+from importlib import import_module
+from types import ModuleType
+from typing import Any
+
+
+class _LazyPackage(ModuleType):
+    """Package module that imports its exported names on first access.
+
+    The exported names and their submodules are kept in the package's
+    ``_LAZY_IMPORTS`` mapping. When an exported name matches the submodule it
+    lives in (``app.tasks.celery_app``), loading that submodule makes the
+    import system set the package attribute to the submodule itself, which
+    would shadow the exported object; ``__setattr__`` binds the object instead.
+    """
+
+    def __getattr__(self, name: str) -> Any:
+        module = self.__dict__["_LAZY_IMPORTS"].get(name)
+        if module is None:
+            raise AttributeError(f"module {self.__name__!r} has no attribute {name!r}")
+        setattr(self, name, getattr(import_module(module), name))
+        return self.__dict__[name]
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if (
+            isinstance(value, ModuleType)
+            and self.__dict__["_LAZY_IMPORTS"].get(name) == value.__name__
+        ):
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+
+def lazy_imports(package: str, imports: dict[str, str]) -> None:
+    """Make a package import its exported names on first access.
+
+    Call at the end of the package's ``__init__``; the names should also be
+    imported under ``TYPE_CHECKING`` and listed in ``__all__``.
+
+    Args:
+        package: ``__name__`` of the package.
+        imports: Exported name -> submodule defining it.
+    """
+    module = sys.modules[package]
+    module.__dict__["_LAZY_IMPORTS"] = imports
+    module.__class__ = _LazyPackage
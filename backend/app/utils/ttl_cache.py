@@ -0,0 +1,77 @@
+"""
+This module provides a small in-process cache with LRU eviction and
+per-entry expiry.
+
+Author: Patryk Golabek
+Copyright: 2025 Patryk Golabek
+"""
+
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+
+
+class TTLCache[K: Hashable, V]:
+    """Bounded mapping whose entries expire a fixed time after being stored.
+
+    Once ``maxsize`` entries are held, storing a new key evicts the least
+    recently used one. Not thread-safe; intended for use from a single event loop.
+
+    Args:
+        maxsize: Maximum number of entries kept.
+        ttl: Lifetime of an entry in seconds.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: K) -> V | None:
+        """Get a live entry, marking it as recently used.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            Cached value, or None if missing or expired.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def set(self, key: K, value: V) -> None:
+        """Store a value, evicting the least recently used entry if full.
+
+        Args:
+            key: Cache key.
+            value: Value to cache.
+        """
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: K) -> V | None:
+        """Remove an entry.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            Removed value, or None if the key was not cached.
+        """
+        entry = self._entries.pop(key, None)
+        return None if entry is None else entry[1]
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
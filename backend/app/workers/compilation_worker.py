@@ -7,6 +7,7 @@ Author: Patryk Golabek
 Copyright: 2025 Patryk Golabek
 """
 
+import asyncio
 import logging
 from typing import Any
 
@@ -24,6 +25,9 @@ from app.workers.base import BaseWorker
 
 logger = logging.getLogger(__name__)
 
+# Statement types compiled for every company
+STATEMENT_TYPES = ("income_statement", "balance_sheet", "cash_flow_statement")
+
 
 class CompilationWorker(BaseWorker):
     """Worker for normalizing and compiling financial statements.
@@ -55,13 +59,18 @@ class CompilationWorker(BaseWorker):
         self.restatement_handler = RestatementHandler()
 
     async def normalize_and_compile_statements(
-        self, company_id: int, statement_type: str
+        self,
+        company_id: int,
+        statement_type: str,
+        extractions: list[dict[str, Any]] | None = None,
     ) -> dict[str, Any]:
         """Normalize and compile financial statements for a company and statement type.
 
         Args:
             company_id: ID of the company.
             statement_type: Type of statement (income_statement, balance_sheet, cash_flow_statement).
+            extractions: Extractions already fetched for this company and statement
+                type. Fetched from the database when omitted.
 
         Returns:
             Dictionary with task results including compiled statement data.
@@ -74,20 +83,11 @@ class CompilationWorker(BaseWorker):
         self.update_progress("fetching_extractions")
 
         # Get all extractions for company and statement type
-        extractions = await self._get_extractions_for_company(company_id, statement_type)
+        if extractions is None:
+            extractions = await self._get_extractions_for_company(company_id, statement_type)
 
         if not extractions:
-            self.logger.warning(
-                f"No extractions found for company {company_id} and statement type {statement_type}",
-                extra={"company_id": company_id, "statement_type": statement_type},
-            )
-            return {
-                "company_id": company_id,
-                "statement_type": statement_type,
-                "status": "success",
-                "message": "no_extractions_found",
-                "compiled_data": {},
-            }
+            return self._no_extractions_result(company_id, statement_type)
 
         self.logger.info(
             f"Found {len(extractions)} extractions",
@@ -98,6 +98,134 @@ class CompilationWorker(BaseWorker):
             },
         )
 
+        compiled_data = self._compile_statement(statement_type, extractions)
+
+        self.update_progress("storing_compiled_statement")
+
+        # Store compiled statement in database
+        compiled_statement = await self._store_compiled_statement(
+            company_id, statement_type, compiled_data
+        )
+
+        result = self._compilation_result(
+            company_id, statement_type, extractions, compiled_data, compiled_statement
+        )
+
+        self.logger.info(
+            "Completed normalize_and_compile_statements",
+            extra={"company_id": company_id, "statement_type": statement_type, "result": result},
+        )
+
+        return result
+
+    async def compile_company_statements(self, company_id: int) -> dict[str, Any]:
+        """Compile all statement types for a company.
+
+        Args:
+            company_id: ID of the company.
+
+        Returns:
+            Dictionary with task results for all statement types.
+        """
+        self.logger.info(
+            "Starting compile_company_statements",
+            extra={"company_id": company_id},
+        )
+
+        statement_types = list(STATEMENT_TYPES)
+        results = {}
+
+        self.update_progress("fetching_extractions")
+        extractions_by_type = await self._prefetch_extractions(company_id, statement_types)
+
+        compiled_by_type: dict[str, dict[str, Any]] = {}
+        for i, stmt_type in enumerate(statement_types):
+            self.update_progress(
+                f"compiling_{stmt_type}",
+                {
+                    "current": i + 1,
+                    "total": len(statement_types),
+                    "statement_type": stmt_type,
+                },
+            )
+
+            extractions = extractions_by_type[stmt_type]
+            if not extractions:
+                results[stmt_type] = self._no_extractions_result(company_id, stmt_type)
+                continue
+            compiled_by_type[stmt_type] = self._compile_statement(stmt_type, extractions)
+
+        # The statement types are independent, so they are written with one
+        # multi-row upsert instead of one round trip each
+        self.update_progress("storing_compiled_statements")
+        stored = await self.compiled_statement_repo.bulk_upsert(
+            [
+                {"company_id": company_id, "statement_type": stmt_type, "data": compiled_data}
+                for stmt_type, compiled_data in compiled_by_type.items()
+            ]
+        )
+        stored_by_type = {compiled.statement_type: compiled for compiled in stored}
+        for stmt_type, compiled_data in compiled_by_type.items():
+            results[stmt_type] = self._compilation_result(
+                company_id,
+                stmt_type,
+                extractions_by_type[stmt_type],
+                compiled_data,
+                stored_by_type.get(stmt_type),
+            )
+        results = {stmt_type: results[stmt_type] for stmt_type in statement_types}
+
+        overall_result = {
+            "company_id": company_id,
+            "status": "success",
+            "statements": results,
+        }
+
+        self.logger.info(
+            "Completed compile_company_statements",
+            extra={"company_id": company_id, "result": overall_result},
+        )
+
+        return overall_result
+
+    async def execute(self, *args: Any, **kwargs: Any) -> dict[str, Any]:
+        """Execute worker operation (required by BaseWorker).
+
+        This worker has specific methods, so execute is not used directly.
+        """
+        raise NotImplementedError(
+            "CompilationWorker uses specific methods (normalize_and_compile_statements, "
+            "compile_company_statements) instead of execute"
+        )
+
+    # Helper methods
+
+    def _no_extractions_result(self, company_id: int, statement_type: str) -> dict[str, Any]:
+        """Log and describe a statement type that has nothing to compile.
+
+        Returns:
+            Task result for the statement type.
+        """
+        self.logger.warning(
+            f"No extractions found for company {company_id} and statement type {statement_type}",
+            extra={"company_id": company_id, "statement_type": statement_type},
+        )
+        return {
+            "company_id": company_id,
+            "statement_type": statement_type,
+            "status": "success",
+            "message": "no_extractions_found",
+            "compiled_data": {},
+        }
+
+    def _compile_statement(
+        self, statement_type: str, extractions: list[dict[str, Any]]
+    ) -> dict[str, Any]:
+        """Normalize, prioritize and compile the extractions of one statement type.
+
+        Returns:
+            Compiled multi-year statement data.
+        """
         self.update_progress("normalizing_line_items")
 
         # Normalize line items across extractions
@@ -165,15 +293,22 @@ class CompilationWorker(BaseWorker):
             currency=currency,
             unit=unit,
         )
+        return compiled_data
 
-        self.update_progress("storing_compiled_statement")
-
-        # Store compiled statement in database
-        compiled_statement = await self._store_compiled_statement(
-            company_id, statement_type, compiled_data
-        )
+    def _compilation_result(
+        self,
+        company_id: int,
+        statement_type: str,
+        extractions: list[dict[str, Any]],
+        compiled_data: dict[str, Any],
+        compiled_statement: CompiledStatement | None,
+    ) -> dict[str, Any]:
+        """Describe a compiled and stored statement.
 
-        result = {
+        Returns:
+            Task result for the statement type.
+        """
+        return {
             "company_id": company_id,
             "statement_type": statement_type,
             "status": "success",
@@ -183,78 +318,34 @@ class CompilationWorker(BaseWorker):
             "compiled_statement_id": compiled_statement.id if compiled_statement else None,
         }
 
-        self.logger.info(
-            "Completed normalize_and_compile_statements",
-            extra={"company_id": company_id, "statement_type": statement_type, "result": result},
-        )
-
-        return result
+    async def _prefetch_extractions(
+        self, company_id: int, statement_types: list[str]
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Fetch extractions for several statement types concurrently.
 
-    async def compile_company_statements(self, company_id: int) -> dict[str, Any]:
-        """Compile all statement types for a company.
-
-        Args:
-            company_id: ID of the company.
-
-        Returns:
-            Dictionary with task results for all statement types.
+        An AsyncSession runs one statement at a time, so each read gets its own
+        short-lived session on the worker's engine and the queries overlap on
+        separate pooled connections.
         """
-        self.logger.info(
-            "Starting compile_company_statements",
-            extra={"company_id": company_id},
-        )
-
-        statement_types = ["income_statement", "balance_sheet", "cash_flow_statement"]
-        results = {}
-
-        for i, stmt_type in enumerate(statement_types):
-            self.update_progress(
-                f"compiling_{stmt_type}",
-                {
-                    "current": i + 1,
-                    "total": len(statement_types),
-                    "statement_type": stmt_type,
-                },
-            )
 
-            result = await self.normalize_and_compile_statements(company_id, stmt_type)
-            results[stmt_type] = result
+        async def fetch(statement_type: str) -> list[dict[str, Any]]:
+            async with AsyncSession(self.session.bind) as session:
+                return await self._get_extractions_for_company(company_id, statement_type, session)
 
-        overall_result = {
-            "company_id": company_id,
-            "status": "success",
-            "statements": results,
-        }
-
-        self.logger.info(
-            "Completed compile_company_statements",
-            extra={"company_id": company_id, "result": overall_result},
-        )
-
-        return overall_result
-
-    async def execute(self, *args: Any, **kwargs: Any) -> dict[str, Any]:
-        """Execute worker operation (required by BaseWorker).
-
-        This worker has specific methods, so execute is not used directly.
-        """
-        raise NotImplementedError(
-            "CompilationWorker uses specific methods (normalize_and_compile_statements, "
-            "compile_company_statements) instead of execute"
-        )
-
-    # Helper methods
+        results = await asyncio.gather(*(fetch(t) for t in statement_types))
+        return dict(zip(statement_types, results, strict=True))
 
     async def _get_extractions_for_company(
-        self, company_id: int, statement_type: str
+        self, company_id: int, statement_type: str, session: AsyncSession | None = None
     ) -> list[dict[str, Any]]:
         """Get all extractions for a company and statement type with document info."""
         from app.db.models.document import Document
         from app.db.models.extraction import Extraction
 
-        # Use SQLAlchemy join to filter by company_id and get document info
+        # Select plain columns so rows arrive as mappings instead of ORM instances
+        # that would each need a separate _model_to_dict() pass
         stmt = (
-            select(Extraction, Document.fiscal_year)
+            select(*Extraction.__table__.columns, Document.fiscal_year)
             .join(Document, Extraction.document_id == Document.id)
             .where(
                 Document.company_id == company_id,
@@ -262,17 +353,17 @@ class CompilationWorker(BaseWorker):
             )
             .order_by(Document.fiscal_year.desc())
         )
-        result = await self.session.execute(stmt)
-        rows = result.all()
+        result = await (session or self.session).execute(stmt)
 
         # Build extraction dicts with fiscal_year
         extractions = []
-        for extraction, fiscal_year in rows:
-            ext_dict = await self.extraction_repo._model_to_dict(extraction)
-            ext_dict["fiscal_year"] = fiscal_year
+        for row in result.mappings():
+            ext_dict = dict(row)
+            if ext_dict["created_at"] is not None:
+                ext_dict["created_at"] = ext_dict["created_at"].isoformat()
             # Also add to raw_data for compatibility
             if "fiscal_year" not in ext_dict.get("raw_data", {}):
-                ext_dict.setdefault("raw_data", {})["fiscal_year"] = fiscal_year
+                ext_dict.setdefault("raw_data", {})["fiscal_year"] = ext_dict["fiscal_year"]
             extractions.append(ext_dict)
 
         return extractions
@@ -280,11 +371,11 @@ class CompilationWorker(BaseWorker):
 
     async def _store_compiled_statement(
         self, company_id: int, statement_type: str, compiled_data: dict[str, Any]
-    ) -> CompiledStatement:
+    ) -> CompiledStatement | None:
         """Store compiled statement in database.
 
         Returns:
-            CompiledStatement model instance.
+            CompiledStatement model instance, or None if the company no longer exists.
         """
         return await self.compiled_statement_repo.upsert(
             company_id=company_id,
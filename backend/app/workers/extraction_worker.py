@@ -8,6 +8,7 @@ Copyright: 2025 Patryk Golabek
 """
 
 import logging
+from pathlib import Path
 from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -19,6 +20,7 @@ from app.core.storage import IStorageService
 from app.db.repositories.document import DocumentRepository
 from app.db.repositories.extraction import ExtractionRepository
 from app.workers.base import BaseWorker
+from config import get_settings
 
 logger = logging.getLogger(__name__)
 
@@ -56,9 +58,7 @@ class ExtractionWorker(BaseWorker):
         self.storage_service = storage_service
 
         # Initialize OpenRouter client
-        from config import Settings
-
-        settings = Settings()
+        settings = get_settings()
         if not openrouter_api_key:
             openrouter_api_key = settings.open_router_api_key
 
@@ -213,8 +213,6 @@ class ExtractionWorker(BaseWorker):
         Returns:
             Dictionary with extracted content and metadata.
         """
-        from pathlib import Path
-
         # Determine if this is a local path or object storage key
         local_path = Path(file_path)
         is_local_file = local_path.exists()
@@ -243,8 +241,6 @@ class ExtractionWorker(BaseWorker):
         Returns:
             List of created extraction records as dictionaries.
         """
-        created_extractions = []
-
         # Map statement type names to database format
         type_mapping = {
             "income_statement": "income_statement",
@@ -252,18 +248,17 @@ class ExtractionWorker(BaseWorker):
             "cash_flow_statement": "cash_flow_statement",
         }
 
-        for stmt_type_key, stmt_data in statements_data.items():
-            db_stmt_type = type_mapping.get(stmt_type_key, stmt_type_key)
-
-            # Store raw_data in format expected by database
-            # The stmt_data is already a dict from to_dict()
-            extraction = await self.extraction_repo.create(
-                document_id=document_id,
-                statement_type=db_stmt_type,
-                raw_data=stmt_data,
-            )
-
-            if extraction:
-                created_extractions.append(await self.extraction_repo._model_to_dict(extraction))
+        # Store raw_data in format expected by database
+        # The stmt_data is already a dict from to_dict()
+        extractions = await self.extraction_repo.bulk_create(
+            [
+                {
+                    "document_id": document_id,
+                    "statement_type": type_mapping.get(stmt_type_key, stmt_type_key),
+                    "raw_data": stmt_data,
+                }
+                for stmt_type_key, stmt_data in statements_data.items()
+            ]
+        )
 
-        return created_extractions
+        return [await self.extraction_repo._model_to_dict(extraction) for extraction in extractions]
@@ -7,6 +7,7 @@ Author: Patryk Golabek
 Copyright: 2025 Patryk Golabek
 """
 
+import asyncio
 import logging
 from typing import Any
 
@@ -19,6 +20,7 @@ from app.workers.base import BaseWorker
 from app.workers.compilation_worker import CompilationWorker
 from app.workers.extraction_worker import ExtractionWorker
 from app.workers.scraping_worker import ScrapingWorker
+from config import get_settings
 
 logger = logging.getLogger(__name__)
 
@@ -96,9 +98,7 @@ class OrchestrationWorker(BaseWorker):
         # Step 1: Scrape investor relations website
         self.update_progress("scraping", {"progress": 10})
 
-        from config import Settings
-
-        settings = Settings()
+        settings = get_settings()
         scrape_result = await self.scraping_worker.scrape_investor_relations(
             company_id, settings.open_router_api_key
         )
@@ -181,13 +181,13 @@ class OrchestrationWorker(BaseWorker):
             extra={"company_id": company_id},
         )
 
-        # Verify company exists
-        company_data = await self.company_repo.get_by_id(company_id)
-        if not company_data:
+        # The company check and the document listing are independent, so they overlap
+        company_exists, documents = await asyncio.gather(
+            self._company_exists(company_id),
+            self.document_repo.get_by_company(company_id),
+        )
+        if not company_exists:
             raise ValueError(f"Company with id {company_id} not found")
-
-        # Get all documents for the company
-        documents = await self.document_repo.get_by_company(company_id)
         total_docs = len(documents)
 
         self.logger.info(
@@ -250,6 +250,16 @@ class OrchestrationWorker(BaseWorker):
 
         return overall_result
 
+    async def _company_exists(self, company_id: int) -> bool:
+        """Check whether a company exists on its own short-lived session.
+
+        An AsyncSession runs one statement at a time, so the check gets a
+        separate session on the worker's engine to overlap with reads on the
+        worker's session.
+        """
+        async with AsyncSession(self.session.bind) as session:
+            return await CompanyRepository(session).exists(company_id)
+
     async def execute(self, *args: Any, **kwargs: Any) -> dict[str, Any]:
         """Execute worker operation (required by BaseWorker).
 
@@ -21,6 +21,7 @@ from app.db.models.document import Document
 from app.db.repositories.company import CompanyRepository
 from app.db.repositories.document import DocumentRepository
 from app.workers.base import BaseWorker
+from config import get_settings
 
 logger = logging.getLogger(__name__)
 
@@ -265,9 +266,7 @@ class ScrapingWorker(BaseWorker):
 
         try:
             # Get model from config
-            from config import Settings
-
-            settings = Settings()
+            settings = get_settings()
             openrouter_model = settings.open_router_model_scraping
 
             # Use Crawl4AI scraping service with OpenRouter
@@ -404,22 +403,19 @@ class ScrapingWorker(BaseWorker):
         Returns:
             List of created document records as dictionaries.
         """
-        created_documents = []
-        for url_data in urls:
-            # Extract fiscal year from URL or metadata if available
-            fiscal_year = url_data.get("fiscal_year", 2024)  # Default fallback
-            document_type = url_data.get("document_type", "unknown")
-
-            document = await self.document_repo.create(
-                company_id=company_id,
-                url=url_data["url"],
-                fiscal_year=fiscal_year,
-                document_type=document_type,
-                file_path=None,
-            )
-            if document:
-                created_documents.append(await self.document_repo._model_to_dict(document))
-        return created_documents
+        documents = await self.document_repo.bulk_create(
+            [
+                {
+                    "company_id": company_id,
+                    "url": url_data["url"],
+                    # Extract fiscal year from URL or metadata if available
+                    "fiscal_year": url_data.get("fiscal_year", 2024),  # Default fallback
+                    "document_type": url_data.get("document_type", "unknown"),
+                }
+                for url_data in urls
+            ]
+        )
+        return [await self.document_repo._model_to_dict(document) for document in documents]
 
     async def _download_pdf_file(
         self, url: str, company_id: int, fiscal_year: int
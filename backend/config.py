@@ -8,6 +8,7 @@ Author: Patryk Golabek
 Copyright: 2025 Patryk Golabek
 """
 
+from functools import cache, cached_property
 from urllib.parse import quote_plus
 
 from pydantic import Field, computed_field
@@ -27,11 +28,59 @@ class Settings(BaseSettings):
     db_name: str = Field(..., description="Name of the PostgreSQL database.")
     db_username: str = Field(..., description="Username for authenticating with PostgreSQL.")
     db_password: str = Field(..., description="Password for authenticating with PostgreSQL.")
+    db_use_pgbouncer: bool = Field(
+        False,
+        description=(
+            "Connect through PgBouncer in transaction pooling mode: disables server-side "
+            "prepared statements and keeps a small per-process pool."
+        ),
+    )
+    db_pool_size: int = Field(
+        25, ge=1, description="Persistent connections kept in the async database pool."
+    )
+    db_pool_max_overflow: int = Field(
+        25, ge=0, description="Extra connections the async pool may open under load."
+    )
+    db_pool_timeout: int = Field(
+        30, ge=1, description="Seconds to wait for a free pooled connection before failing."
+    )
+    db_pool_pre_ping: bool = Field(
+        False,
+        description=(
+            "Test each pooled connection with a round trip on checkout. Off by default: "
+            "pool_recycle replaces idle connections and a dropped one is discarded on error."
+        ),
+    )
+    db_max_connections: int = Field(
+        100,
+        ge=1,
+        description=(
+            "Postgres max_connections shared by all API worker processes (WEB_CONCURRENCY) "
+            "and Celery worker processes (celery_concurrency); each process's pool is "
+            "capped at its share."
+        ),
+    )
+    celery_concurrency: int = Field(
+        4,
+        ge=1,
+        description=(
+            "Celery worker processes; also counted against db_max_connections when "
+            "sizing each process's database pool."
+        ),
+    )
+    db_pool_warm_connections: int = Field(
+        5,
+        ge=0,
+        description="Database connections opened at startup to pre-warm the pool, at most its size.",
+    )
+    db_pool_warm_timeout: float = Field(
+        30.0, gt=0, description="Seconds startup waits for the pool warm-up to complete."
+    )
 
     @computed_field
-    @property
+    @cached_property
     def database_url(self) -> str:
-        """Construct PostgreSQL connection URL from individual components."""
+        """Construct PostgreSQL connection URL from individual components, once per instance."""
         return (
             f"postgresql://{quote_plus(self.db_username)}:{quote_plus(self.db_password)}"
             f"@{self.db_host}:{self.db_port}/{self.db_name}"
@@ -43,6 +92,12 @@ class Settings(BaseSettings):
     redis_db: int = Field(0, description="Database number for Redis.")
     redis_password: str = Field(..., description="Password for authenticating with Redis.")
     redis_max_connections: int = Field(10, description="Maximum number of connections to Redis.")
+    compiled_statement_cache_enabled: bool = Field(
+        True, description="Whether to cache compiled statement lookups in Redis."
+    )
+    compiled_statement_cache_ttl: int = Field(
+        300, gt=0, description="Seconds a cached compiled statement stays valid."
+    )
 
     # LLM configuration
     open_router_api_key: str = Field(..., description="API key for OpenRouter services.")
@@ -96,8 +151,9 @@ class Settings(BaseSettings):
     model_config = {"env_file": ".env", "frozen": True}
 
 
+@cache
 def get_settings() -> Settings:
-    """Get application settings instance.
+    """Get the application settings, loaded once per process.
 
     Returns:
         Settings instance loaded from environment variables.
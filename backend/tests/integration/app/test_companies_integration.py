@@ -118,6 +118,39 @@ class TestCompaniesIntegration:
         # Clean up
         test_client.delete(f"/api/v1/companies/{company_id}")
 
+    def test_get_company_by_ticker_prefers_primary_over_listing_without_primary(
+        self, test_client: TestClient
+    ):
+        """Test a primary ticker match wins over a company listing it with no primary ticker."""
+        # Create the secondary listing first, so it also has the lower ID
+        listing_response = test_client.post(
+            "/api/v1/companies",
+            json={
+                "name": "Listing Only Company",
+                "ir_url": "https://example.com/ir",
+                "tickers": [{"ticker": "PRM", "exchange": "LSE"}],
+            },
+        )
+        primary_response = test_client.post(
+            "/api/v1/companies",
+            json={
+                "name": "Primary Ticker Company",
+                "ir_url": "https://example.com/ir",
+                "primary_ticker": "PRM",
+            },
+        )
+        listing_id = listing_response.json()["id"]
+        primary_id = primary_response.json()["id"]
+
+        # Get by ticker
+        get_response = test_client.get("/api/v1/companies/ticker/PRM")
+        assert get_response.status_code == status.HTTP_200_OK
+        assert get_response.json()["id"] == primary_id
+
+        # Clean up
+        test_client.delete(f"/api/v1/companies/{listing_id}")
+        test_client.delete(f"/api/v1/companies/{primary_id}")
+
     def test_create_multiple_companies_success(self, test_client: TestClient):
         """Test that creating multiple companies succeeds."""
         # Create first company
@@ -0,0 +1,85 @@
+"""
+Integration tests for compiled statement upserts.
+
+These tests use testcontainers to spin up a real PostgreSQL database and
+run the ON CONFLICT DO UPDATE ... WHERE data IS DISTINCT FROM upserts.
+
+Author: Patryk Golabek
+Copyright: 2025 Patryk Golabek
+"""
+
+import pytest
+from sqlalchemy import text
+
+from app.db.repositories.compiled_statement import CompiledStatementRepository
+
+_ROW_VERSIONS = text(
+    "SELECT statement_type, xmin::text FROM compiled_statements WHERE company_id = :company_id"
+)
+
+
+@pytest.mark.integration
+class TestCompiledStatementUpsertIntegration:
+    """Integration tests for single and bulk compiled statement upserts."""
+
+    async def test_bulk_upsert_updates_changed_rows_and_returns_unchanged_rows(
+        self, test_db_session
+    ):
+        """Test only changed data is rewritten while every row is returned."""
+        # Arrange
+        company_id = await test_db_session.scalar(
+            text(
+                "INSERT INTO companies (name, ir_url) "
+                "VALUES ('Upsert Company', 'https://example.com/ir') RETURNING id"
+            )
+        )
+        await CompiledStatementRepository(test_db_session).bulk_create(
+            [
+                {"company_id": company_id, "statement_type": "income_statement", "data": {"a": 1}},
+                {"company_id": company_id, "statement_type": "balance_sheet", "data": {"b": 1}},
+            ]
+        )
+        await test_db_session.commit()
+        before = dict(
+            (await test_db_session.execute(_ROW_VERSIONS, {"company_id": company_id})).all()
+        )
+
+        # Act
+        result = await CompiledStatementRepository(test_db_session).bulk_upsert(
+            [
+                {"company_id": company_id, "statement_type": "income_statement", "data": {"a": 1}},
+                {"company_id": company_id, "statement_type": "balance_sheet", "data": {"b": 2}},
+            ]
+        )
+        await test_db_session.commit()
+        after = dict(
+            (await test_db_session.execute(_ROW_VERSIONS, {"company_id": company_id})).all()
+        )
+
+        # Assert
+        assert [(cs.statement_type, cs.data) for cs in result] == [
+            ("income_statement", {"a": 1}),
+            ("balance_sheet", {"b": 2}),
+        ]
+        assert after["income_statement"] == before["income_statement"]
+        assert after["balance_sheet"] != before["balance_sheet"]
+
+        # Clean up
+        await test_db_session.execute(
+            text("DELETE FROM companies WHERE id = :company_id"), {"company_id": company_id}
+        )
+
+    async def test_upsert_skips_unknown_company(self, test_db_session):
+        """Test an upsert for a missing company inserts nothing and returns None."""
+        # Arrange
+        repository = CompiledStatementRepository(test_db_session)
+
+        # Act
+        result = await repository.upsert(-1, "income_statement", {"a": 1})
+
+        # Assert
+        assert result is None
+        remaining = await test_db_session.scalar(
+            text("SELECT count(*) FROM compiled_statements WHERE company_id = -1")
+        )
+        assert remaining == 0
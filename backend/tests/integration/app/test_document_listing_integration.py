@@ -0,0 +1,70 @@
+"""
+Integration tests for keyset paging of company document listings.
+
+These tests use testcontainers to spin up a real PostgreSQL database and
+page through documents with the repository's keyset cursor.
+
+Author: Patryk Golabek
+Copyright: 2025 Patryk Golabek
+"""
+
+import pytest
+from sqlalchemy import text
+
+from alembic import command
+from app.db.repositories.document import DocumentRepository
+
+
+@pytest.mark.integration
+class TestDocumentListingIntegration:
+    """Integration tests for paging documents newest first."""
+
+    async def test_cursor_pages_reach_document_created_without_timestamp(
+        self, alembic_cfg, test_db_session
+    ):
+        """Test a document stored with a NULL created_at is still reached by cursor paging."""
+        # Arrange: store the document as it could be before migration 005
+        command.downgrade(alembic_cfg, "004")
+        company_id = await test_db_session.scalar(
+            text(
+                "INSERT INTO companies (name, ir_url) "
+                "VALUES ('Keyset Company', 'https://example.com/ir') RETURNING id"
+            )
+        )
+        for url, created_at in (
+            ("https://example.com/a.pdf", "2025-01-02"),
+            ("https://example.com/b.pdf", None),
+            ("https://example.com/c.pdf", "2025-01-01"),
+        ):
+            await test_db_session.execute(
+                text(
+                    "INSERT INTO documents (company_id, url, fiscal_year, document_type, created_at) "
+                    "VALUES (:company_id, :url, 2024, 'annual_report', CAST(:created_at AS timestamptz))"
+                ),
+                {"company_id": company_id, "url": url, "created_at": created_at},
+            )
+        await test_db_session.commit()
+        command.upgrade(alembic_cfg, "head")
+        repository = DocumentRepository(test_db_session)
+
+        # Act
+        seen: list[str] = []
+        page = await repository.get_rows_by_company(company_id, limit=1)
+        while page:
+            seen.extend(row["url"] for row in page)
+            last = page[-1]
+            page = await repository.get_rows_by_company(
+                company_id, limit=1, after=(last["fiscal_year"], last["created_at"], last["id"])
+            )
+
+        # Assert
+        assert seen == [
+            "https://example.com/a.pdf",
+            "https://example.com/c.pdf",
+            "https://example.com/b.pdf",
+        ]
+
+        # Clean up
+        await test_db_session.execute(
+            text("DELETE FROM companies WHERE id = :company_id"), {"company_id": company_id}
+        )
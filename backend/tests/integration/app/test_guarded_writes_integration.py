@@ -0,0 +1,95 @@
+"""
+Integration tests for the repositories' single-statement guarded writes.
+
+These tests use testcontainers to spin up a real PostgreSQL database and
+run the INSERT ... SELECT WHERE EXISTS and DELETE ... RETURNING statements.
+
+Author: Patryk Golabek
+Copyright: 2025 Patryk Golabek
+"""
+
+import pytest
+from sqlalchemy import text
+
+from app.db.repositories.document import DocumentRepository
+from app.db.repositories.extraction import ExtractionRepository
+
+
+@pytest.mark.integration
+class TestGuardedWritesIntegration:
+    """Integration tests for guarded inserts and RETURNING deletes."""
+
+    async def test_guarded_inserts_skip_unknown_parents_without_aborting(self, test_db_session):
+        """Test an unknown parent yields None and leaves the transaction usable."""
+        # Arrange
+        company_id = await test_db_session.scalar(
+            text(
+                "INSERT INTO companies (name, ir_url) "
+                "VALUES ('Guarded Company', 'https://example.com/ir') RETURNING id"
+            )
+        )
+        documents = DocumentRepository(test_db_session)
+        extractions = ExtractionRepository(test_db_session)
+
+        # Act
+        missing_document = await documents.create_if_company_exists(
+            -1, "https://example.com/missing.pdf", 2024, "annual_report"
+        )
+        document = await documents.create_if_company_exists(
+            company_id, "https://example.com/report.pdf", 2024, "annual_report"
+        )
+        missing_extraction = await extractions.create_if_document_exists(
+            -1, "income_statement", {"revenue": 1}
+        )
+        extraction = await extractions.create_if_document_exists(
+            document.id, "income_statement", {"revenue": 1}
+        )
+
+        # Assert
+        assert missing_document is None
+        assert missing_extraction is None
+        assert document.company_id == company_id
+        assert extraction.document_id == document.id
+        assert extraction.raw_data == {"revenue": 1}
+
+        # Clean up
+        await test_db_session.execute(
+            text("DELETE FROM companies WHERE id = :company_id"), {"company_id": company_id}
+        )
+
+    async def test_delete_reports_whether_a_row_was_removed(self, test_db_session):
+        """Test DELETE ... RETURNING reports True once and False for the gone row."""
+        # Arrange
+        company_id = await test_db_session.scalar(
+            text(
+                "INSERT INTO companies (name, ir_url) "
+                "VALUES ('Delete Company', 'https://example.com/ir') RETURNING id"
+            )
+        )
+        documents = DocumentRepository(test_db_session)
+        extractions = ExtractionRepository(test_db_session)
+        document = await documents.create_if_company_exists(
+            company_id, "https://example.com/report.pdf", 2024, "annual_report"
+        )
+        extraction = await extractions.create_if_document_exists(
+            document.id, "income_statement", {"revenue": 1}
+        )
+        document_id, extraction_id = document.id, extraction.id
+
+        # Act
+        extraction_deleted = [await extractions.delete(extraction_id) for _ in range(2)]
+        document_deleted = [await documents.delete(document_id) for _ in range(2)]
+
+        # Assert
+        assert extraction_deleted == [True, False]
+        assert document_deleted == [True, False]
+        remaining = await test_db_session.scalar(
+            text("SELECT count(*) FROM documents WHERE company_id = :company_id"),
+            {"company_id": company_id},
+        )
+        assert remaining == 0
+
+        # Clean up
+        await test_db_session.execute(
+            text("DELETE FROM companies WHERE id = :company_id"), {"company_id": company_id}
+        )
@@ -28,6 +28,7 @@ def mock_company_service() -> MagicMock:
     service = AsyncMock()
     service.create_company = AsyncMock()
     service.get_all_companies = AsyncMock()
+    service.get_all_companies_json = AsyncMock()
     service.get_company = AsyncMock()
     service.get_company_by_ticker = AsyncMock()
     service.update_company = AsyncMock()
@@ -41,9 +42,10 @@ def mock_document_service() -> MagicMock:
     service = AsyncMock()
     service.create_document = AsyncMock()
     service.get_document = AsyncMock()
-    service.get_documents_by_company = AsyncMock()
-    service.get_documents_by_company_and_year = AsyncMock()
-    service.get_documents_by_company_and_type = AsyncMock()
+    service.get_documents_for_companies_json = AsyncMock()
+    service.get_documents_by_company_json = AsyncMock()
+    service.get_documents_by_company_and_year_json = AsyncMock()
+    service.get_documents_by_company_and_type_json = AsyncMock()
     service.update_document = AsyncMock()
     service.delete_document = AsyncMock()
     return service
@@ -56,12 +58,32 @@ def mock_extraction_service() -> MagicMock:
     service.create_extraction = AsyncMock()
     service.get_extraction = AsyncMock()
     service.get_extractions_by_document = AsyncMock()
+    service.get_extractions_for_documents_json = AsyncMock()
+    service.get_extractions_by_document_json = AsyncMock()
+    service.get_extraction_summaries_by_document = AsyncMock()
     service.get_extraction_by_document_and_type = AsyncMock()
     service.update_extraction = AsyncMock()
     service.delete_extraction = AsyncMock()
     return service
 
 
+@pytest.fixture
+def mock_compiled_statement_service() -> MagicMock:
+    """Create a mock CompiledStatementService for testing."""
+    service = AsyncMock()
+    service.get_compiled_statement = AsyncMock()
+    service.get_compiled_statements_by_ids = AsyncMock()
+    service.get_compiled_statements_by_company_json = AsyncMock()
+    service.get_compiled_statement_summaries_by_company = AsyncMock()
+    service.get_compiled_statement_by_company_and_type = AsyncMock()
+    service.get_compiled_statement_by_company_and_type_json = AsyncMock()
+    service.update_compiled_statement = AsyncMock()
+    service.upsert_compiled_statement = AsyncMock()
+    service.bulk_upsert_compiled_statements = AsyncMock()
+    service.delete_compiled_statement = AsyncMock()
+    return service
+
+
 @pytest.fixture
 def sample_company_data() -> CompanyDomain:
     """Sample company data for testing."""
@@ -102,7 +124,12 @@ def sample_extraction_data() -> dict:
 
 
 @pytest.fixture
-def test_app(mock_company_service, mock_document_service, mock_extraction_service) -> FastAPI:
+def test_app(
+    mock_company_service,
+    mock_document_service,
+    mock_extraction_service,
+    mock_compiled_statement_service,
+) -> FastAPI:
     """
     Create a FastAPI test app with mocked dependencies.
 
@@ -110,6 +137,7 @@ def test_app(mock_company_service, mock_document_service, mock_extraction_servic
         mock_company_service: Mock CompanyService.
         mock_document_service: Mock DocumentService.
         mock_extraction_service: Mock ExtractionService.
+        mock_compiled_statement_service: Mock CompiledStatementService.
 
     Returns:
         FastAPI test application.
@@ -133,9 +161,15 @@ def test_app(mock_company_service, mock_document_service, mock_extraction_servic
     async def override_extraction_service():
         return mock_extraction_service
 
+    async def override_compiled_statement_service():
+        return mock_compiled_statement_service
+
     app.dependency_overrides[dependencies.get_company_service] = override_company_service
     app.dependency_overrides[dependencies.get_document_service] = override_document_service
     app.dependency_overrides[dependencies.get_extraction_service] = override_extraction_service
+    app.dependency_overrides[dependencies.get_compiled_statement_service] = (
+        override_compiled_statement_service
+    )
 
     return app
 
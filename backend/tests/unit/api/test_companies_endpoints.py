@@ -58,7 +58,9 @@ class TestCompaniesEndpoints:
     ):
         """Test successful listing of companies."""
         # Arrange
-        mock_company_service.get_all_companies.return_value = [sample_company_data]
+        mock_company_service.get_all_companies_json.return_value = (
+            f"[{sample_company_data.model_dump_json()}]".encode()
+        )
 
         # Act
         response = test_client.get("/companies?skip=0&limit=10")
@@ -69,21 +71,23 @@ class TestCompaniesEndpoints:
         assert isinstance(data, list)
         assert len(data) == 1
         assert data[0]["name"] == "Test Company"
-        mock_company_service.get_all_companies.assert_called_once_with(skip=0, limit=10)
+        mock_company_service.get_all_companies_json.assert_called_once_with(skip=0, limit=10)
 
     def test_list_companies_with_default_pagination(
         self, test_client: TestClient, mock_company_service, sample_company_data
     ):
         """Test listing companies with default pagination."""
         # Arrange
-        mock_company_service.get_all_companies.return_value = [sample_company_data]
+        mock_company_service.get_all_companies_json.return_value = (
+            f"[{sample_company_data.model_dump_json()}]".encode()
+        )
 
         # Act
         response = test_client.get("/companies")
 
         # Assert
         assert response.status_code == status.HTTP_200_OK
-        mock_company_service.get_all_companies.assert_called_once_with(skip=0, limit=100)
+        mock_company_service.get_all_companies_json.assert_called_once_with(skip=0, limit=100)
 
     def test_list_companies_with_invalid_pagination(self, test_client: TestClient):
         """Test listing companies with invalid pagination parameters."""
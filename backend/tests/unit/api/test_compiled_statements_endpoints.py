@@ -0,0 +1,192 @@
+"""
+Unit tests for Compiled Statements API endpoints.
+
+Author: Patryk Golabek
+Copyright: 2025 Patryk Golabek
+"""
+
+from datetime import UTC, datetime
+
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+
+from app.schemas.extraction import CompiledStatementResponse, CompiledStatementSummary
+
+
+@pytest.fixture
+def sample_compiled_statement() -> CompiledStatementResponse:
+    """Sample compiled statement for testing."""
+    return CompiledStatementResponse(
+        id=1,
+        company_id=1,
+        statement_type="income_statement",
+        data={"2023": {"revenue": 1000000}, "2024": {"revenue": 1200000}},
+        updated_at=datetime(2024, 1, 1, tzinfo=UTC),
+    )
+
+
+@pytest.mark.unit
+class TestCompiledStatementsEndpoints:
+    """Test cases for Compiled Statements endpoints."""
+
+    def test_get_compiled_statement_serializes_model(
+        self,
+        test_client: TestClient,
+        mock_compiled_statement_service,
+        sample_compiled_statement,
+    ):
+        """Test a compiled statement is returned as its pydantic JSON serialization."""
+        # Arrange
+        mock_compiled_statement_service.get_compiled_statement.return_value = (
+            sample_compiled_statement
+        )
+
+        # Act
+        response = test_client.get("/compiled-statements/1")
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"] == "application/json"
+        assert response.content == sample_compiled_statement.model_dump_json().encode()
+
+    def test_upsert_compiled_statement_returns_created(
+        self,
+        test_client: TestClient,
+        mock_compiled_statement_service,
+        sample_compiled_statement,
+    ):
+        """Test an upsert responds with 201 and the stored statement."""
+        # Arrange
+        mock_compiled_statement_service.upsert_compiled_statement.return_value = (
+            sample_compiled_statement
+        )
+        payload = {"company_id": 1, "statement_type": "income_statement", "data": {"2023": {}}}
+
+        # Act
+        response = test_client.post("/compiled-statements", json=payload)
+
+        # Assert
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.json()["data"]["2024"]["revenue"] == 1200000
+
+    def test_bulk_upsert_compiled_statements_returns_list(
+        self,
+        test_client: TestClient,
+        mock_compiled_statement_service,
+        sample_compiled_statement,
+    ):
+        """Test a bulk upsert responds with 201 and every stored statement."""
+        # Arrange
+        mock_compiled_statement_service.bulk_upsert_compiled_statements.return_value = [
+            sample_compiled_statement
+        ]
+        payload = [{"company_id": 1, "statement_type": "income_statement", "data": {}}]
+
+        # Act
+        response = test_client.post("/compiled-statements/bulk", json=payload)
+
+        # Assert
+        assert response.status_code == status.HTTP_201_CREATED
+        assert [item["id"] for item in response.json()] == [1]
+        args = mock_compiled_statement_service.bulk_upsert_compiled_statements.call_args.args
+        assert [item.company_id for item in args[0]] == [1]
+
+    def test_batch_get_compiled_statements(
+        self,
+        test_client: TestClient,
+        mock_compiled_statement_service,
+        sample_compiled_statement,
+    ):
+        """Test a batch get returns the found statements in one response."""
+        # Arrange
+        mock_compiled_statement_service.get_compiled_statements_by_ids.return_value = [
+            sample_compiled_statement
+        ]
+
+        # Act
+        response = test_client.post("/compiled-statements/batch-get", json={"ids": [1, 99]})
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert [item["id"] for item in response.json()] == [1]
+        mock_compiled_statement_service.get_compiled_statements_by_ids.assert_called_once_with(
+            [1, 99]
+        )
+
+    def test_list_compiled_statement_summaries_omits_data(
+        self, test_client: TestClient, mock_compiled_statement_service
+    ):
+        """Test the summaries listing returns metadata only."""
+        # Arrange
+        mock_compiled_statement_service.get_compiled_statement_summaries_by_company.return_value = [
+            CompiledStatementSummary(
+                id=1,
+                company_id=1,
+                statement_type="income_statement",
+                updated_at=datetime(2024, 1, 1, tzinfo=UTC),
+            )
+        ]
+
+        # Act
+        response = test_client.get("/compiled-statements/companies/1/summaries")
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == [
+            {
+                "id": 1,
+                "company_id": 1,
+                "statement_type": "income_statement",
+                "updated_at": "2024-01-01T00:00:00Z",
+            }
+        ]
+        mock_compiled_statement_service.get_compiled_statement_summaries_by_company.assert_called_once_with(
+            1
+        )
+
+    def test_get_compiled_statement_by_company_and_type_forwards_json(
+        self, test_client: TestClient, mock_compiled_statement_service
+    ):
+        """Test the statement lookup returns the service's serialized JSON unchanged."""
+        # Arrange
+        content = b'{"id":1,"company_id":1,"statement_type":"balance_sheet","data":{}}'
+        mock_compiled_statement_service.get_compiled_statement_by_company_and_type_json.return_value = content
+
+        # Act
+        response = test_client.get("/compiled-statements/companies/1/statement-type/balance_sheet")
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"] == "application/json"
+        assert response.content == content
+        mock_compiled_statement_service.get_compiled_statement_by_company_and_type_json.assert_called_once_with(
+            1, "balance_sheet"
+        )
+
+    def test_batch_get_compiled_statements_rejects_too_many_ids(
+        self, test_client: TestClient, mock_compiled_statement_service
+    ):
+        """Test a batch get above the ID limit fails validation."""
+        # Act
+        response = test_client.post(
+            "/compiled-statements/batch-get", json={"ids": list(range(501))}
+        )
+
+        # Assert
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        mock_compiled_statement_service.get_compiled_statements_by_ids.assert_not_called()
+
+    def test_bulk_upsert_compiled_statements_rejects_oversized_batch(
+        self, test_client: TestClient, mock_compiled_statement_service
+    ):
+        """Test a bulk upsert above the batch limit fails validation."""
+        # Arrange
+        payload = [{"company_id": 1, "statement_type": f"type_{i}", "data": {}} for i in range(501)]
+
+        # Act
+        response = test_client.post("/compiled-statements/bulk", json=payload)
+
+        # Assert
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        mock_compiled_statement_service.bulk_upsert_compiled_statements.assert_not_called()
@@ -5,10 +5,15 @@ Author: Patryk Golabek
 Copyright: 2025 Patryk Golabek
 """
 
+from unittest.mock import AsyncMock, MagicMock
+
+import orjson
 import pytest
-from fastapi import status
+from fastapi import FastAPI, status
 from fastapi.testclient import TestClient
 
+from app.services.dependencies import get_storage_service
+
 
 @pytest.mark.unit
 class TestDocumentsEndpoints:
@@ -91,7 +96,10 @@ class TestDocumentsEndpoints:
     ):
         """Test successful listing of documents by company."""
         # Arrange
-        mock_document_service.get_documents_by_company.return_value = [sample_document_data]
+        mock_document_service.get_documents_by_company_json.return_value = (
+            orjson.dumps([sample_document_data]),
+            None,
+        )
 
         # Act
         response = test_client.get("/documents/companies/1?skip=0&limit=10")
@@ -101,8 +109,8 @@ class TestDocumentsEndpoints:
         data = response.json()
         assert isinstance(data, list)
         assert len(data) == 1
-        mock_document_service.get_documents_by_company.assert_called_once_with(
-            company_id=1, skip=0, limit=10
+        mock_document_service.get_documents_by_company_json.assert_called_once_with(
+            company_id=1, skip=0, limit=10, after=None
         )
 
     def test_list_documents_by_company_with_default_pagination(
@@ -110,25 +118,93 @@ class TestDocumentsEndpoints:
     ):
         """Test listing documents by company with default pagination."""
         # Arrange
-        mock_document_service.get_documents_by_company.return_value = [sample_document_data]
+        mock_document_service.get_documents_by_company_json.return_value = (
+            orjson.dumps([sample_document_data]),
+            None,
+        )
 
         # Act
         response = test_client.get("/documents/companies/1")
 
         # Assert
         assert response.status_code == status.HTTP_200_OK
-        mock_document_service.get_documents_by_company.assert_called_once_with(
-            company_id=1, skip=0, limit=100
+        mock_document_service.get_documents_by_company_json.assert_called_once_with(
+            company_id=1, skip=0, limit=100, after=None
+        )
+
+    def test_list_documents_by_company_pages_with_cursor(
+        self, test_client: TestClient, mock_document_service, sample_document_data
+    ):
+        """Test the cursor is passed through and the next one returned in a header."""
+        # Arrange
+        mock_document_service.get_documents_by_company_json.return_value = (
+            orjson.dumps([sample_document_data]),
+            "next-token",
+        )
+
+        # Act
+        response = test_client.get("/documents/companies/1?limit=1&after=token")
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["X-Next-Cursor"] == "next-token"
+        mock_document_service.get_documents_by_company_json.assert_called_once_with(
+            company_id=1, skip=0, limit=1, after="token"
+        )
+
+    def test_list_documents_by_company_last_page_has_no_cursor(
+        self, test_client: TestClient, mock_document_service
+    ):
+        """Test the last page of a listing carries no next-cursor header."""
+        # Arrange
+        mock_document_service.get_documents_by_company_json.return_value = (b"[]", None)
+
+        # Act
+        response = test_client.get("/documents/companies/1")
+
+        # Assert
+        assert "X-Next-Cursor" not in response.headers
+
+    def test_batch_get_documents_by_company_keys_by_company(
+        self, test_client: TestClient, mock_document_service, sample_document_data
+    ):
+        """Test a batch lookup returns each company's documents under its ID."""
+        # Arrange
+        mock_document_service.get_documents_for_companies_json.return_value = orjson.dumps(
+            {1: [sample_document_data], 2: []}, option=orjson.OPT_NON_STR_KEYS
+        )
+
+        # Act
+        response = test_client.post("/documents/companies/batch-get", json={"company_ids": [1, 2]})
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert [document["id"] for document in data["1"]] == [1]
+        assert data["2"] == []
+        mock_document_service.get_documents_for_companies_json.assert_called_once_with([1, 2])
+
+    def test_batch_get_documents_by_company_rejects_too_many_ids(
+        self, test_client: TestClient, mock_document_service
+    ):
+        """Test a batch lookup above the company limit fails validation."""
+        # Act
+        response = test_client.post(
+            "/documents/companies/batch-get", json={"company_ids": list(range(101))}
         )
 
+        # Assert
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        mock_document_service.get_documents_for_companies_json.assert_not_called()
+
     def test_get_documents_by_company_and_year_success(
         self, test_client: TestClient, mock_document_service, sample_document_data
     ):
         """Test successful retrieval of documents by company and year."""
         # Arrange
-        mock_document_service.get_documents_by_company_and_year.return_value = [
-            sample_document_data
-        ]
+        mock_document_service.get_documents_by_company_and_year_json.return_value = orjson.dumps(
+            [sample_document_data]
+        )
 
         # Act
         response = test_client.get("/documents/companies/1/fiscal-year/2023")
@@ -137,7 +213,7 @@ class TestDocumentsEndpoints:
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
         assert isinstance(data, list)
-        mock_document_service.get_documents_by_company_and_year.assert_called_once_with(
+        mock_document_service.get_documents_by_company_and_year_json.assert_called_once_with(
             company_id=1, fiscal_year=2023
         )
 
@@ -155,9 +231,10 @@ class TestDocumentsEndpoints:
     ):
         """Test successful retrieval of documents by company and type."""
         # Arrange
-        mock_document_service.get_documents_by_company_and_type.return_value = [
-            sample_document_data
-        ]
+        mock_document_service.get_documents_by_company_and_type_json.return_value = (
+            orjson.dumps([sample_document_data]),
+            None,
+        )
 
         # Act
         response = test_client.get("/documents/companies/1/type/Annual%20Report?skip=0&limit=10")
@@ -166,8 +243,8 @@ class TestDocumentsEndpoints:
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
         assert isinstance(data, list)
-        mock_document_service.get_documents_by_company_and_type.assert_called_once_with(
-            company_id=1, document_type="Annual Report", skip=0, limit=10
+        mock_document_service.get_documents_by_company_and_type_json.assert_called_once_with(
+            company_id=1, document_type="Annual Report", skip=0, limit=10, after=None
         )
 
     def test_get_documents_by_company_and_type_with_invalid_pagination(
@@ -273,7 +350,7 @@ class TestDocumentsEndpoints:
     def test_list_documents_empty_result(self, test_client: TestClient, mock_document_service):
         """Test listing documents with empty result."""
         # Arrange
-        mock_document_service.get_documents_by_company.return_value = []
+        mock_document_service.get_documents_by_company_json.return_value = (b"[]", None)
 
         # Act
         response = test_client.get("/documents/companies/1")
@@ -282,3 +359,55 @@ class TestDocumentsEndpoints:
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
         assert data == []
+
+    @pytest.fixture
+    def mock_storage_service(self, test_app: FastAPI) -> MagicMock:
+        """Override the storage service dependency with a mock."""
+        storage_service = MagicMock()
+        storage_service.get_file = AsyncMock()
+        storage_service.file_exists = AsyncMock()
+        test_app.dependency_overrides[get_storage_service] = lambda: storage_service
+        return storage_service
+
+    def test_download_storage_pdf_reads_without_existence_probe(
+        self, test_client: TestClient, mock_storage_service
+    ):
+        """Test a download is a single storage read with no separate existence check."""
+        # Arrange
+        mock_storage_service.get_file.return_value = b"%PDF-1.7"
+
+        # Act
+        response = test_client.get("/documents/storage/download?object_key=1/2023/report.pdf")
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert response.content == b"%PDF-1.7"
+        assert response.headers["content-disposition"] == 'inline; filename="report.pdf"'
+        mock_storage_service.get_file.assert_awaited_once_with("1/2023/report.pdf")
+        mock_storage_service.file_exists.assert_not_called()
+
+    def test_download_storage_pdf_not_found(self, test_client: TestClient, mock_storage_service):
+        """Test a missing object is reported as a 404 rather than a 500."""
+        # Arrange
+        mock_storage_service.get_file.side_effect = FileNotFoundError("File not found")
+
+        # Act
+        response = test_client.get("/documents/storage/download?object_key=missing.pdf")
+
+        # Assert
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert response.json()["detail"] == "PDF file not found: missing.pdf"
+
+    def test_download_storage_pdf_storage_failure(
+        self, test_client: TestClient, mock_storage_service
+    ):
+        """Test a storage failure is reported as a 500."""
+        # Arrange
+        mock_storage_service.get_file.side_effect = RuntimeError("connection refused")
+
+        # Act
+        response = test_client.get("/documents/storage/download?object_key=report.pdf")
+
+        # Assert
+        assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+        assert response.json()["detail"] == "Failed to retrieve PDF file: connection refused"
@@ -8,8 +8,10 @@ Copyright: 2025 Patryk Golabek
 import logging
 from unittest.mock import MagicMock, Mock
 
+import orjson
 import pytest
 from fastapi import FastAPI, HTTPException, Request, status
+from sqlalchemy.exc import IntegrityError
 
 from app.api.middleware.fastapi_error_handler import ErrorHandler
 from app.core.exceptions.api_exceptions import (
@@ -23,6 +25,12 @@ from app.core.exceptions.api_exceptions import (
 )
 
 
+class _UniqueViolationError(Exception):
+    """Driver exception stand-in carrying the violated constraint, like asyncpg's."""
+
+    constraint_name = "uq_company_statement_type"
+
+
 @pytest.mark.unit
 class TestErrorHandler:
     """Test cases for ErrorHandler middleware."""
@@ -58,7 +66,7 @@ class TestErrorHandler:
     def test_register_default_handlers(self, error_handler: ErrorHandler):
         """Test registering default exception handlers."""
         # Arrange
-        expected_handlers = 10
+        expected_handlers = 11
 
         # Act
         error_handler.register_default_handlers()
@@ -186,6 +194,41 @@ class TestErrorHandler:
         # Assert
         assert response.status_code == expected_status
 
+    @pytest.mark.asyncio
+    async def test_integrity_error_handler_returns_409_with_constraint(
+        self, error_handler: ErrorHandler, mock_request: MagicMock
+    ):
+        """Test a database constraint violation returns 409 naming the constraint."""
+        # Arrange
+        orig = Exception("duplicate key value violates unique constraint")
+        orig.__cause__ = _UniqueViolationError()
+        exc = IntegrityError("INSERT INTO compiled_statements ...", {}, orig)
+
+        # Act
+        response = await error_handler.integrity_error_handler(mock_request, exc)
+
+        # Assert
+        assert response.status_code == status.HTTP_409_CONFLICT
+        body = orjson.loads(response.body)
+        assert body["type"] == ErrorType.CONFLICT.value
+        assert "'uq_company_statement_type'" in body["detail"]
+
+    @pytest.mark.asyncio
+    async def test_integrity_error_handler_without_constraint_name(
+        self, error_handler: ErrorHandler, mock_request: MagicMock
+    ):
+        """Test a violation whose driver error names no constraint returns a generic 409."""
+        # Arrange
+        exc = IntegrityError("INSERT INTO companies ...", {}, Exception("violation"))
+
+        # Act
+        response = await error_handler.integrity_error_handler(mock_request, exc)
+
+        # Assert
+        assert response.status_code == status.HTTP_409_CONFLICT
+        body = orjson.loads(response.body)
+        assert body["detail"].endswith("Request conflicts with the current state of the database.")
+
     @pytest.mark.asyncio
     async def test_general_exception_handler_returns_500(
         self, error_handler: ErrorHandler, mock_request: MagicMock
@@ -5,10 +5,15 @@ Author: Patryk Golabek
 Copyright: 2025 Patryk Golabek
 """
 
+from datetime import UTC, datetime
+
+import orjson
 import pytest
 from fastapi import status
 from fastapi.testclient import TestClient
 
+from app.schemas.extraction import ExtractionSummary
+
 
 @pytest.mark.unit
 class TestExtractionsEndpoints:
@@ -89,24 +94,70 @@ class TestExtractionsEndpoints:
     ):
         """Test successful listing of extractions by document."""
         # Arrange
-        mock_extraction_service.get_extractions_by_document.return_value = [sample_extraction_data]
+        content = orjson.dumps([sample_extraction_data])
+        mock_extraction_service.get_extractions_by_document_json.return_value = content
 
         # Act
         response = test_client.get("/extractions/documents/1")
 
         # Assert
         assert response.status_code == status.HTTP_200_OK
-        data = response.json()
-        assert isinstance(data, list)
-        assert len(data) == 1
-        mock_extraction_service.get_extractions_by_document.assert_called_once_with(1)
+        assert response.headers["content-type"] == "application/json"
+        assert response.content == content
+        mock_extraction_service.get_extractions_by_document_json.assert_called_once_with(1)
+
+    def test_batch_get_extractions_by_document_keys_by_document(
+        self, test_client: TestClient, mock_extraction_service, sample_extraction_data
+    ):
+        """Test a batch lookup returns each document's extractions under its ID."""
+        # Arrange
+        mock_extraction_service.get_extractions_for_documents_json.return_value = orjson.dumps(
+            {1: [sample_extraction_data]}, option=orjson.OPT_NON_STR_KEYS
+        )
+
+        # Act
+        response = test_client.post("/extractions/documents/batch-get", json={"document_ids": [1]})
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["1"][0]["raw_data"] == sample_extraction_data["raw_data"]
+        mock_extraction_service.get_extractions_for_documents_json.assert_called_once_with([1])
+
+    def test_list_extraction_summaries_omits_raw_data(
+        self, test_client: TestClient, mock_extraction_service
+    ):
+        """Test the summaries listing returns metadata only."""
+        # Arrange
+        mock_extraction_service.get_extraction_summaries_by_document.return_value = [
+            ExtractionSummary(
+                id=1,
+                document_id=1,
+                statement_type="income_statement",
+                created_at=datetime(2024, 1, 1, tzinfo=UTC),
+            )
+        ]
+
+        # Act
+        response = test_client.get("/extractions/documents/1/summaries")
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == [
+            {
+                "id": 1,
+                "document_id": 1,
+                "statement_type": "income_statement",
+                "created_at": "2024-01-01T00:00:00Z",
+            }
+        ]
+        mock_extraction_service.get_extraction_summaries_by_document.assert_called_once_with(1)
 
     def test_list_extractions_by_document_empty_result(
         self, test_client: TestClient, mock_extraction_service
     ):
         """Test listing extractions with empty result."""
         # Arrange
-        mock_extraction_service.get_extractions_by_document.return_value = []
+        mock_extraction_service.get_extractions_by_document_json.return_value = b"[]"
 
         # Act
         response = test_client.get("/extractions/documents/1")
@@ -262,11 +313,9 @@ class TestExtractionsEndpoints:
         extraction_3 = sample_extraction_data.copy()
         extraction_3["id"] = 3
         extraction_3["statement_type"] = "Cash Flow Statement"
-        mock_extraction_service.get_extractions_by_document.return_value = [
-            sample_extraction_data,
-            extraction_2,
-            extraction_3,
-        ]
+        mock_extraction_service.get_extractions_by_document_json.return_value = orjson.dumps(
+            [sample_extraction_data, extraction_2, extraction_3]
+        )
 
         # Act
         response = test_client.get("/extractions/documents/1")
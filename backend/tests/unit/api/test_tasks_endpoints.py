@@ -0,0 +1,51 @@
+"""
+Unit tests for Tasks API endpoints.
+
+Author: Patryk Golabek
+Copyright: 2025 Patryk Golabek
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+
+from app.api.v1.endpoints import tasks
+
+
+@pytest.mark.unit
+class TestTasksEndpoints:
+    """Test cases for Tasks endpoints."""
+
+    def test_trigger_scrape_queues_task(self, test_client: TestClient, monkeypatch):
+        """Test that a trigger route queues the task and reports it as pending."""
+        # Arrange
+        task = MagicMock()
+        task.delay.return_value = SimpleNamespace(id="task-123")
+        monkeypatch.setattr(tasks, "scrape_investor_relations", task)
+
+        # Act
+        response = test_client.post("/tasks/companies/1/scrape")
+
+        # Assert
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        data = response.json()
+        assert data["task_id"] == "task-123"
+        assert data["status"] == "PENDING"
+        task.delay.assert_called_once_with(1)
+
+    def test_trigger_scrape_broker_failure(self, test_client: TestClient, monkeypatch):
+        """Test that a failure to queue the task is reported as a 500."""
+        # Arrange
+        task = MagicMock()
+        task.delay.side_effect = ConnectionError("broker unavailable")
+        monkeypatch.setattr(tasks, "scrape_investor_relations", task)
+
+        # Act
+        response = test_client.post("/tasks/companies/1/scrape")
+
+        # Assert
+        assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+        assert response.json()["detail"] == "Failed to trigger scraping task: broker unavailable"
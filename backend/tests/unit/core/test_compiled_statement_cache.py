@@ -0,0 +1,121 @@
+"""
+Unit tests for the Redis-backed compiled statement cache.
+
+Author: Patryk Golabek
+Copyright: 2025 Patryk Golabek
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.core.cache import CompiledStatementCache, create_compiled_statement_cache
+
+
+@pytest.fixture
+def redis_client() -> AsyncMock:
+    """Create a mock async Redis client."""
+    return AsyncMock()
+
+
+@pytest.fixture
+def redis_settings() -> SimpleNamespace:
+    """Settings stand-in with the compiled statement cache enabled."""
+    return SimpleNamespace(
+        redis_host="localhost",
+        redis_port=6379,
+        redis_db=0,
+        redis_password="",
+        redis_max_connections=10,
+        compiled_statement_cache_enabled=True,
+        compiled_statement_cache_ttl=300,
+    )
+
+
+@pytest.mark.unit
+class TestCompiledStatementCache:
+    """Test cases for CompiledStatementCache."""
+
+    @pytest.mark.asyncio
+    async def test_set_stores_payload_with_ttl(self, redis_client):
+        """Test a cached statement is stored under its key with the TTL."""
+        # Arrange
+        cache = CompiledStatementCache(redis_client, ttl=300)
+
+        # Act
+        await cache.set(1, "balance_sheet", b"{}")
+
+        # Assert
+        redis_client.set.assert_called_once_with("cs:1:balance_sheet", b"{}", ex=300)
+
+    @pytest.mark.asyncio
+    async def test_invalidate_drops_all_keys_with_one_call(self, redis_client):
+        """Test several statements are invalidated with a single DEL."""
+        # Arrange
+        cache = CompiledStatementCache(redis_client, ttl=300)
+
+        # Act
+        await cache.invalidate((1, "balance_sheet"), (2, "cash_flow_statement"))
+        await cache.invalidate()
+
+        # Assert
+        redis_client.delete.assert_called_once_with(
+            "cs:1:balance_sheet", "cs:2:cash_flow_statement"
+        )
+
+    @pytest.mark.asyncio
+    async def test_invalidate_company_drops_every_statement_type(self, redis_client):
+        """Test all cached statements of a company are found by pattern and dropped."""
+        # Arrange
+        keys = [b"cs:1:balance_sheet", b"cs:1:custom"]
+
+        async def scan_iter(match):
+            for key in keys:
+                yield key
+
+        redis_client.scan_iter = MagicMock(side_effect=scan_iter)
+        cache = CompiledStatementCache(redis_client, ttl=300)
+
+        # Act
+        await cache.invalidate_company(1)
+
+        # Assert
+        redis_client.scan_iter.assert_called_once_with(match="cs:1:*")
+        redis_client.delete.assert_called_once_with(*keys)
+
+    @pytest.mark.asyncio
+    async def test_redis_errors_are_treated_as_misses(self, redis_client):
+        """Test an unreachable Redis degrades to cache misses instead of failing."""
+        # Arrange
+        redis_client.get.side_effect = RedisConnectionError("down")
+        redis_client.set.side_effect = RedisConnectionError("down")
+        redis_client.delete.side_effect = RedisConnectionError("down")
+        cache = CompiledStatementCache(redis_client, ttl=300)
+
+        # Act
+        cached = await cache.get(1, "balance_sheet")
+        await cache.set(1, "balance_sheet", b"{}")
+        await cache.invalidate((1, "balance_sheet"))
+
+        # Assert
+        assert cached is None
+
+    def test_create_from_settings(self, redis_settings):
+        """Test the cache is built from the Redis settings without connecting."""
+        # Act
+        cache = create_compiled_statement_cache(redis_settings)
+
+        # Assert
+        assert cache is not None
+        assert cache.ttl == 300
+        assert cache.client.connection_pool.connection_kwargs["password"] is None
+
+    def test_create_returns_none_when_disabled(self, redis_settings):
+        """Test no cache is built when it is disabled in settings."""
+        # Arrange
+        redis_settings.compiled_statement_cache_enabled = False
+
+        # Act & Assert
+        assert create_compiled_statement_cache(redis_settings) is None
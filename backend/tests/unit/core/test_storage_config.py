@@ -0,0 +1,59 @@
+"""
+Unit tests for storage service configuration and sharing.
+
+Author: Patryk Golabek
+Copyright: 2025 Patryk Golabek
+"""
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.storage import StorageServiceConfig
+from app.services import dependencies
+
+
+@pytest.fixture
+def local_settings() -> SimpleNamespace:
+    """Settings stand-in with object storage disabled."""
+    return SimpleNamespace(
+        minio_enabled=False,
+        minio_endpoint="localhost:9000",
+        minio_access_key="access",
+        minio_secret_key="secret",
+        minio_bucket_name="financial-documents",
+        minio_use_ssl=False,
+        pdf_storage_base_path="data/test-pdfs",
+    )
+
+
+@pytest.mark.unit
+class TestStorageServiceConfig:
+    """Test cases for building and sharing the storage service."""
+
+    def test_from_settings_maps_storage_fields(self, local_settings):
+        """Test every storage setting is carried into the configuration."""
+        # Act
+        config = StorageServiceConfig.from_settings(local_settings)
+
+        # Assert
+        assert config.enabled is False
+        assert config.bucket_name == "financial-documents"
+        assert config.base_storage_path == Path("data/test-pdfs")
+
+    @pytest.mark.asyncio
+    async def test_get_storage_service_reuses_one_instance(self, monkeypatch, local_settings):
+        """Test the storage dependency builds the service once per process."""
+        # Arrange
+        monkeypatch.setattr(dependencies, "get_settings", lambda: local_settings)
+        dependencies.get_shared_storage_service.cache_clear()
+
+        # Act
+        first = await dependencies.get_storage_service()
+        second = await dependencies.get_storage_service()
+        dependencies.get_shared_storage_service.cache_clear()
+
+        # Assert
+        assert first is second
+        assert first.config.base_storage_path == Path("data/test-pdfs")
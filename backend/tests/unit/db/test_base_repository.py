@@ -0,0 +1,210 @@
+"""
+Unit tests for the base repository.
+
+Author: Patryk Golabek
+Copyright: 2025 Patryk Golabek
+"""
+
+import asyncio
+from datetime import UTC, datetime
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.db.models.company import Company
+from app.db.models.extraction import Extraction
+from app.db.repositories import base as base_module
+from app.db.repositories.base import BaseRepository, select_by_ids
+
+
+@pytest.mark.unit
+class TestModelToDict:
+    """Test cases for BaseRepository._model_to_dict."""
+
+    @pytest.mark.asyncio
+    async def test_model_to_dict_serializes_datetime_columns(self):
+        """Test datetime columns are converted to ISO strings."""
+        # Arrange
+        created_at = datetime(2024, 1, 2, 3, 4, 5, tzinfo=UTC)
+        extraction = Extraction(
+            id=1,
+            document_id=2,
+            statement_type="income_statement",
+            raw_data={"currency": "EUR"},
+            created_at=created_at,
+        )
+        repository = BaseRepository()
+
+        # Act
+        result = await repository._model_to_dict(extraction)
+
+        # Assert
+        assert result == {
+            "id": 1,
+            "document_id": 2,
+            "statement_type": "income_statement",
+            "raw_data": {"currency": "EUR"},
+            "created_at": created_at.isoformat(),
+        }
+
+    @pytest.mark.asyncio
+    async def test_model_to_dict_keeps_none_values(self):
+        """Test unset nullable columns stay None."""
+        # Arrange
+        company = Company(id=1, name="Test Company", ir_url="https://example.com/ir")
+        repository = BaseRepository()
+
+        # Act
+        result = await repository._model_to_dict(company)
+
+        # Assert
+        assert result["created_at"] is None
+        assert result["tickers"] is None
+        assert list(result) == [column.name for column in Company.__table__.columns]
+
+
+@pytest.mark.unit
+class TestCoalesce:
+    """Test cases for BaseRepository._coalesce."""
+
+    @pytest.mark.asyncio
+    async def test_coalesce_shares_concurrent_reads(self):
+        """Test concurrent callers with the same key share a single load."""
+        # Arrange
+        repository = BaseRepository()
+        calls = 0
+
+        async def loader():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0)
+            return "company"
+
+        # Act
+        results = await asyncio.gather(
+            repository._coalesce(("company", 1), loader),
+            repository._coalesce(("company", 1), loader),
+        )
+
+        # Assert
+        assert results == ["company", "company"]
+        assert calls == 1
+        assert repository._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_coalesce_does_not_cache_completed_reads(self):
+        """Test a finished read is not reused by later callers."""
+        # Arrange
+        repository = BaseRepository()
+        calls = 0
+
+        async def loader():
+            nonlocal calls
+            calls += 1
+            return calls
+
+        # Act
+        first = await repository._coalesce(("company", 1), loader)
+        second = await repository._coalesce(("company", 1), loader)
+
+        # Assert
+        assert (first, second) == (1, 2)
+
+
+@pytest.mark.unit
+class TestCached:
+    """Test cases for BaseRepository._cached."""
+
+    @pytest.mark.asyncio
+    async def test_cached_reuses_result(self):
+        """Test a repeated lookup is served from the cache."""
+        # Arrange
+        repository = BaseRepository()
+        calls = 0
+
+        async def loader():
+            nonlocal calls
+            calls += 1
+            return calls
+
+        # Act
+        first = await repository._cached(("company_and_type", 1, "income_statement"), loader)
+        second = await repository._cached(("company_and_type", 1, "income_statement"), loader)
+
+        # Assert
+        assert first == 1 and second == 1
+        assert calls == 1
+
+    @pytest.mark.asyncio
+    async def test_cached_does_not_keep_misses(self):
+        """Test a lookup that found nothing is retried, so a new row is seen."""
+        # Arrange
+        repository = BaseRepository()
+        results = iter([None, "created"])
+
+        async def loader():
+            return next(results)
+
+        # Act
+        first = await repository._cached(("company_and_type", 1, "income_statement"), loader)
+        second = await repository._cached(("company_and_type", 1, "income_statement"), loader)
+
+        # Assert
+        assert first is None
+        assert second == "created"
+
+    @pytest.mark.asyncio
+    async def test_invalidate_cache_forces_reload(self):
+        """Test writes drop cached lookups."""
+        # Arrange
+        repository = BaseRepository()
+        calls = 0
+
+        async def loader():
+            nonlocal calls
+            calls += 1
+            return calls
+
+        await repository._cached(("key",), loader)
+
+        # Act
+        repository._invalidate_cache()
+        result = await repository._cached(("key",), loader)
+
+        # Assert
+        assert result == 2
+
+    @pytest.mark.asyncio
+    async def test_cached_entry_expires(self, monkeypatch):
+        """Test entries older than the TTL are reloaded."""
+        # Arrange
+        repository = BaseRepository()
+        now = 1000.0
+        monkeypatch.setattr(base_module, "time", SimpleNamespace(monotonic=lambda: now))
+
+        async def loader():
+            return now
+
+        await repository._cached(("key",), loader)
+
+        # Act
+        now += base_module.LOOKUP_CACHE_TTL + 1
+        result = await repository._cached(("key",), loader)
+
+        # Assert
+        assert result == now
+
+
+@pytest.mark.unit
+class TestSelectByIds:
+    """Test cases for select_by_ids."""
+
+    def test_select_by_ids_binds_single_array(self):
+        """Test the lookup uses one array parameter and keeps the input order."""
+        # Act
+        sql = str(select_by_ids(Extraction).compile(dialect=postgresql.dialect()))
+
+        # Assert
+        assert "extractions.id = ANY (%(ids)s::INTEGER[])" in sql
+        assert "ORDER BY array_position(%(ids)s::INTEGER[], extractions.id)" in sql
@@ -0,0 +1,129 @@
+"""
+Unit tests for the company repository.
+
+Author: Patryk Golabek
+Copyright: 2025 Patryk Golabek
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm.util import identity_key
+
+from app.db.models.company import Company
+from app.db.repositories import company as repository_module
+from app.db.repositories.company import CompanyRepository
+
+
+@pytest.fixture
+def session() -> MagicMock:
+    """Create a mock async session with an empty identity map."""
+    session = MagicMock()
+    session.identity_map = {}
+    session.scalar = AsyncMock(return_value=True)
+    return session
+
+
+@pytest.mark.unit
+class TestCompanyRepositoryExists:
+    """Test cases for CompanyRepository.exists."""
+
+    @pytest.mark.asyncio
+    async def test_exists_answers_from_identity_map(self, session):
+        """Test a company already loaded in the session needs no query."""
+        # Arrange
+        session.identity_map[identity_key(Company, 1)] = Company(id=1)
+        repository = CompanyRepository(session)
+
+        # Act
+        result = await repository.exists(1)
+
+        # Assert
+        assert result is True
+        session.scalar.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_exists_checks_share_one_query(self, session):
+        """Test sibling checks for the same company in one request run one query."""
+        # Arrange
+        repository = CompanyRepository(session)
+
+        # Act
+        results = await asyncio.gather(*(repository.exists(2) for _ in range(3)))
+
+        # Assert
+        assert results == [True, True, True]
+        session.scalar.assert_called_once()
+
+
+@pytest.mark.unit
+class TestCompanyRepositoryStatements:
+    """Test cases for the prebuilt CompanyRepository statements."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("with_relations", "statement"),
+        [
+            (False, repository_module._GET_ALL),
+            (True, repository_module._GET_ALL_WITH_RELATIONS),
+        ],
+    )
+    async def test_get_all_binds_pagination_to_a_prebuilt_statement(
+        self, session, with_relations, statement
+    ):
+        """Test each listing shape reuses one statement with bound skip and limit."""
+        # Arrange
+        session.execute = AsyncMock(return_value=MagicMock())
+        repository = CompanyRepository(session)
+
+        # Act
+        await repository.get_all(skip=20, limit=10, with_relations=with_relations)
+
+        # Assert
+        session.execute.assert_called_once_with(statement, {"skip": 20, "limit": 10})
+
+    @pytest.mark.asyncio
+    async def test_get_many_by_ids_binds_one_id_array(self, session):
+        """Test a batch lookup runs the shared ``= ANY(:ids)`` statement."""
+        # Arrange
+        session.scalars = AsyncMock(return_value=[Company(id=2), Company(id=5)])
+        repository = CompanyRepository(session)
+
+        # Act
+        result = await repository.get_many_by_ids([5, 2])
+
+        # Assert
+        assert list(result) == [2, 5]
+        session.scalars.assert_called_once_with(repository_module._GET_BY_IDS, {"ids": [5, 2]})
+
+    @pytest.mark.asyncio
+    async def test_delete_uses_prebuilt_statement(self, session):
+        """Test a delete binds the company ID to the prebuilt DELETE ... RETURNING."""
+        # Arrange
+        session.execute = AsyncMock(return_value=MagicMock())
+        session.execute.return_value.scalar_one_or_none.return_value = 4
+        repository = CompanyRepository(session)
+
+        # Act
+        deleted = await repository.delete(4)
+
+        # Assert
+        assert deleted is True
+        session.execute.assert_called_once_with(repository_module._DELETE, {"company_id": 4})
+
+    def test_ticker_lookup_ranks_companies_without_primary_ticker_last(self):
+        """Test a secondary listing without a primary ticker does not outrank a primary match.
+
+        ``primary_ticker = :ticker`` is NULL for such companies, and PostgreSQL
+        sorts NULL first under DESC unless told otherwise.
+        """
+        # Act
+        sql = str(repository_module._GET_BY_TICKER.compile(dialect=postgresql.dialect()))
+
+        # Assert
+        assert (
+            "ORDER BY companies.primary_ticker = %(ticker)s::VARCHAR DESC NULLS LAST, companies.id"
+            in sql
+        )
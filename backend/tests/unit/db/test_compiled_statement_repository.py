@@ -0,0 +1,101 @@
+"""
+Unit tests for the compiled statement repository.
+
+Author: Patryk Golabek
+Copyright: 2025 Patryk Golabek
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.db.models.extraction import CompiledStatement
+from app.db.repositories import compiled_statement as repository_module
+from app.db.repositories.compiled_statement import CompiledStatementRepository
+
+
+@pytest.mark.unit
+class TestCompiledStatementRepository:
+    """Test cases for CompiledStatementRepository."""
+
+    def test_upsert_statement_binds_company_id_once(self):
+        """Test the prebuilt upsert reuses one parameter for the insert and the company check."""
+        # Act
+        compiled = repository_module._UPSERT.compile(dialect=postgresql.asyncpg.dialect())
+
+        # Assert
+        assert compiled.positiontup == ["company_id", "statement_type", "data"]
+        assert "WHERE companies.id = $1::INTEGER" in str(compiled)
+
+    @pytest.mark.asyncio
+    async def test_writes_execute_prebuilt_statements(self):
+        """Test writes reuse the module-level statements with bound parameters."""
+        # Arrange
+        session = MagicMock()
+        session.scalars = AsyncMock(return_value=MagicMock())
+        session.execute = AsyncMock(return_value=MagicMock())
+        session.execute.return_value.one_or_none.return_value = None
+        repository = CompiledStatementRepository(session)
+
+        # Act
+        await repository.upsert(1, "balance_sheet", {"years": [2023]})
+        await repository.update(2, {"years": [2024]})
+        await repository.delete(3)
+
+        # Assert
+        statements = [call.args[0] for call in session.scalars.call_args_list]
+        assert statements[0] is repository_module._UPSERT
+        assert repository_module._UPDATE_DATA in statements
+        session.scalars.assert_any_call(
+            repository_module._UPDATE_DATA, {"compiled_statement_id": 2, "data": {"years": [2024]}}
+        )
+        session.execute.assert_called_once_with(
+            repository_module._DELETE, {"compiled_statement_id": 3}
+        )
+
+    @pytest.mark.asyncio
+    async def test_repeated_upserts_of_several_types_skip_the_database(self):
+        """Test every upserted statement is remembered, not only the last one."""
+        # Arrange
+        session = MagicMock()
+        rows = {
+            kind: CompiledStatement(id=index, company_id=1, statement_type=kind, data={"x": 1})
+            for index, kind in enumerate(("balance_sheet", "income_statement"), 1)
+        }
+        session.scalars = AsyncMock(
+            side_effect=lambda _, params: MagicMock(
+                one_or_none=MagicMock(return_value=rows[params["statement_type"]])
+            )
+        )
+        repository = CompiledStatementRepository(session)
+        for kind in rows:
+            await repository.upsert(1, kind, {"x": 1})
+
+        # Act
+        repeated = [await repository.upsert(1, kind, {"x": 1}) for kind in rows]
+
+        # Assert
+        assert repeated == list(rows.values())
+        assert session.scalars.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_delete_forgets_the_remembered_upsert(self):
+        """Test an upsert after deleting the same statement goes to the database again."""
+        # Arrange
+        session = MagicMock()
+        row = CompiledStatement(id=1, company_id=1, statement_type="balance_sheet", data={"x": 1})
+        session.scalars = AsyncMock(return_value=MagicMock(one_or_none=MagicMock(return_value=row)))
+        session.execute = AsyncMock(return_value=MagicMock())
+        session.execute.return_value.one_or_none.return_value = MagicMock(
+            company_id=1, statement_type="balance_sheet"
+        )
+        repository = CompiledStatementRepository(session)
+        await repository.upsert(1, "balance_sheet", {"x": 1})
+
+        # Act
+        await repository.delete(1)
+        await repository.upsert(1, "balance_sheet", {"x": 1})
+
+        # Assert
+        assert session.scalars.call_count == 2
@@ -0,0 +1,87 @@
+"""
+Unit tests for database dependency injection.
+
+Author: Patryk Golabek
+Copyright: 2025 Patryk Golabek
+"""
+
+from typing import Annotated
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from app.db.dependencies import get_db_session
+from app.services import dependencies
+from app.services.compiled_statement import CompiledStatementService
+from app.services.document import DocumentService
+from app.services.extraction import ExtractionService
+
+
+@pytest.mark.unit
+class TestDbSessionDependency:
+    """Test cases for request-scoped database sessions."""
+
+    def test_repositories_share_one_session_per_request(self, monkeypatch):
+        """Test a service's repositories use the same session, so one transaction."""
+        # Arrange
+        monkeypatch.setattr(dependencies, "get_shared_compiled_statement_cache", lambda: None)
+        sessions: list[MagicMock] = []
+
+        async def override_db_session():
+            session = MagicMock()
+            sessions.append(session)
+            yield session
+
+        app = FastAPI()
+        app.dependency_overrides[get_db_session] = override_db_session
+
+        @app.get("/probe")
+        async def probe(
+            service: Annotated[
+                CompiledStatementService, Depends(dependencies.get_compiled_statement_service)
+            ],
+        ) -> dict[str, bool]:
+            return {
+                "shared": service.compiled_statement_repository.session
+                is service.company_repository.session
+            }
+
+        # Act
+        response = TestClient(app).get("/probe")
+
+        # Assert
+        assert response.json() == {"shared": True}
+        assert len(sessions) == 1
+
+    def test_services_in_one_request_share_the_session(self):
+        """Test services resolved for the same request are built on one cached session."""
+        # Arrange
+        sessions: list[MagicMock] = []
+
+        async def override_db_session():
+            session = MagicMock()
+            sessions.append(session)
+            yield session
+
+        app = FastAPI()
+        app.dependency_overrides[get_db_session] = override_db_session
+
+        @app.get("/probe")
+        async def probe(
+            documents: Annotated[DocumentService, Depends(dependencies.get_document_service)],
+            extractions: Annotated[ExtractionService, Depends(dependencies.get_extraction_service)],
+        ) -> dict[str, bool]:
+            return {
+                "shared": documents.document_repository.session
+                is extractions.extraction_repository.session
+                is documents.company_repository.session
+            }
+
+        # Act
+        response = TestClient(app).get("/probe")
+
+        # Assert
+        assert response.json() == {"shared": True}
+        assert len(sessions) == 1
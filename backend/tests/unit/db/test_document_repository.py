@@ -0,0 +1,40 @@
+"""
+Unit tests for the document repository.
+
+Author: Patryk Golabek
+Copyright: 2025 Patryk Golabek
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.db.repositories import document as repository_module
+from app.db.repositories.document import DocumentRepository
+
+
+@pytest.mark.unit
+class TestDocumentRepository:
+    """Test cases for DocumentRepository."""
+
+    @pytest.mark.asyncio
+    async def test_update_row_returns_plain_columns(self):
+        """Test a row update runs the column-only UPDATE ... RETURNING for its shape."""
+        # Arrange
+        row = {"id": 7, "fiscal_year": 2024}
+        session = MagicMock()
+        session.execute = AsyncMock(return_value=MagicMock())
+        session.execute.return_value.mappings.return_value.one_or_none.return_value = row
+        repository = DocumentRepository(session)
+
+        # Act
+        result = await repository.update_row(7, fiscal_year=2024)
+
+        # Assert
+        assert result == row
+        session.execute.assert_called_once_with(
+            repository_module._UPDATE_ROW_BY_COLUMNS[("fiscal_year",)],
+            {"document_id": 7, "new_fiscal_year": 2024},
+        )
+        compiled = str(repository_module._UPDATE_ROW_BY_COLUMNS[("fiscal_year",)])
+        assert "RETURNING documents.company_id, documents.url" in compiled
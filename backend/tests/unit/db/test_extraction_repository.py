@@ -0,0 +1,63 @@
+"""
+Unit tests for the extraction repository.
+
+Author: Patryk Golabek
+Copyright: 2025 Patryk Golabek
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.db.models.extraction import Extraction
+from app.db.repositories import extraction as repository_module
+from app.db.repositories.extraction import ExtractionRepository
+
+
+@pytest.mark.unit
+class TestExtractionRepository:
+    """Test cases for ExtractionRepository."""
+
+    @pytest.mark.asyncio
+    async def test_get_many_by_document_raw_groups_rows_by_document(self):
+        """Test raw rows for several documents come from one query, grouped by parent."""
+        # Arrange
+        rows = [
+            {"id": 2, "document_id": 1, "raw_data": "{}"},
+            {"id": 1, "document_id": 3, "raw_data": "[]"},
+        ]
+        session = MagicMock()
+        session.execute = AsyncMock(return_value=MagicMock())
+        session.execute.return_value.mappings.return_value = rows
+        repository = ExtractionRepository(session)
+
+        # Act
+        result = await repository.get_many_by_document_raw([3, 1, 5])
+
+        # Assert
+        assert result == {3: [rows[1]], 1: [rows[0]], 5: []}
+        session.execute.assert_called_once_with(
+            repository_module._GET_BY_DOCUMENTS_RAW, {"document_ids": [3, 1, 5]}
+        )
+        assert "CAST(extractions.raw_data AS TEXT)" in str(repository_module._GET_BY_DOCUMENTS_RAW)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("returned", [Extraction(id=7), None])
+    async def test_update_is_one_statement_without_a_pre_read(self, returned):
+        """Test an update is one UPDATE ... RETURNING whose row doubles as the existence check."""
+        # Arrange
+        session = MagicMock()
+        session.scalars = AsyncMock(return_value=MagicMock())
+        session.scalars.return_value.one_or_none.return_value = returned
+        session.get = AsyncMock()
+        repository = ExtractionRepository(session)
+
+        # Act
+        result = await repository.update(7, raw_data={"revenue": 1})
+
+        # Assert
+        assert result is returned
+        session.scalars.assert_called_once_with(
+            repository_module._UPDATE_RAW_DATA, {"extraction_id": 7, "raw_data": {"revenue": 1}}
+        )
+        session.get.assert_not_called()
@@ -0,0 +1,59 @@
+"""
+Unit tests for the single-statement writes shared by the child repositories.
+
+Author: Patryk Golabek
+Copyright: 2025 Patryk Golabek
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.db.repositories.document import DocumentRepository
+from app.db.repositories.extraction import ExtractionRepository
+
+
+@pytest.mark.unit
+class TestGuardedWrites:
+    """Test cases for guarded inserts and RETURNING deletes."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("repository_class", "create"),
+        [
+            (
+                DocumentRepository,
+                lambda repository: repository.create_if_company_exists(
+                    999, "https://example.com/report.pdf", 2023, "annual_report"
+                ),
+            ),
+            (
+                ExtractionRepository,
+                lambda repository: repository.create_if_document_exists(
+                    999, "income_statement", {"revenue": 1}
+                ),
+            ),
+        ],
+        ids=["document", "extraction"],
+    )
+    async def test_missing_rows_are_reported_without_a_lookup(self, repository_class, create):
+        """Test an unknown parent or ID is read off the statement result, not a pre-read."""
+        # Arrange
+        session = MagicMock()
+        session.scalars = AsyncMock(return_value=MagicMock())
+        session.scalars.return_value.one_or_none.return_value = None
+        session.execute = AsyncMock(return_value=MagicMock())
+        session.execute.return_value.scalar_one_or_none.return_value = None
+        session.get = AsyncMock()
+        repository = repository_class(session)
+
+        # Act
+        created = await create(repository)
+        deleted = await repository.delete(7)
+
+        # Assert
+        assert created is None
+        assert deleted is False
+        session.scalars.assert_called_once()
+        session.execute.assert_called_once()
+        session.get.assert_not_called()
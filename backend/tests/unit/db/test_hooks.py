@@ -0,0 +1,75 @@
+"""
+Unit tests for after-commit session hooks.
+
+Author: Patryk Golabek
+Copyright: 2025 Patryk Golabek
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.db.hooks import after_commit, commit, discard_after_commit
+
+
+@pytest.fixture
+def session() -> MagicMock:
+    """Create a mock AsyncSession with a real info dictionary."""
+    session = MagicMock()
+    session.info = {}
+    session.commit = AsyncMock()
+    return session
+
+
+@pytest.mark.unit
+class TestAfterCommitHooks:
+    """Test cases for after-commit hooks."""
+
+    @pytest.mark.asyncio
+    async def test_hooks_run_once_after_the_commit(self, session):
+        """Test hooks run in registration order after the commit, and only once."""
+        # Arrange
+        calls: list[str] = []
+        session.commit.side_effect = lambda: calls.append("commit")
+
+        async def hook(name: str) -> None:
+            calls.append(name)
+
+        after_commit(session, lambda: hook("first"))
+        after_commit(session, lambda: hook("second"))
+
+        # Act
+        await commit(session)
+        await commit(session)
+
+        # Assert
+        assert calls == ["commit", "first", "second", "commit"]
+
+    @pytest.mark.asyncio
+    async def test_discarded_hooks_never_run(self, session):
+        """Test hooks of a rolled back transaction are dropped."""
+        # Arrange
+        hook = AsyncMock()
+        after_commit(session, hook)
+
+        # Act
+        discard_after_commit(session)
+        await commit(session)
+
+        # Assert
+        hook.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_failing_hook_does_not_stop_the_others(self, session):
+        """Test a failing hook is logged and later hooks still run."""
+        # Arrange
+        failing = AsyncMock(side_effect=RuntimeError("redis down"))
+        hook = AsyncMock()
+        after_commit(session, failing)
+        after_commit(session, hook)
+
+        # Act
+        await commit(session)
+
+        # Assert
+        hook.assert_called_once_with()
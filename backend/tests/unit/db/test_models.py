@@ -249,3 +249,17 @@ class TestCompiledStatementModel:
         assert compiled.data["2021"]["revenue"] == 800000
         assert compiled.data["2022"]["revenue"] == 900000
         assert compiled.data["2023"]["revenue"] == 1000000
+
+
+@pytest.mark.unit
+class TestModelMapperConfiguration:
+    """Test cases for model mapper configuration."""
+
+    @pytest.mark.parametrize("model", [Company, Document, Extraction, CompiledStatement])
+    def test_models_fetch_server_defaults_eagerly(self, model):
+        """Test models fetch server-generated defaults on flush instead of a refresh."""
+        # Arrange & Act
+        mapper = model.__mapper__
+
+        # Assert
+        assert mapper.eager_defaults is True
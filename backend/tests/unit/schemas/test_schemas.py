@@ -4,11 +4,20 @@ Unit tests for Pydantic schemas.
 Author: Patryk Golabek
 Copyright: 2025 Patryk Golabek
 """
+import subprocess
+import sys
 from datetime import datetime
+from pathlib import Path
 
 import pytest
 
-from app.schemas.company import CompanyBase, CompanyCreate, CompanyResponse, CompanyUpdate
+from app.schemas.company import (
+    CompanyBase,
+    CompanyCreate,
+    CompanyDomain,
+    CompanyResponse,
+    CompanyUpdate,
+)
 from app.schemas.document import DocumentBase, DocumentCreate, DocumentResponse, DocumentUpdate
 from app.schemas.extraction import (
     CompiledStatementBase,
@@ -77,6 +86,26 @@ class TestCompanySchemas:
         assert company.name == "Test Company"
         assert company.created_at == datetime(2024, 1, 1)
 
+    def test_company_response_is_immutable_and_not_revalidated(self):
+        """Test CompanyResponse instances are frozen and pass through validation as-is."""
+        # Arrange
+        company = CompanyResponse(id=1, name="Test Company", ir_url="https://example.com/ir")
+
+        # Act
+        validated = CompanyResponse.model_validate(company)
+
+        # Assert
+        assert validated is company
+        with pytest.raises(ValueError):
+            company.name = "Renamed"
+
+    def test_company_response_is_a_separate_api_schema(self):
+        """Test CompanyResponse subclasses the domain schema and keeps its own name."""
+        # Act & Assert
+        assert issubclass(CompanyResponse, CompanyDomain)
+        assert CompanyResponse is not CompanyDomain
+        assert CompanyResponse.model_json_schema()["title"] == "CompanyResponse"
+
     def test_company_update_all_fields_optional(self):
         """Test CompanyUpdate schema with all optional fields."""
         # Arrange & Act
@@ -269,3 +298,60 @@ class TestCompiledStatementSchemas:
         # Assert
         assert compiled.data["2021"]["revenue"] == 800000
         assert compiled.data["2023"]["revenue"] == 1000000
+
+
+@pytest.mark.unit
+class TestSchemaPackage:
+    """Test cases for the lazily populated app.schemas package."""
+
+    def test_package_exports_resolve_to_submodule_classes(self):
+        """Test every exported name resolves to the class defined in its submodule."""
+        # Arrange
+        import app.schemas as schemas
+
+        # Act
+        exported = {name: getattr(schemas, name) for name in schemas.__all__}
+
+        # Assert
+        assert exported["CompanyResponse"] is CompanyResponse
+        assert exported["DocumentResponse"] is DocumentResponse
+        assert exported["CompiledStatementResponse"] is CompiledStatementResponse
+
+    @pytest.mark.parametrize(
+        "schema",
+        [CompanyResponse, DocumentResponse, ExtractionResponse, CompiledStatementResponse],
+    )
+    def test_response_schemas_are_built_at_import(self, schema):
+        """Test response schemas are fully built at import, not on the first request."""
+        # Act & Assert
+        assert schema.__pydantic_complete__ is True
+        assert schema.model_config["from_attributes"] is True
+
+    def test_unknown_attribute_raises_attribute_error(self):
+        """Test an unknown name raises AttributeError instead of importing anything."""
+        # Arrange
+        import app.schemas as schemas
+
+        # Act & Assert
+        with pytest.raises(AttributeError):
+            _ = schemas.UnknownSchema
+
+    def test_importing_one_schema_module_does_not_import_the_others(self):
+        """Test importing app.schemas.company leaves the other schema modules unloaded."""
+        # Arrange
+        code = (
+            "import sys, app.schemas.company; "
+            "print('app.schemas.document' in sys.modules, 'app.schemas.extraction' in sys.modules)"
+        )
+
+        # Act
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=Path(__file__).resolve().parents[3],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        # Assert
+        assert result.stdout.strip() == "False False"
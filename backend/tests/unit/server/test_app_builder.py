@@ -14,6 +14,7 @@ from unittest.mock import MagicMock
 import pytest
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pytest_mock import MockerFixture
 
 from app.api.middleware.request_context import RequestIDMiddleware, TimeoutMiddleware
@@ -31,7 +32,7 @@ def fixture_mock_settings(mocker: MockerFixture) -> MagicMock:
     Returns:
         MagicMock: The mocked Settings instance.
     """
-    mock_settings_class = mocker.patch("app.Settings")
+    mock_settings_class = mocker.patch("app.factory.Settings")
     mock_settings_instance = mock_settings_class.return_value
 
     # Set required attributes with test values
@@ -179,6 +180,17 @@ def test_build(app_builder: FastAPIAppBuilder):
     assert isinstance(app, FastAPI)
 
 
+def test_default_response_class_is_orjson(app_builder: FastAPIAppBuilder):
+    """
+    Test that API responses are rendered with orjson by default.
+
+    Args:
+        app_builder (FastAPIAppBuilder): The builder instance used for testing.
+    """
+    # Verify the default response class used for routes without an explicit one
+    assert app_builder.fast_api.router.default_response_class is ORJSONResponse
+
+
 def test_complete_app_setup(app_builder: FastAPIAppBuilder):
     """
     Test that the entire application can be set up using all setup methods sequentially.
@@ -1,5 +1,5 @@
 """
-Unit tests for the `__init__.py` module of the `src.app` package.
+Unit tests for the `factory.py` module of the `app` package.
 
 This module tests the `create_app` factory function, ensuring that it correctly
 initializes and configures the FastAPI application with all necessary components,
@@ -29,7 +29,7 @@ def fixture_mock_logger(mocker: MockerFixture) -> MagicMock:
     Returns:
         MagicMock: The mocked AppLogger class.
     """
-    mock_logger_class = mocker.patch("app.AppLogger")
+    mock_logger_class = mocker.patch("app.factory.AppLogger")
     return mock_logger_class
 
 
@@ -44,7 +44,7 @@ def fixture_mock_settings(mocker: MockerFixture) -> MagicMock:
     Returns:
         MagicMock: The mocked Settings instance.
     """
-    mock_settings_class = mocker.patch("app.Settings")
+    mock_settings_class = mocker.patch("app.factory.Settings")
     mock_settings_instance = mock_settings_class.return_value
 
     # Set required attributes with test values
@@ -73,7 +73,7 @@ def fixture_mock_builder(mocker: MockerFixture) -> tuple[MagicMock, MagicMock, M
             - The second MagicMock mocks the FastAPIAppBuilder instance.
             - The third MagicMock mocks the FastAPI application returned by the builder's build method.
     """
-    mock_builder_class = mocker.patch("app.FastAPIAppBuilder")
+    mock_builder_class = mocker.patch("app.factory.FastAPIAppBuilder")
     mock_builder_instance = MagicMock()
 
     # Configure the builder instance to return itself on setup method calls for method chaining
@@ -148,7 +148,7 @@ def test_create_app_logger_initialization_failure(
           instance, and FastAPI app.
     """
     # Mock AppLogger to raise an exception during initialization
-    mock_logger_class = mocker.patch("app.AppLogger")
+    mock_logger_class = mocker.patch("app.factory.AppLogger")
     mock_logger_class.initialize_logger.side_effect = Exception("Logger initialization failed")
 
     # Mock FastAPIAppBuilder class to ensure it's not instantiated
@@ -9,10 +9,12 @@ Author: Patryk Golabek
 Copyright: 2025 Patryk Golabek
 """
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastapi import FastAPI
+from sqlalchemy.pool import QueuePool
 
 from app.lifespan import LifespanManager
 from config import Settings
@@ -42,11 +44,13 @@ def fixture_mock_settings() -> Settings:
         minio_secret_key="minioadmin",
         minio_bucket_name="financial-documents",
         minio_use_ssl=False,
+        minio_enabled=False,
         server_log_level="info",
         app_log_level="debug",
         logging_path="logging.json",
         app_name="financial-data-extractor-api",
         app_version="1.0.0",
+        db_pool_warm_connections=0,
         # Override any other settings if needed
     )
 
@@ -95,6 +99,7 @@ async def test_lifespan_startup_initializes_resources(
     mock_engine = AsyncMock()
     # Mock the dispose method for cleanup
     mock_engine.dispose = AsyncMock()
+    mock_engine.pool = MagicMock()
 
     # Patch async_engine where it's imported and used (in lifespan.py)
     with patch("app.lifespan.async_engine", mock_engine):
@@ -121,6 +126,7 @@ async def test_lifespan_cleanup_logs_shutdown(
     mock_engine = AsyncMock()
     # Mock the dispose method for cleanup
     mock_engine.dispose = AsyncMock()
+    mock_engine.pool = MagicMock()
 
     # Patch async_engine where it's imported and used (in lifespan.py)
     with patch("app.lifespan.async_engine", mock_engine):
@@ -150,6 +156,7 @@ async def test_lifespan_raises_exception_on_startup_failure(
 
     mock_engine = AsyncMock()
     mock_engine.dispose = AsyncMock()
+    mock_engine.pool = MagicMock()
 
     # Make logger.info raise an exception during startup to simulate a failure
     test_exception = Exception("Database initialization failed")
@@ -163,3 +170,295 @@ async def test_lifespan_raises_exception_on_startup_failure(
 
         # Verify that dispose was still called in the finally block
         mock_engine.dispose.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_lifespan_warms_pool_connections(mock_settings: Settings, mock_logger: MagicMock):
+    """
+    Test that the lifespan startup opens the configured number of pool connections.
+
+    Args:
+        mock_settings (Settings): The mocked Settings instance.
+        mock_logger (MagicMock): The mocked logger instance.
+    """
+    app = FastAPI()
+    settings = mock_settings.model_copy(update={"db_pool_warm_connections": 3})
+    manager = LifespanManager(settings=settings, logger=mock_logger)
+
+    mock_engine = MagicMock()
+    mock_engine.dispose = AsyncMock()
+    mock_engine.pool = MagicMock(spec=QueuePool)
+    mock_engine.pool.size.return_value = 5
+    connection_context = MagicMock()
+    connection_context.__aenter__ = AsyncMock()
+    connection_context.__aexit__ = AsyncMock(return_value=None)
+    mock_engine.connect.return_value = connection_context
+
+    with patch("app.lifespan.async_engine", mock_engine):
+        async with manager.lifespan(app):
+            assert mock_engine.connect.call_count == 3
+            assert connection_context.__aexit__.await_count == 3
+
+    mock_logger.info.assert_any_call("Database pool warmed with %d connections.", 3)
+
+
+@pytest.mark.asyncio
+async def test_lifespan_warms_no_more_than_the_pool_size(
+    mock_settings: Settings, mock_logger: MagicMock
+):
+    """
+    Test that the warm-up never opens overflow connections the pool would discard.
+
+    Args:
+        mock_settings (Settings): The mocked Settings instance.
+        mock_logger (MagicMock): The mocked logger instance.
+    """
+    app = FastAPI()
+    settings = mock_settings.model_copy(update={"db_pool_warm_connections": 10})
+    manager = LifespanManager(settings=settings, logger=mock_logger)
+
+    mock_engine = MagicMock()
+    mock_engine.dispose = AsyncMock()
+    mock_engine.pool = MagicMock(spec=QueuePool)
+    mock_engine.pool.size.return_value = 2
+    connection_context = MagicMock()
+    connection_context.__aenter__ = AsyncMock()
+    connection_context.__aexit__ = AsyncMock(return_value=None)
+    mock_engine.connect.return_value = connection_context
+
+    with patch("app.lifespan.async_engine", mock_engine):
+        async with manager.lifespan(app):
+            assert mock_engine.connect.call_count == 2
+
+    mock_logger.info.assert_any_call("Database pool warmed with %d connections.", 2)
+
+
+@pytest.mark.asyncio
+async def test_lifespan_closes_every_warm_connection_when_one_fails(
+    mock_settings: Settings, mock_logger: MagicMock
+):
+    """
+    Test that connections still being opened when another fails are not leaked.
+
+    Args:
+        mock_settings (Settings): The mocked Settings instance.
+        mock_logger (MagicMock): The mocked logger instance.
+    """
+    app = FastAPI()
+    settings = mock_settings.model_copy(update={"db_pool_warm_connections": 3})
+    manager = LifespanManager(settings=settings, logger=mock_logger)
+    opened: list[int] = []
+    closed: list[int] = []
+
+    def connect():
+        index = mock_engine.connect.call_count
+        connection_context = MagicMock()
+
+        async def enter(*_):
+            # The first connect succeeds at once, the second fails, the third is slow
+            await asyncio.sleep({1: 0, 2: 0.005, 3: 0.02}[index])
+            if index == 2:
+                raise ConnectionError("database unavailable")
+            opened.append(index)
+
+        async def exit_(*_):
+            closed.append(index)
+
+        connection_context.__aenter__ = AsyncMock(side_effect=enter)
+        connection_context.__aexit__ = AsyncMock(side_effect=exit_)
+        return connection_context
+
+    mock_engine = MagicMock()
+    mock_engine.dispose = AsyncMock()
+    mock_engine.pool = MagicMock(spec=QueuePool)
+    mock_engine.pool.size.return_value = 5
+    mock_engine.connect.side_effect = connect
+
+    with patch("app.lifespan.async_engine", mock_engine):
+        async with manager.lifespan(app):
+            # Give connects that outlived the failure time to finish
+            await asyncio.sleep(0.05)
+
+    assert opened
+    assert sorted(opened) == sorted(closed)
+    mock_logger.warning.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_lifespan_continues_when_pool_warm_up_fails(
+    mock_settings: Settings, mock_logger: MagicMock
+):
+    """
+    Test that a failed pool warm-up is logged without aborting startup.
+
+    Args:
+        mock_settings (Settings): The mocked Settings instance.
+        mock_logger (MagicMock): The mocked logger instance.
+    """
+    app = FastAPI()
+    settings = mock_settings.model_copy(update={"db_pool_warm_connections": 2})
+    manager = LifespanManager(settings=settings, logger=mock_logger)
+
+    mock_engine = MagicMock()
+    mock_engine.dispose = AsyncMock()
+    mock_engine.pool = MagicMock(spec=QueuePool)
+    mock_engine.pool.size.return_value = 5
+    mock_engine.connect.side_effect = ConnectionError("database unavailable")
+
+    with patch("app.lifespan.async_engine", mock_engine):
+        async with manager.lifespan(app):
+            assert app.state.async_engine == mock_engine
+
+    mock_logger.warning.assert_called_once()
+    mock_engine.dispose.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_lifespan_gives_up_on_slow_pool_warm_up(
+    mock_settings: Settings, mock_logger: MagicMock
+):
+    """
+    Test that a pool warm-up exceeding its timeout is abandoned without blocking startup.
+
+    Args:
+        mock_settings (Settings): The mocked Settings instance.
+        mock_logger (MagicMock): The mocked logger instance.
+    """
+    app = FastAPI()
+    settings = mock_settings.model_copy(
+        update={"db_pool_warm_connections": 2, "db_pool_warm_timeout": 0.01}
+    )
+    manager = LifespanManager(settings=settings, logger=mock_logger)
+
+    mock_engine = MagicMock()
+    mock_engine.dispose = AsyncMock()
+    mock_engine.pool = MagicMock(spec=QueuePool)
+    mock_engine.pool.size.return_value = 5
+    connection_context = MagicMock()
+
+    async def hang(*_):
+        await asyncio.sleep(60)
+
+    connection_context.__aenter__ = AsyncMock(side_effect=hang)
+    connection_context.__aexit__ = AsyncMock(return_value=None)
+    mock_engine.connect.return_value = connection_context
+
+    with patch("app.lifespan.async_engine", mock_engine):
+        async with manager.lifespan(app):
+            assert app.state.async_engine == mock_engine
+
+    mock_logger.warning.assert_called_once()
+    assert isinstance(mock_logger.warning.call_args.args[1], TimeoutError)
+
+
+@pytest.mark.asyncio
+async def test_lifespan_builds_storage_service_at_startup(
+    mock_settings: Settings, mock_logger: MagicMock
+):
+    """
+    Test that object storage is set up during startup when MinIO is enabled.
+
+    Args:
+        mock_settings (Settings): The mocked Settings instance.
+        mock_logger (MagicMock): The mocked logger instance.
+    """
+    app = FastAPI()
+    settings = mock_settings.model_copy(update={"minio_enabled": True})
+    manager = LifespanManager(settings=settings, logger=mock_logger)
+
+    mock_engine = MagicMock()
+    mock_engine.dispose = AsyncMock()
+    build_storage = MagicMock()
+
+    with (
+        patch("app.lifespan.async_engine", mock_engine),
+        patch("app.services.dependencies.get_shared_storage_service", build_storage),
+    ):
+        async with manager.lifespan(app):
+            build_storage.assert_called_once_with()
+
+    mock_logger.info.assert_any_call("Storage service initialized.")
+
+
+@pytest.mark.asyncio
+async def test_lifespan_continues_when_storage_warm_up_fails(
+    mock_settings: Settings, mock_logger: MagicMock
+):
+    """
+    Test that an unreachable object store is logged without aborting startup.
+
+    Args:
+        mock_settings (Settings): The mocked Settings instance.
+        mock_logger (MagicMock): The mocked logger instance.
+    """
+    app = FastAPI()
+    settings = mock_settings.model_copy(update={"minio_enabled": True})
+    manager = LifespanManager(settings=settings, logger=mock_logger)
+
+    mock_engine = MagicMock()
+    mock_engine.dispose = AsyncMock()
+    build_storage = MagicMock(side_effect=ConnectionError("minio unavailable"))
+
+    with (
+        patch("app.lifespan.async_engine", mock_engine),
+        patch("app.services.dependencies.get_shared_storage_service", build_storage),
+    ):
+        async with manager.lifespan(app):
+            assert app.state.async_engine == mock_engine
+
+    mock_logger.warning.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_lifespan_closes_compiled_statement_cache_at_shutdown(
+    lifespan_manager: LifespanManager,
+):
+    """
+    Test that a compiled statement cache built during the app's life is closed and dropped.
+
+    Args:
+        lifespan_manager (LifespanManager): The instance of LifespanManager used for testing.
+    """
+    app = FastAPI()
+    mock_engine = MagicMock()
+    mock_engine.dispose = AsyncMock()
+    cache = MagicMock()
+    cache.aclose = AsyncMock()
+    get_cache = MagicMock(return_value=cache)
+    get_cache.cache_info.return_value.currsize = 1
+
+    with (
+        patch("app.lifespan.async_engine", mock_engine),
+        patch("app.services.dependencies.get_shared_compiled_statement_cache", get_cache),
+    ):
+        async with lifespan_manager.lifespan(app):
+            cache.aclose.assert_not_called()
+
+    cache.aclose.assert_awaited_once_with()
+    get_cache.cache_clear.assert_called_once_with()
+
+
+@pytest.mark.asyncio
+async def test_lifespan_does_not_build_compiled_statement_cache_at_shutdown(
+    lifespan_manager: LifespanManager,
+):
+    """
+    Test that shutdown does not build the compiled statement cache just to close it.
+
+    Args:
+        lifespan_manager (LifespanManager): The instance of LifespanManager used for testing.
+    """
+    app = FastAPI()
+    mock_engine = MagicMock()
+    mock_engine.dispose = AsyncMock()
+    get_cache = MagicMock()
+    get_cache.cache_info.return_value.currsize = 0
+
+    with (
+        patch("app.lifespan.async_engine", mock_engine),
+        patch("app.services.dependencies.get_shared_compiled_statement_cache", get_cache),
+    ):
+        async with lifespan_manager.lifespan(app):
+            pass
+
+    get_cache.assert_not_called()
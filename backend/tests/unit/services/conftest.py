@@ -11,16 +11,39 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 
 from app.schemas.company import CompanyDomain
+from app.services.company import clear_company_cache
+
+
+@pytest.fixture(autouse=True)
+def reset_company_cache():
+    """Start every test with an empty process-wide company cache."""
+    clear_company_cache()
+    yield
+    clear_company_cache()
 
 
 @pytest.fixture
-def mock_company_repository() -> MagicMock:
+def mock_session() -> MagicMock:
+    """Create a mock AsyncSession whose after-commit hooks can be run."""
+    session = MagicMock()
+    session.info = {}
+    session.commit = AsyncMock()
+    return session
+
+
+@pytest.fixture
+def mock_company_repository(mock_session) -> MagicMock:
     """Create a mock CompanyRepository for testing."""
     repository = MagicMock()
+    repository.session = mock_session
     repository.get_by_id = AsyncMock()
+    repository.exists = AsyncMock()
     repository.get_by_ticker = AsyncMock()
+    repository.existing_ids = AsyncMock()
     repository.create = AsyncMock()
     repository.get_all = AsyncMock()
+    repository.get_all_rows = AsyncMock()
+    repository.iter_all = MagicMock()
     repository.update = AsyncMock()
     repository.delete = AsyncMock()
     return repository
@@ -31,11 +54,18 @@ def mock_document_repository() -> MagicMock:
     """Create a mock DocumentRepository for testing."""
     repository = MagicMock()
     repository.get_by_id = AsyncMock()
+    repository.exists = AsyncMock()
     repository.create = AsyncMock()
-    repository.get_documents_by_company = AsyncMock()
-    repository.get_documents_by_company_and_year = AsyncMock()
-    repository.get_documents_by_company_and_type = AsyncMock()
+    repository.create_if_company_exists = AsyncMock()
+    repository.create_row_if_company_exists = AsyncMock()
+    repository.existing_ids = AsyncMock()
+    repository.get_by_company = AsyncMock()
+    repository.get_many_rows_by_company = AsyncMock()
+    repository.get_rows_by_company = AsyncMock()
+    repository.get_rows_by_company_and_year = AsyncMock()
+    repository.get_rows_by_company_and_type = AsyncMock()
     repository.update = AsyncMock()
+    repository.update_row = AsyncMock()
     repository.delete = AsyncMock()
     return repository
 
@@ -45,11 +75,37 @@ def mock_extraction_repository() -> MagicMock:
     """Create a mock ExtractionRepository for testing."""
     repository = MagicMock()
     repository.get_by_id = AsyncMock()
+    repository.exists = AsyncMock()
+    repository.create = AsyncMock()
+    repository.create_if_document_exists = AsyncMock()
+    repository.get_by_document = AsyncMock()
+    repository.get_many_by_document = AsyncMock()
+    repository.get_many_by_document_raw = AsyncMock()
+    repository.get_by_document_raw = AsyncMock()
+    repository.get_metadata_by_document = AsyncMock()
+    repository.get_by_document_and_type = AsyncMock()
+    repository.update = AsyncMock()
+    repository.delete = AsyncMock()
+    return repository
+
+
+@pytest.fixture
+def mock_compiled_statement_repository(mock_session) -> MagicMock:
+    """Create a mock CompiledStatementRepository for testing."""
+    repository = MagicMock()
+    repository.session = mock_session
+    repository.get_by_id = AsyncMock()
+    repository.exists = AsyncMock()
     repository.create = AsyncMock()
-    repository.get_extractions_by_document = AsyncMock()
-    repository.get_extraction_by_document_and_type = AsyncMock()
+    repository.get_by_ids = AsyncMock()
+    repository.get_by_company = AsyncMock()
+    repository.get_by_company_raw = AsyncMock()
+    repository.get_metadata_by_company = AsyncMock()
+    repository.get_by_company_and_type = AsyncMock()
     repository.update = AsyncMock()
+    repository.upsert = AsyncMock()
     repository.delete = AsyncMock()
+    repository.bulk_upsert = AsyncMock()
     return repository
 
 
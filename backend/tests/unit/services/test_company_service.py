@@ -5,14 +5,21 @@ Author: Patryk Golabek
 Copyright: 2025 Patryk Golabek
 """
 
+import json
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock
+
 import pytest
 
+from app.core.exceptions.db_exceptions import DatabaseConnectionError
 from app.core.exceptions.service_exceptions import (
     EntityNotFoundError,
     ServiceUnavailableError,
 )
-from app.schemas.company import CompanyCreate, CompanyUpdate
-from app.services.company import CompanyService
+from app.db.hooks import commit
+from app.db.models.company import Company
+from app.schemas.company import CompanyCreate, CompanyDomain, CompanyUpdate
+from app.services.company import CompanyService, company_exists, missing_company_ids
 
 
 @pytest.mark.unit
@@ -137,23 +144,21 @@ class TestCompanyService:
     async def test_get_all_companies_success(self, mock_company_repository, sample_company_data):
         """Test successful retrieval of all companies."""
         # Arrange
-        companies = [sample_company_data]
-        mock_company_repository.get_all.return_value = companies
+        mock_company_repository.get_all_rows.return_value = [sample_company_data.model_dump()]
         service = CompanyService(mock_company_repository)
 
         # Act
         result = await service.get_all_companies(skip=0, limit=10)
 
         # Assert
-        assert result == companies
-        mock_company_repository.get_all.assert_called_once_with(skip=0, limit=10)
+        assert result == [sample_company_data]
+        mock_company_repository.get_all_rows.assert_called_once_with(skip=0, limit=10)
 
     @pytest.mark.asyncio
     async def test_update_company_success(self, mock_company_repository, sample_company_data):
         """Test successful company update."""
         # Arrange
         updated_data = sample_company_data.model_copy(update={"name": "Updated Company"})
-        mock_company_repository.get_by_id.return_value = sample_company_data
         mock_company_repository.update.return_value = updated_data
         service = CompanyService(mock_company_repository)
         company_data = CompanyUpdate(name="Updated Company")
@@ -165,12 +170,13 @@ class TestCompanyService:
         assert result == updated_data
         assert result.name == "Updated Company"
         mock_company_repository.update.assert_called_once()
+        mock_company_repository.get_by_id.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_update_company_not_found(self, mock_company_repository):
         """Test company update when company not found raises EntityNotFoundError."""
         # Arrange
-        mock_company_repository.get_by_id.return_value = None
+        mock_company_repository.update.return_value = None
         service = CompanyService(mock_company_repository)
         company_data = CompanyUpdate(name="Updated Company")
 
@@ -185,7 +191,6 @@ class TestCompanyService:
     async def test_delete_company_success(self, mock_company_repository, sample_company_data):
         """Test successful company deletion."""
         # Arrange
-        mock_company_repository.get_by_id.return_value = sample_company_data
         mock_company_repository.delete.return_value = True
         service = CompanyService(mock_company_repository)
 
@@ -195,12 +200,31 @@ class TestCompanyService:
         # Assert
         assert result is None
         mock_company_repository.delete.assert_called_once_with(1)
+        mock_company_repository.get_by_id.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_delete_company_drops_cached_statements_after_commit(
+        self, mock_company_repository, mock_session
+    ):
+        """Test deleting a company drops its cached compiled statements once committed."""
+        # Arrange
+        mock_company_repository.delete.return_value = True
+        statement_cache = AsyncMock()
+        service = CompanyService(mock_company_repository, statement_cache)
+
+        # Act
+        await service.delete_company(1)
+        statement_cache.invalidate_company.assert_not_called()
+        await commit(mock_session)
+
+        # Assert
+        statement_cache.invalidate_company.assert_called_once_with(1)
 
     @pytest.mark.asyncio
     async def test_delete_company_not_found(self, mock_company_repository):
         """Test company deletion when company not found raises EntityNotFoundError."""
         # Arrange
-        mock_company_repository.get_by_id.return_value = None
+        mock_company_repository.delete.return_value = False
         service = CompanyService(mock_company_repository)
 
         # Act & Assert
@@ -211,15 +235,313 @@ class TestCompanyService:
         assert exc_info.value.entity_id == 999
 
     @pytest.mark.asyncio
-    async def test_delete_company_delete_fails(self, mock_company_repository, sample_company_data):
-        """Test company deletion when delete operation fails raises ServiceUnavailableError."""
+    async def test_delete_company_database_error(self, mock_company_repository):
+        """Test a database failure during deletion raises ServiceUnavailableError."""
         # Arrange
-        mock_company_repository.get_by_id.return_value = sample_company_data
-        mock_company_repository.delete.return_value = False
+        mock_company_repository.delete.side_effect = DatabaseConnectionError(
+            message="connection lost"
+        )
         service = CompanyService(mock_company_repository)
 
         # Act & Assert
-        with pytest.raises(ServiceUnavailableError) as exc_info:
+        with pytest.raises(ServiceUnavailableError):
             await service.delete_company(1)
 
-        assert "Failed to delete company" in str(exc_info.value)
+    def test_model_to_domain_copies_every_domain_field(self, mock_company_repository):
+        """Test the conversion covers all CompanyDomain fields."""
+        # Arrange
+        service = CompanyService(mock_company_repository)
+        company = Company(
+            id=7,
+            name="Test Company",
+            ir_url="https://example.com/ir",
+            primary_ticker="TEST",
+            tickers=[{"exchange": "NYSE", "symbol": "TEST"}],
+            created_at=datetime(2024, 1, 1),
+        )
+
+        # Act
+        result = service._model_to_domain(company)
+
+        # Assert
+        assert result.model_fields_set == set(CompanyDomain.model_fields)
+        assert result.id == 7
+        assert result.tickers == [{"exchange": "NYSE", "symbol": "TEST"}]
+
+    @pytest.mark.asyncio
+    async def test_get_all_companies_converts_rows(self, mock_company_repository):
+        """Test a page of row dictionaries is converted to CompanyDomain instances."""
+        # Arrange
+        rows = [
+            {
+                "id": i,
+                "name": f"Company {i}",
+                "ir_url": "https://example.com/ir",
+                "primary_ticker": None,
+                "tickers": None,
+                "created_at": None,
+            }
+            for i in (1, 2)
+        ]
+        mock_company_repository.get_all_rows.return_value = rows
+        service = CompanyService(mock_company_repository)
+
+        # Act
+        result = await service.get_all_companies()
+
+        # Assert
+        assert all(isinstance(company, CompanyDomain) for company in result)
+        assert [company.id for company in result] == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_get_company_served_from_cache(
+        self, mock_company_repository, sample_company_data
+    ):
+        """Test a repeated lookup by ID does not hit the repository again."""
+        # Arrange
+        mock_company_repository.get_by_id.return_value = sample_company_data
+        first_service = CompanyService(mock_company_repository)
+        second_service = CompanyService(mock_company_repository)
+
+        # Act
+        first = await first_service.get_company(1)
+        second = await second_service.get_company(1)
+
+        # Assert
+        assert second is first
+        mock_company_repository.get_by_id.assert_called_once_with(1)
+
+    @pytest.mark.asyncio
+    async def test_get_company_by_ticker_also_caches_by_id(
+        self, mock_company_repository, sample_company_data
+    ):
+        """Test a ticker lookup warms the ID cache."""
+        # Arrange
+        mock_company_repository.get_by_ticker.return_value = sample_company_data
+        service = CompanyService(mock_company_repository)
+
+        # Act
+        await service.get_company_by_ticker("TEST")
+        await service.get_company_by_ticker("TEST")
+        result = await service.get_company(1)
+
+        # Assert
+        assert result.id == 1
+        mock_company_repository.get_by_ticker.assert_called_once_with("TEST")
+        mock_company_repository.get_by_id.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_update_company_evicts_cached_lookups(
+        self, mock_company_repository, mock_session, sample_company_data
+    ):
+        """Test a committed update makes the next lookups read the repository again."""
+        # Arrange
+        updated_data = sample_company_data.model_copy(update={"name": "Updated Company"})
+        mock_company_repository.get_by_ticker.return_value = sample_company_data
+        mock_company_repository.update.return_value = updated_data
+        service = CompanyService(mock_company_repository)
+        await service.get_company_by_ticker("TEST")
+
+        # Act
+        await service.update_company(1, CompanyUpdate(name="Updated Company"))
+        await commit(mock_session)
+        mock_company_repository.get_by_id.return_value = updated_data
+        mock_company_repository.get_by_ticker.return_value = updated_data
+        by_id = await service.get_company(1)
+        by_ticker = await service.get_company_by_ticker("TEST")
+
+        # Assert
+        assert by_id.name == "Updated Company"
+        assert by_ticker.name == "Updated Company"
+        assert mock_company_repository.get_by_ticker.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_update_company_evicts_lookup_cached_before_commit(
+        self, mock_company_repository, mock_session, sample_company_data
+    ):
+        """Test a lookup interleaved between the write and its commit is not served stale."""
+        # Arrange
+        updated_data = sample_company_data.model_copy(update={"name": "Updated Company"})
+        mock_company_repository.update.return_value = updated_data
+        mock_company_repository.get_by_id.return_value = sample_company_data
+        service = CompanyService(mock_company_repository)
+
+        # Act
+        await service.update_company(1, CompanyUpdate(name="Updated Company"))
+        # A concurrent request still reads the last committed row and caches it
+        interleaved = await service.get_company(1)
+        await commit(mock_session)
+        mock_company_repository.get_by_id.return_value = updated_data
+        after_commit = await service.get_company(1)
+
+        # Assert
+        assert interleaved.name == "Test Company"
+        assert after_commit.name == "Updated Company"
+        assert mock_company_repository.get_by_id.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_delete_company_evicts_cached_lookup(
+        self, mock_company_repository, mock_session, sample_company_data
+    ):
+        """Test a deleted company is no longer served from the cache."""
+        # Arrange
+        mock_company_repository.get_by_id.return_value = sample_company_data
+        mock_company_repository.delete.return_value = True
+        service = CompanyService(mock_company_repository)
+        await service.get_company(1)
+
+        # Act
+        await service.delete_company(1)
+        await commit(mock_session)
+        mock_company_repository.get_by_id.return_value = None
+
+        # Assert
+        with pytest.raises(EntityNotFoundError):
+            await service.get_company(1)
+
+    @pytest.mark.asyncio
+    async def test_get_all_companies_json_matches_domain_serialization(
+        self, mock_company_repository
+    ):
+        """Test the JSON listing encodes rows exactly as CompanyDomain would."""
+        # Arrange
+        rows = [
+            {
+                "id": 1,
+                "name": "Company 1",
+                "ir_url": "https://example.com/ir",
+                "primary_ticker": "ONE",
+                "tickers": [{"ticker": "ONE", "exchange": "XETRA"}],
+                "created_at": datetime(2024, 1, 1, 12, 30, tzinfo=UTC),
+            },
+            {
+                "id": 2,
+                "name": "Company 2",
+                "ir_url": "https://example.com/ir",
+                "primary_ticker": None,
+                "tickers": None,
+                "created_at": datetime(2024, 1, 2, 8, 0, 0, 123456, tzinfo=UTC),
+            },
+        ]
+        mock_company_repository.get_all_rows.return_value = rows
+        service = CompanyService(mock_company_repository)
+        expected = [CompanyDomain.model_validate(row).model_dump(mode="json") for row in rows]
+
+        # Act
+        result = await service.get_all_companies_json(skip=0, limit=10)
+
+        # Assert
+        assert json.loads(result) == expected
+        assert json.loads(result)[0]["created_at"] == "2024-01-01T12:30:00Z"
+        mock_company_repository.get_all_rows.assert_called_once_with(skip=0, limit=10)
+
+    @pytest.mark.asyncio
+    async def test_iter_companies_converts_streamed_rows(
+        self, mock_company_repository, sample_company_data
+    ):
+        """Test companies streamed from the repository are yielded as CompanyDomain."""
+
+        # Arrange
+        async def stream(batch_size):
+            for company_id in (1, 2):
+                yield sample_company_data.model_copy(update={"id": company_id})
+
+        mock_company_repository.iter_all.side_effect = stream
+        service = CompanyService(mock_company_repository)
+
+        # Act
+        result = [company async for company in service.iter_companies(batch_size=50)]
+
+        # Assert
+        assert [company.id for company in result] == [1, 2]
+        assert all(isinstance(company, CompanyDomain) for company in result)
+        mock_company_repository.iter_all.assert_called_once_with(batch_size=50)
+
+
+@pytest.mark.unit
+class TestCompanyExists:
+    """Test cases for the cached company existence check."""
+
+    @pytest.mark.asyncio
+    async def test_company_exists_caches_found_company(self, mock_company_repository):
+        """Test a confirmed company is served from the cache on the next check."""
+        # Arrange
+        mock_company_repository.exists.return_value = True
+
+        # Act
+        first = await company_exists(mock_company_repository, 1)
+        second = await company_exists(mock_company_repository, 1)
+
+        # Assert
+        assert first is True
+        assert second is True
+        mock_company_repository.exists.assert_called_once_with(1)
+        mock_company_repository.get_by_id.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_company_exists_does_not_cache_missing_company(self, mock_company_repository):
+        """Test a missing company is checked again, so a later insert is seen."""
+        # Arrange
+        mock_company_repository.exists.side_effect = [False, True]
+
+        # Act
+        first = await company_exists(mock_company_repository, 1)
+        second = await company_exists(mock_company_repository, 1)
+
+        # Assert
+        assert first is False
+        assert second is True
+        assert mock_company_repository.exists.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_company_exists_reuses_cached_company(
+        self, mock_company_repository, sample_company_data
+    ):
+        """Test a company cached by get_company needs no existence query."""
+        # Arrange
+        mock_company_repository.get_by_id.return_value = sample_company_data
+        service = CompanyService(mock_company_repository)
+        await service.get_company(1)
+
+        # Act
+        result = await company_exists(mock_company_repository, 1)
+
+        # Assert
+        assert result is True
+        mock_company_repository.exists.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_delete_company_forgets_confirmed_company(
+        self, mock_company_repository, mock_session
+    ):
+        """Test deleting a company evicts it from the existence cache."""
+        # Arrange
+        mock_company_repository.exists.side_effect = [True, False]
+        mock_company_repository.delete.return_value = True
+        service = CompanyService(mock_company_repository)
+        await company_exists(mock_company_repository, 1)
+
+        # Act
+        await service.delete_company(1)
+        await commit(mock_session)
+        result = await company_exists(mock_company_repository, 1)
+
+        # Assert
+        assert result is False
+
+    @pytest.mark.asyncio
+    async def test_missing_company_ids_only_queries_unconfirmed_ids(self, mock_company_repository):
+        """Test a batch check skips cached companies and caches the ones it confirms."""
+        # Arrange
+        mock_company_repository.exists.return_value = True
+        mock_company_repository.existing_ids.return_value = {2}
+        await company_exists(mock_company_repository, 1)
+
+        # Act
+        first = await missing_company_ids(mock_company_repository, [1, 2, 3])
+        second = await missing_company_ids(mock_company_repository, [1, 2])
+
+        # Assert
+        assert first == {3}
+        assert second == set()
+        mock_company_repository.existing_ids.assert_called_once_with({2, 3})
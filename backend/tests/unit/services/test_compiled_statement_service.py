@@ -0,0 +1,510 @@
+"""
+Unit tests for CompiledStatementService.
+
+Author: Patryk Golabek
+Copyright: 2025 Patryk Golabek
+"""
+
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock
+
+import orjson
+import pytest
+from fastapi import HTTPException
+
+from app.db.hooks import commit
+from app.db.models.extraction import CompiledStatement
+from app.schemas.extraction import (
+    CompiledStatementCreate,
+    CompiledStatementResponse,
+    CompiledStatementSummary,
+    CompiledStatementUpdate,
+)
+from app.services.compiled_statement import CompiledStatementService
+
+
+@pytest.mark.unit
+class TestCompiledStatementService:
+    """Test cases for CompiledStatementService."""
+
+    @pytest.mark.asyncio
+    async def test_get_compiled_statements_by_company_json_splices_raw_data(
+        self, mock_compiled_statement_repository, mock_company_repository, sample_company_data
+    ):
+        """Test stored statement data is forwarded without re-encoding."""
+        # Arrange
+        mock_compiled_statement_repository.get_by_company_raw.return_value = [
+            {
+                "id": 1,
+                "company_id": 1,
+                "statement_type": "income_statement",
+                "data": '{"years": [2023], "currency": "EUR"}',
+                "updated_at": datetime(2024, 1, 1, tzinfo=UTC),
+            }
+        ]
+        service = CompiledStatementService(
+            mock_compiled_statement_repository, mock_company_repository
+        )
+
+        # Act
+        result = await service.get_compiled_statements_by_company_json(1)
+
+        # Assert
+        assert b'"data":{"years": [2023], "currency": "EUR"}' in result
+        assert orjson.loads(result) == [
+            {
+                "id": 1,
+                "company_id": 1,
+                "statement_type": "income_statement",
+                "data": {"years": [2023], "currency": "EUR"},
+                "updated_at": "2024-01-01T00:00:00Z",
+            }
+        ]
+        mock_compiled_statement_repository.get_by_company_raw.assert_called_once_with(1)
+        mock_company_repository.exists.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_compiled_statements_by_company_json_company_not_found(
+        self, mock_compiled_statement_repository, mock_company_repository
+    ):
+        """Test listing statements for an unknown company raises 404."""
+        # Arrange
+        mock_compiled_statement_repository.get_by_company_raw.return_value = []
+        mock_company_repository.exists.return_value = False
+        service = CompiledStatementService(
+            mock_compiled_statement_repository, mock_company_repository
+        )
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            await service.get_compiled_statements_by_company_json(999)
+
+        assert exc_info.value.status_code == 404
+        mock_company_repository.exists.assert_called_once_with(999)
+
+    @pytest.mark.asyncio
+    async def test_get_compiled_statements_by_company_json_company_without_statements(
+        self, mock_compiled_statement_repository, mock_company_repository, sample_company_data
+    ):
+        """Test an existing company without statements yields an empty array."""
+        # Arrange
+        mock_compiled_statement_repository.get_by_company_raw.return_value = []
+        mock_company_repository.exists.return_value = True
+        service = CompiledStatementService(
+            mock_compiled_statement_repository, mock_company_repository
+        )
+
+        # Act
+        result = await service.get_compiled_statements_by_company_json(1)
+
+        # Assert
+        assert result == b"[]"
+
+    @pytest.mark.asyncio
+    async def test_get_compiled_statement_summaries_by_company_skips_data(
+        self, mock_compiled_statement_repository, mock_company_repository
+    ):
+        """Test summaries are built from the metadata query without loading data."""
+        # Arrange
+        updated_at = datetime(2024, 1, 1, tzinfo=UTC)
+        mock_compiled_statement_repository.get_metadata_by_company.return_value = [
+            {
+                "id": 1,
+                "company_id": 1,
+                "statement_type": "income_statement",
+                "updated_at": updated_at,
+            }
+        ]
+        service = CompiledStatementService(
+            mock_compiled_statement_repository, mock_company_repository
+        )
+
+        # Act
+        result = await service.get_compiled_statement_summaries_by_company(1)
+
+        # Assert
+        assert result == [
+            CompiledStatementSummary(
+                id=1, company_id=1, statement_type="income_statement", updated_at=updated_at
+            )
+        ]
+        mock_compiled_statement_repository.get_by_company.assert_not_called()
+        mock_company_repository.exists.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_compiled_statement_summaries_by_company_company_not_found(
+        self, mock_compiled_statement_repository, mock_company_repository
+    ):
+        """Test listing summaries for an unknown company raises 404."""
+        # Arrange
+        mock_compiled_statement_repository.get_metadata_by_company.return_value = []
+        mock_company_repository.exists.return_value = False
+        service = CompiledStatementService(
+            mock_compiled_statement_repository, mock_company_repository
+        )
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            await service.get_compiled_statement_summaries_by_company(999)
+
+        assert exc_info.value.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_get_compiled_statements_by_ids_uses_one_query(
+        self, mock_compiled_statement_repository, mock_company_repository
+    ):
+        """Test a batch lookup fetches each distinct ID once in a single query."""
+        # Arrange
+        updated_at = datetime(2024, 1, 1, tzinfo=UTC)
+        mock_compiled_statement_repository.get_by_ids.return_value = [
+            CompiledStatement(
+                id=index,
+                company_id=1,
+                statement_type="income_statement",
+                data={},
+                updated_at=updated_at,
+            )
+            for index in (3, 1)
+        ]
+        service = CompiledStatementService(
+            mock_compiled_statement_repository, mock_company_repository
+        )
+
+        # Act
+        result = await service.get_compiled_statements_by_ids([3, 1, 3, 42])
+
+        # Assert
+        assert [item.id for item in result] == [3, 1]
+        mock_compiled_statement_repository.get_by_ids.assert_called_once_with([3, 1, 42])
+        mock_compiled_statement_repository.get_by_id.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_compiled_statements_by_ids_empty_is_noop(
+        self, mock_compiled_statement_repository, mock_company_repository
+    ):
+        """Test an empty batch lookup does not query the database."""
+        # Arrange
+        service = CompiledStatementService(
+            mock_compiled_statement_repository, mock_company_repository
+        )
+
+        # Act
+        result = await service.get_compiled_statements_by_ids([])
+
+        # Assert
+        assert result == []
+        mock_compiled_statement_repository.get_by_ids.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_compiled_statements_by_company_validates_models(
+        self, mock_compiled_statement_repository, mock_company_repository
+    ):
+        """Test ORM rows are converted to response models in one pass."""
+        # Arrange
+        updated_at = datetime(2024, 1, 1, tzinfo=UTC)
+        mock_compiled_statement_repository.get_by_company.return_value = [
+            CompiledStatement(
+                id=index,
+                company_id=1,
+                statement_type=statement_type,
+                data={"years": [2023]},
+                updated_at=updated_at,
+            )
+            for index, statement_type in enumerate(("income_statement", "balance_sheet"), 1)
+        ]
+        service = CompiledStatementService(
+            mock_compiled_statement_repository, mock_company_repository
+        )
+
+        # Act
+        result = await service.get_compiled_statements_by_company(1)
+
+        # Assert
+        assert all(isinstance(item, CompiledStatementResponse) for item in result)
+        assert [item.statement_type for item in result] == ["income_statement", "balance_sheet"]
+        mock_company_repository.exists.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_upsert_compiled_statement_unknown_company_raises_404(
+        self, mock_compiled_statement_repository, mock_company_repository
+    ):
+        """Test an upsert the repository rejects for a missing company raises 404."""
+        # Arrange
+        mock_compiled_statement_repository.upsert.return_value = None
+        service = CompiledStatementService(
+            mock_compiled_statement_repository, mock_company_repository
+        )
+        data = CompiledStatementCreate(
+            company_id=999, statement_type="income_statement", data={"years": [2023]}
+        )
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            await service.upsert_compiled_statement(data)
+
+        assert exc_info.value.status_code == 404
+        mock_company_repository.exists.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_bulk_upsert_compiled_statements_checks_companies_once(
+        self, mock_compiled_statement_repository, mock_company_repository
+    ):
+        """Test a bulk upsert validates all companies in one call and writes once."""
+        # Arrange
+        updated_at = datetime(2024, 1, 1, tzinfo=UTC)
+        items = [
+            CompiledStatementCreate(company_id=company_id, statement_type=kind, data={"x": 1})
+            for company_id, kind in ((1, "income_statement"), (2, "balance_sheet"))
+        ]
+        mock_company_repository.existing_ids.return_value = {1, 2}
+        mock_compiled_statement_repository.bulk_upsert.return_value = [
+            CompiledStatement(id=index, updated_at=updated_at, **item.model_dump())
+            for index, item in enumerate(items, 1)
+        ]
+        service = CompiledStatementService(
+            mock_compiled_statement_repository, mock_company_repository
+        )
+
+        # Act
+        result = await service.bulk_upsert_compiled_statements(items)
+
+        # Assert
+        assert [(item.id, item.company_id) for item in result] == [(1, 1), (2, 2)]
+        mock_company_repository.existing_ids.assert_called_once_with({1, 2})
+        mock_compiled_statement_repository.bulk_upsert.assert_called_once_with(
+            [item.model_dump() for item in items]
+        )
+
+    @pytest.mark.asyncio
+    async def test_bulk_upsert_compiled_statements_unknown_companies_raise_404(
+        self, mock_compiled_statement_repository, mock_company_repository
+    ):
+        """Test a bulk upsert naming unknown companies writes nothing."""
+        # Arrange
+        items = [
+            CompiledStatementCreate(company_id=company_id, statement_type="cash_flow", data={})
+            for company_id in (1, 7, 3)
+        ]
+        mock_company_repository.existing_ids.return_value = {1}
+        service = CompiledStatementService(
+            mock_compiled_statement_repository, mock_company_repository
+        )
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            await service.bulk_upsert_compiled_statements(items)
+
+        assert exc_info.value.status_code == 404
+        assert exc_info.value.detail == "Companies not found: [3, 7]"
+        mock_compiled_statement_repository.bulk_upsert.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_bulk_upsert_compiled_statements_empty_is_noop(
+        self, mock_compiled_statement_repository, mock_company_repository
+    ):
+        """Test an empty bulk upsert touches neither repository."""
+        # Arrange
+        service = CompiledStatementService(
+            mock_compiled_statement_repository, mock_company_repository
+        )
+
+        # Act
+        result = await service.bulk_upsert_compiled_statements([])
+
+        # Assert
+        assert result == []
+        mock_company_repository.existing_ids.assert_not_called()
+        mock_compiled_statement_repository.bulk_upsert.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_compiled_statement_by_company_and_type_cache_hit(
+        self, mock_compiled_statement_repository, mock_company_repository
+    ):
+        """Test a cached statement is served without querying the database."""
+        # Arrange
+        cached = CompiledStatementResponse(
+            id=1, company_id=1, statement_type="balance_sheet", data={"years": [2023]}
+        )
+        statement_cache = AsyncMock()
+        statement_cache.get.return_value = cached.model_dump_json()
+        service = CompiledStatementService(
+            mock_compiled_statement_repository, mock_company_repository, statement_cache
+        )
+
+        # Act
+        result = await service.get_compiled_statement_by_company_and_type(1, "balance_sheet")
+
+        # Assert
+        assert result == cached
+        statement_cache.get.assert_called_once_with(1, "balance_sheet")
+        mock_compiled_statement_repository.get_by_company_and_type.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_compiled_statement_by_company_and_type_cache_miss_fills_cache(
+        self, mock_compiled_statement_repository, mock_company_repository
+    ):
+        """Test a database hit is written back to the cache."""
+        # Arrange
+        statement_cache = AsyncMock()
+        statement_cache.get.return_value = None
+        mock_compiled_statement_repository.get_by_company_and_type.return_value = CompiledStatement(
+            id=1, company_id=1, statement_type="balance_sheet", data={}
+        )
+        service = CompiledStatementService(
+            mock_compiled_statement_repository, mock_company_repository, statement_cache
+        )
+
+        # Act
+        result = await service.get_compiled_statement_by_company_and_type(1, "balance_sheet")
+
+        # Assert
+        statement_cache.set.assert_called_once_with(
+            1, "balance_sheet", result.model_dump_json().encode()
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_compiled_statement_by_company_and_type_json_returns_cached_bytes(
+        self, mock_compiled_statement_repository, mock_company_repository
+    ):
+        """Test the JSON lookup returns the cached bytes without re-serializing them."""
+        # Arrange
+        cached = b'{"id":1,"company_id":1,"statement_type":"balance_sheet","data":{}}'
+        statement_cache = AsyncMock()
+        statement_cache.get.return_value = cached
+        service = CompiledStatementService(
+            mock_compiled_statement_repository, mock_company_repository, statement_cache
+        )
+
+        # Act
+        result = await service.get_compiled_statement_by_company_and_type_json(1, "balance_sheet")
+
+        # Assert
+        assert result is cached
+        mock_compiled_statement_repository.get_by_company_and_type.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_compiled_statement_by_company_and_type_json_cache_miss_fills_cache(
+        self, mock_compiled_statement_repository, mock_company_repository
+    ):
+        """Test a database hit is serialized once and the same bytes are cached and returned."""
+        # Arrange
+        statement_cache = AsyncMock()
+        statement_cache.get.return_value = None
+        mock_compiled_statement_repository.get_by_company_and_type.return_value = CompiledStatement(
+            id=1, company_id=1, statement_type="balance_sheet", data={"years": [2023]}
+        )
+        service = CompiledStatementService(
+            mock_compiled_statement_repository, mock_company_repository, statement_cache
+        )
+
+        # Act
+        result = await service.get_compiled_statement_by_company_and_type_json(1, "balance_sheet")
+
+        # Assert
+        assert orjson.loads(result)["data"] == {"years": [2023]}
+        statement_cache.set.assert_called_once_with(1, "balance_sheet", result)
+
+    @pytest.mark.asyncio
+    async def test_get_compiled_statement_by_company_and_type_json_not_found(
+        self, mock_compiled_statement_repository, mock_company_repository
+    ):
+        """Test a missing statement raises 404 and caches nothing."""
+        # Arrange
+        statement_cache = AsyncMock()
+        statement_cache.get.return_value = None
+        mock_compiled_statement_repository.get_by_company_and_type.return_value = None
+        mock_company_repository.exists.return_value = True
+        service = CompiledStatementService(
+            mock_compiled_statement_repository, mock_company_repository, statement_cache
+        )
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            await service.get_compiled_statement_by_company_and_type_json(1, "balance_sheet")
+
+        assert exc_info.value.status_code == 404
+        statement_cache.set.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_upsert_compiled_statement_invalidates_cache_after_commit(
+        self, mock_compiled_statement_repository, mock_company_repository, mock_session
+    ):
+        """Test an upsert drops the cached statement it replaced once the write commits."""
+        # Arrange
+        statement_cache = AsyncMock()
+        mock_compiled_statement_repository.upsert.return_value = CompiledStatement(
+            id=1, company_id=1, statement_type="balance_sheet", data={"years": [2024]}
+        )
+        service = CompiledStatementService(
+            mock_compiled_statement_repository, mock_company_repository, statement_cache
+        )
+
+        # Act
+        await service.upsert_compiled_statement(
+            CompiledStatementCreate(
+                company_id=1, statement_type="balance_sheet", data={"years": [2024]}
+            )
+        )
+        statement_cache.invalidate.assert_not_called()
+        await commit(mock_session)
+
+        # Assert
+        statement_cache.invalidate.assert_called_once_with((1, "balance_sheet"))
+
+    @pytest.mark.asyncio
+    async def test_delete_compiled_statement_invalidates_cache_after_commit(
+        self, mock_compiled_statement_repository, mock_company_repository, mock_session
+    ):
+        """Test deleting a statement drops it from the cache once the delete commits."""
+        # Arrange
+        statement_cache = AsyncMock()
+        mock_compiled_statement_repository.delete.return_value = (1, "balance_sheet")
+        service = CompiledStatementService(
+            mock_compiled_statement_repository, mock_company_repository, statement_cache
+        )
+
+        # Act
+        await service.delete_compiled_statement(1)
+        statement_cache.invalidate.assert_not_called()
+        await commit(mock_session)
+
+        # Assert
+        statement_cache.invalidate.assert_called_once_with((1, "balance_sheet"))
+
+    @pytest.mark.asyncio
+    async def test_update_compiled_statement_not_found_raises_404(
+        self, mock_compiled_statement_repository, mock_company_repository
+    ):
+        """Test updating an unknown compiled statement raises 404 without a pre-check."""
+        # Arrange
+        mock_compiled_statement_repository.update.return_value = None
+        service = CompiledStatementService(
+            mock_compiled_statement_repository, mock_company_repository
+        )
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            await service.update_compiled_statement(
+                999, CompiledStatementUpdate(data={"years": [2023]})
+            )
+
+        assert exc_info.value.status_code == 404
+        mock_compiled_statement_repository.get_by_id.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_delete_compiled_statement_not_found_raises_404(
+        self, mock_compiled_statement_repository, mock_company_repository
+    ):
+        """Test deleting an unknown compiled statement raises 404 without a pre-check."""
+        # Arrange
+        mock_compiled_statement_repository.delete.return_value = None
+        service = CompiledStatementService(
+            mock_compiled_statement_repository, mock_company_repository
+        )
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            await service.delete_compiled_statement(999)
+
+        assert exc_info.value.status_code == 404
+        mock_compiled_statement_repository.get_by_id.assert_not_called()
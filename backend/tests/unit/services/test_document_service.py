@@ -0,0 +1,292 @@
+"""
+Unit tests for DocumentService.
+
+Author: Patryk Golabek
+Copyright: 2025 Patryk Golabek
+"""
+
+from datetime import UTC, datetime
+from types import SimpleNamespace
+
+import orjson
+import pytest
+from fastapi import HTTPException
+from pydantic import TypeAdapter
+
+from app.db.repositories import document as repository_module
+from app.schemas.document import DocumentCreate, DocumentResponse, DocumentUpdate
+from app.services.document import DocumentService
+
+
+@pytest.mark.unit
+class TestDocumentService:
+    """Test cases for DocumentService."""
+
+    def test_service_has_no_instance_dict(self, mock_document_repository, mock_company_repository):
+        """Test the per-request service stores its repositories in slots."""
+        # Act
+        service = DocumentService(mock_document_repository, mock_company_repository)
+
+        # Assert
+        assert not hasattr(service, "__dict__")
+        assert service.document_repository is mock_document_repository
+
+    @pytest.mark.asyncio
+    async def test_get_documents_by_company_json_skips_company_lookup_when_found(
+        self, mock_document_repository, mock_company_repository, sample_document_data
+    ):
+        """Test found documents are returned without a separate company query."""
+        # Arrange
+        mock_document_repository.get_rows_by_company.return_value = [sample_document_data]
+        service = DocumentService(mock_document_repository, mock_company_repository)
+
+        # Act
+        result, _ = await service.get_documents_by_company_json(1)
+
+        # Assert
+        assert [document["id"] for document in orjson.loads(result)] == [1]
+        mock_company_repository.exists.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_create_document_inserts_without_company_lookup(
+        self, mock_document_repository, mock_company_repository, sample_document_data
+    ):
+        """Test a create is a single guarded insert with no separate company query."""
+        # Arrange
+        mock_document_repository.create_row_if_company_exists.return_value = sample_document_data
+        service = DocumentService(mock_document_repository, mock_company_repository)
+        data = DocumentCreate(**{k: sample_document_data[k] for k in DocumentCreate.model_fields})
+
+        # Act
+        result = await service.create_document(data)
+
+        # Assert
+        assert result.id == 1
+        mock_company_repository.exists.assert_not_called()
+        mock_document_repository.create.assert_not_called()
+        mock_document_repository.create_if_company_exists.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_create_document_company_not_found(
+        self, mock_document_repository, mock_company_repository, sample_document_data
+    ):
+        """Test a guarded insert that yields no row raises a company 404."""
+        # Arrange
+        mock_document_repository.create_row_if_company_exists.return_value = None
+        service = DocumentService(mock_document_repository, mock_company_repository)
+        data = DocumentCreate(
+            **{k: sample_document_data[k] for k in DocumentCreate.model_fields}
+            | {"company_id": 999}
+        )
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            await service.create_document(data)
+
+        assert exc_info.value.status_code == 404
+        assert exc_info.value.detail == "Company with id 999 not found"
+
+    @pytest.mark.asyncio
+    async def test_get_documents_by_company_json_matches_model_serialization(
+        self, mock_document_repository, mock_company_repository, sample_document_data
+    ):
+        """Test JSON listings encode rows exactly as DocumentResponse would."""
+        # Arrange
+        values = sample_document_data | {"created_at": datetime(2024, 1, 1, tzinfo=UTC)}
+        row = {column.name: values[column.name] for column in repository_module._ROW_COLUMNS}
+        mock_document_repository.get_rows_by_company.return_value = [dict(row)]
+        service = DocumentService(mock_document_repository, mock_company_repository)
+
+        # Act
+        result, next_cursor = await service.get_documents_by_company_json(1, skip=0, limit=10)
+
+        # Assert
+        assert result == TypeAdapter(list[DocumentResponse]).dump_json([DocumentResponse(**row)])
+        assert next_cursor is None
+        mock_document_repository.get_rows_by_company.assert_called_once_with(
+            company_id=1, skip=0, limit=10, after=None
+        )
+        mock_document_repository.get_by_company.assert_not_called()
+        mock_company_repository.exists.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_documents_by_company_json_cursor_round_trips(
+        self, mock_document_repository, mock_company_repository, sample_document_data
+    ):
+        """Test a full page returns a cursor that resumes after its last document."""
+        # Arrange
+        created_at = datetime(2024, 1, 1, 12, 30, 15, 123456, tzinfo=UTC)
+        last = sample_document_data | {"id": 7, "fiscal_year": 2023, "created_at": created_at}
+        mock_document_repository.get_rows_by_company.return_value = [last]
+        service = DocumentService(mock_document_repository, mock_company_repository)
+        _, next_cursor = await service.get_documents_by_company_json(1, limit=1)
+        mock_document_repository.get_rows_by_company.reset_mock()
+
+        # Act
+        await service.get_documents_by_company_json(1, limit=1, after=next_cursor)
+
+        # Assert
+        mock_document_repository.get_rows_by_company.assert_called_once_with(
+            company_id=1, skip=0, limit=1, after=(2023, created_at, 7)
+        )
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("token", ["not a cursor", "WzEsMl0=", "WyJ4IiwieSIsInoiXQ=="])
+    async def test_get_documents_by_company_and_type_json_rejects_invalid_cursor(
+        self, mock_document_repository, mock_company_repository, token
+    ):
+        """Test a malformed cursor is rejected with 400 before querying."""
+        # Arrange
+        service = DocumentService(mock_document_repository, mock_company_repository)
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            await service.get_documents_by_company_and_type_json(1, "Annual Report", after=token)
+
+        assert exc_info.value.status_code == 400
+        mock_document_repository.get_rows_by_company_and_type.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_documents_by_company_and_type_json_company_not_found(
+        self, mock_document_repository, mock_company_repository
+    ):
+        """Test an empty JSON listing for an unknown company raises 404."""
+        # Arrange
+        mock_document_repository.get_rows_by_company_and_type.return_value = []
+        mock_company_repository.exists.return_value = False
+        service = DocumentService(mock_document_repository, mock_company_repository)
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            await service.get_documents_by_company_and_type_json(999, "Annual Report")
+
+        assert exc_info.value.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_get_documents_for_companies_uses_one_check_and_one_query(
+        self, mock_document_repository, mock_company_repository, sample_document_data
+    ):
+        """Test a batch lookup checks all companies at once and fetches documents once."""
+        # Arrange
+        mock_company_repository.existing_ids.return_value = {1, 2}
+        mock_document_repository.get_many_rows_by_company.return_value = {
+            1: [sample_document_data],
+            2: [],
+        }
+        service = DocumentService(mock_document_repository, mock_company_repository)
+
+        # Act
+        result = orjson.loads(await service.get_documents_for_companies_json([1, 2, 1]))
+
+        # Assert
+        assert [document["id"] for document in result["1"]] == [1]
+        assert result["1"][0]["created_at"] == "2024-01-01T00:00:00"
+        assert result["2"] == []
+        mock_company_repository.existing_ids.assert_called_once_with({1, 2})
+        mock_document_repository.get_many_rows_by_company.assert_called_once_with([1, 2])
+        mock_company_repository.exists.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_documents_for_companies_unknown_companies_raise_404(
+        self, mock_document_repository, mock_company_repository
+    ):
+        """Test a batch lookup naming unknown companies raises 404 before fetching."""
+        # Arrange
+        mock_company_repository.existing_ids.return_value = {1}
+        service = DocumentService(mock_document_repository, mock_company_repository)
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            await service.get_documents_for_companies_json([1, 7, 3])
+
+        assert exc_info.value.status_code == 404
+        assert exc_info.value.detail == "Companies not found: [3, 7]"
+        mock_document_repository.get_many_rows_by_company.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_document_builds_response_from_row_fields(
+        self, mock_document_repository, mock_company_repository, sample_document_data
+    ):
+        """Test a row is converted into the same response as its field values."""
+        # Arrange
+        mock_document_repository.get_by_id.return_value = SimpleNamespace(
+            **sample_document_data, _sa_instance_state=object()
+        )
+        service = DocumentService(mock_document_repository, mock_company_repository)
+
+        # Act
+        result = await service.get_document(1)
+
+        # Assert
+        assert result == DocumentResponse(**sample_document_data)
+        assert (
+            result.model_dump_json() == DocumentResponse(**sample_document_data).model_dump_json()
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_documents_by_company_and_year_json_empty_for_existing_company(
+        self, mock_document_repository, mock_company_repository, sample_company_data
+    ):
+        """Test an existing company without matching documents yields an empty list."""
+        # Arrange
+        mock_document_repository.get_rows_by_company_and_year.return_value = []
+        mock_company_repository.exists.return_value = True
+        service = DocumentService(mock_document_repository, mock_company_repository)
+
+        # Act
+        result = await service.get_documents_by_company_and_year_json(1, 2023)
+
+        # Assert
+        assert result == b"[]"
+        mock_company_repository.exists.assert_called_once_with(1)
+
+    @pytest.mark.asyncio
+    async def test_update_document_not_found_raises_404(
+        self, mock_document_repository, mock_company_repository
+    ):
+        """Test updating an unknown document raises 404 from the UPDATE result alone."""
+        # Arrange
+        mock_document_repository.update_row.return_value = None
+        service = DocumentService(mock_document_repository, mock_company_repository)
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            await service.update_document(999, DocumentUpdate(fiscal_year=2024))
+
+        assert exc_info.value.status_code == 404
+        mock_document_repository.exists.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_update_document_builds_response_from_row(
+        self, mock_document_repository, mock_company_repository, sample_document_data
+    ):
+        """Test an update is answered from the RETURNING row, not an ORM instance."""
+        # Arrange
+        mock_document_repository.update_row.return_value = sample_document_data | {
+            "fiscal_year": 2024
+        }
+        service = DocumentService(mock_document_repository, mock_company_repository)
+
+        # Act
+        result = await service.update_document(1, DocumentUpdate(fiscal_year=2024))
+
+        # Assert
+        assert result.fiscal_year == 2024
+        assert result.url == sample_document_data["url"]
+        mock_document_repository.update.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_delete_document_not_found_raises_404(
+        self, mock_document_repository, mock_company_repository
+    ):
+        """Test deleting an unknown document raises 404 from the DELETE result alone."""
+        # Arrange
+        mock_document_repository.delete.return_value = False
+        service = DocumentService(mock_document_repository, mock_company_repository)
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            await service.delete_document(999)
+
+        assert exc_info.value.status_code == 404
+        mock_document_repository.exists.assert_not_called()
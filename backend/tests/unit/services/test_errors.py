@@ -0,0 +1,33 @@
+"""
+Unit tests for service layer HTTP errors.
+
+Author: Patryk Golabek
+Copyright: 2025 Patryk Golabek
+"""
+
+import pytest
+
+from app.services.errors import all_not_found, not_found
+
+
+@pytest.mark.unit
+class TestServiceErrors:
+    """Test cases for service layer HTTP errors."""
+
+    def test_not_found(self):
+        """Test a single missing entity is described by name and ID."""
+        # Act
+        error = not_found("Document", 42)
+
+        # Assert
+        assert error.status_code == 404
+        assert error.detail == "Document with id 42 not found"
+
+    def test_all_not_found_sorts_ids(self):
+        """Test the missing IDs of a batch are listed in ascending order."""
+        # Act
+        error = all_not_found("Companies", {9, 3, 5})
+
+        # Assert
+        assert error.status_code == 404
+        assert error.detail == "Companies not found: [3, 5, 9]"
@@ -0,0 +1,288 @@
+"""
+Unit tests for ExtractionService.
+
+Author: Patryk Golabek
+Copyright: 2025 Patryk Golabek
+"""
+
+from datetime import UTC, datetime
+from types import SimpleNamespace
+
+import orjson
+import pytest
+from fastapi import HTTPException
+
+from app.schemas.extraction import ExtractionCreate, ExtractionSummary, ExtractionUpdate
+from app.services.extraction import ExtractionService
+
+
+@pytest.mark.unit
+class TestExtractionService:
+    """Test cases for ExtractionService."""
+
+    def test_service_has_no_instance_dict(
+        self, mock_extraction_repository, mock_document_repository
+    ):
+        """Test the per-request service stores its repositories in slots."""
+        # Act
+        service = ExtractionService(mock_extraction_repository, mock_document_repository)
+
+        # Assert
+        assert not hasattr(service, "__dict__")
+        assert service.extraction_repository is mock_extraction_repository
+
+    @pytest.mark.asyncio
+    async def test_create_extraction_document_not_found(
+        self, mock_extraction_repository, mock_document_repository
+    ):
+        """Test a guarded insert that yields no row raises a document 404 without a lookup."""
+        # Arrange
+        mock_extraction_repository.create_if_document_exists.return_value = None
+        service = ExtractionService(mock_extraction_repository, mock_document_repository)
+        data = ExtractionCreate(document_id=999, statement_type="Income Statement", raw_data={})
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            await service.create_extraction(data)
+
+        assert exc_info.value.status_code == 404
+        assert exc_info.value.detail == "Document with id 999 not found"
+        mock_document_repository.exists.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_extractions_by_document_skips_document_lookup_when_found(
+        self, mock_extraction_repository, mock_document_repository, sample_extraction_data
+    ):
+        """Test found extractions are returned without a separate document query."""
+        # Arrange
+        mock_extraction_repository.get_by_document.return_value = [
+            SimpleNamespace(**sample_extraction_data)
+        ]
+        service = ExtractionService(mock_extraction_repository, mock_document_repository)
+
+        # Act
+        result = await service.get_extractions_by_document(1)
+
+        # Assert
+        assert [extraction.id for extraction in result] == [1]
+        mock_document_repository.exists.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_extractions_for_documents_uses_one_check_and_one_query(
+        self, mock_extraction_repository, mock_document_repository, sample_extraction_data
+    ):
+        """Test a batch lookup checks all documents at once and fetches extractions once."""
+        # Arrange
+        mock_document_repository.existing_ids.return_value = {1, 2}
+        mock_extraction_repository.get_many_by_document_raw.return_value = {
+            1: [sample_extraction_data | {"raw_data": '{"revenue": 1000000}'}],
+            2: [],
+        }
+        service = ExtractionService(mock_extraction_repository, mock_document_repository)
+
+        # Act
+        result = orjson.loads(await service.get_extractions_for_documents_json([2, 1, 2]))
+
+        # Assert
+        assert [extraction["id"] for extraction in result["1"]] == [1]
+        assert result["1"][0]["raw_data"] == {"revenue": 1000000}
+        assert result["2"] == []
+        mock_document_repository.existing_ids.assert_called_once_with([2, 1])
+        mock_extraction_repository.get_many_by_document_raw.assert_called_once_with([2, 1])
+
+    @pytest.mark.asyncio
+    async def test_get_extractions_for_documents_unknown_documents_raise_404(
+        self, mock_extraction_repository, mock_document_repository
+    ):
+        """Test a batch lookup naming unknown documents raises 404 before fetching."""
+        # Arrange
+        mock_document_repository.existing_ids.return_value = set()
+        service = ExtractionService(mock_extraction_repository, mock_document_repository)
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            await service.get_extractions_for_documents_json([5])
+
+        assert exc_info.value.detail == "Documents not found: [5]"
+        mock_extraction_repository.get_many_by_document_raw.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_extractions_by_document_json_splices_raw_data(
+        self, mock_extraction_repository, mock_document_repository, sample_extraction_data
+    ):
+        """Test the JSON listing forwards the stored raw_data text without decoding it."""
+        # Arrange
+        mock_extraction_repository.get_by_document_raw.return_value = [
+            sample_extraction_data | {"raw_data": '{"revenue": 1000000}'}
+        ]
+        service = ExtractionService(mock_extraction_repository, mock_document_repository)
+
+        # Act
+        result = await service.get_extractions_by_document_json(1)
+
+        # Assert
+        assert orjson.loads(result)[0]["raw_data"] == {"revenue": 1000000}
+        mock_extraction_repository.get_by_document.assert_not_called()
+        mock_document_repository.exists.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_extractions_by_document_json_document_not_found(
+        self, mock_extraction_repository, mock_document_repository
+    ):
+        """Test an empty JSON listing for an unknown document raises 404."""
+        # Arrange
+        mock_extraction_repository.get_by_document_raw.return_value = []
+        mock_document_repository.exists.return_value = False
+        service = ExtractionService(mock_extraction_repository, mock_document_repository)
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            await service.get_extractions_by_document_json(999)
+
+        assert exc_info.value.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_get_extraction_summaries_by_document_skips_raw_data(
+        self, mock_extraction_repository, mock_document_repository
+    ):
+        """Test summaries are built from the metadata query without loading raw_data."""
+        # Arrange
+        created_at = datetime(2024, 1, 1, tzinfo=UTC)
+        mock_extraction_repository.get_metadata_by_document.return_value = [
+            {
+                "id": 1,
+                "document_id": 1,
+                "statement_type": "income_statement",
+                "created_at": created_at,
+            }
+        ]
+        service = ExtractionService(mock_extraction_repository, mock_document_repository)
+
+        # Act
+        result = await service.get_extraction_summaries_by_document(1)
+
+        # Assert
+        assert result == [
+            ExtractionSummary(
+                id=1, document_id=1, statement_type="income_statement", created_at=created_at
+            )
+        ]
+        mock_extraction_repository.get_by_document.assert_not_called()
+        mock_document_repository.exists.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_extraction_summaries_by_document_document_not_found(
+        self, mock_extraction_repository, mock_document_repository
+    ):
+        """Test listing summaries for an unknown document raises 404."""
+        # Arrange
+        mock_extraction_repository.get_metadata_by_document.return_value = []
+        mock_document_repository.exists.return_value = False
+        service = ExtractionService(mock_extraction_repository, mock_document_repository)
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            await service.get_extraction_summaries_by_document(999)
+
+        assert exc_info.value.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_get_extractions_by_document_empty_for_existing_document(
+        self, mock_extraction_repository, mock_document_repository
+    ):
+        """Test an existing document without extractions yields an empty list."""
+        # Arrange
+        mock_extraction_repository.get_by_document.return_value = []
+        mock_document_repository.exists.return_value = True
+        service = ExtractionService(mock_extraction_repository, mock_document_repository)
+
+        # Act
+        result = await service.get_extractions_by_document(1)
+
+        # Assert
+        assert result == []
+        mock_document_repository.exists.assert_called_once_with(1)
+
+    @pytest.mark.asyncio
+    async def test_get_extractions_by_document_document_not_found(
+        self, mock_extraction_repository, mock_document_repository
+    ):
+        """Test an empty listing for an unknown document raises 404."""
+        # Arrange
+        mock_extraction_repository.get_by_document.return_value = []
+        mock_document_repository.exists.return_value = False
+        service = ExtractionService(mock_extraction_repository, mock_document_repository)
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            await service.get_extractions_by_document(999)
+
+        assert exc_info.value.status_code == 404
+        assert exc_info.value.detail == "Document with id 999 not found"
+
+    @pytest.mark.asyncio
+    async def test_get_extraction_by_document_and_type_skips_document_lookup_when_found(
+        self, mock_extraction_repository, mock_document_repository, sample_extraction_data
+    ):
+        """Test a found extraction is returned without a separate document query."""
+        # Arrange
+        mock_extraction_repository.get_by_document_and_type.return_value = SimpleNamespace(
+            **sample_extraction_data
+        )
+        service = ExtractionService(mock_extraction_repository, mock_document_repository)
+
+        # Act
+        result = await service.get_extraction_by_document_and_type(1, "Income Statement")
+
+        # Assert
+        assert result.id == 1
+        mock_document_repository.exists.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_extraction_by_document_and_type_missing_extraction(
+        self, mock_extraction_repository, mock_document_repository
+    ):
+        """Test a known document without the statement type raises an extraction 404."""
+        # Arrange
+        mock_extraction_repository.get_by_document_and_type.return_value = None
+        mock_document_repository.exists.return_value = True
+        service = ExtractionService(mock_extraction_repository, mock_document_repository)
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            await service.get_extraction_by_document_and_type(1, "Balance Sheet")
+
+        assert exc_info.value.status_code == 404
+        assert exc_info.value.detail.startswith("Extraction with document_id 1")
+
+    @pytest.mark.asyncio
+    async def test_get_extraction_by_document_and_type_document_not_found(
+        self, mock_extraction_repository, mock_document_repository
+    ):
+        """Test a lookup for an unknown document raises a document 404."""
+        # Arrange
+        mock_extraction_repository.get_by_document_and_type.return_value = None
+        mock_document_repository.exists.return_value = False
+        service = ExtractionService(mock_extraction_repository, mock_document_repository)
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            await service.get_extraction_by_document_and_type(999, "Balance Sheet")
+
+        assert exc_info.value.detail == "Document with id 999 not found"
+
+    @pytest.mark.asyncio
+    async def test_update_extraction_not_found_raises_404(
+        self, mock_extraction_repository, mock_document_repository
+    ):
+        """Test updating an unknown extraction raises 404 from the UPDATE result alone."""
+        # Arrange
+        mock_extraction_repository.update.return_value = None
+        service = ExtractionService(mock_extraction_repository, mock_document_repository)
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            await service.update_extraction(999, ExtractionUpdate(raw_data={"revenue": 1}))
+
+        assert exc_info.value.detail == "Extraction with id 999 not found"
+        mock_extraction_repository.get_by_id.assert_not_called()
@@ -0,0 +1,6 @@
+"""
+Unit tests for Celery tasks.
+
+Author: Patryk Golabek
+Copyright: 2025 Patryk Golabek
+"""
@@ -0,0 +1,53 @@
+"""
+Unit tests for the Celery application configuration.
+
+Author: Patryk Golabek
+Copyright: 2025 Patryk Golabek
+"""
+
+import pytest
+from kombu.serialization import dumps, loads, registry
+from kombu.utils import json as kombu_json
+
+from app.tasks.celery_app import _orjson_dumps, celery_app
+
+
+@pytest.mark.unit
+class TestCelerySerialization:
+    """Test cases for Celery task and result serialization."""
+
+    def test_json_serializer_is_backed_by_orjson(self):
+        """Test the json serializer tasks and results use is the orjson codec."""
+        # Assert
+        assert celery_app.conf.task_serializer == "json"
+        assert celery_app.conf.result_serializer == "json"
+        assert celery_app.conf.accept_content == ["json"]
+        assert registry._encoders["json"].encoder is _orjson_dumps
+
+    def test_orjson_round_trip(self):
+        """Test a result dict round-trips, with integer keys becoming strings as in json."""
+        # Arrange
+        result = {"company_id": 1, "years": [2023, 2024], "line_items": {7: "Revenue"}}
+
+        # Act
+        content_type, content_encoding, payload = dumps(result, serializer="json")
+        decoded = loads(payload, content_type, content_encoding, accept=["application/json"])
+
+        # Assert
+        assert (content_type, content_encoding) == ("application/json", "utf-8")
+        assert decoded == {"company_id": 1, "years": [2023, 2024], "line_items": {"7": "Revenue"}}
+
+    def test_payloads_interoperate_with_kombu_json(self):
+        """Test messages from workers on kombu's codec decode here, and the reverse."""
+        # Arrange
+        value = {"status": "success", "count": 3, "years": [2023, 2024]}
+
+        # Act
+        from_kombu = loads(
+            kombu_json.dumps(value), "application/json", "utf-8", accept=["application/json"]
+        )
+        to_kombu = kombu_json.loads(_orjson_dumps(value))
+
+        # Assert
+        assert from_kombu == value
+        assert to_kombu == value
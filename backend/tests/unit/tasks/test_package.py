@@ -0,0 +1,59 @@
+"""
+Unit tests for the app.tasks package exports.
+
+Author: Patryk Golabek
+Copyright: 2025 Patryk Golabek
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+def _run(code: str) -> str:
+    """Run code in a fresh interpreter from the backend directory and return its output."""
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(__file__).resolve().parents[3],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout.strip()
+
+
+@pytest.mark.unit
+class TestTasksPackage:
+    """Test cases for the app.tasks package exports."""
+
+    def test_importing_a_submodule_does_not_load_the_celery_app(self):
+        """Test importing app.tasks.metrics leaves the Celery app module unloaded."""
+        # Act
+        output = _run("import sys, app.tasks.metrics; print('app.tasks.celery_app' in sys.modules)")
+
+        # Assert
+        assert output == "False"
+
+    def test_celery_app_export_is_the_app_after_a_task_module_import(self):
+        """Test the export stays the Celery instance once a task module loaded the submodule."""
+        # Act
+        output = _run(
+            "import app.tasks.scraping_tasks; "
+            "from app.tasks import celery_app; "
+            "from app.tasks.celery_app import celery_app as direct; "
+            "print(type(celery_app).__name__, celery_app is direct)"
+        )
+
+        # Assert
+        assert output == "Celery True"
+
+    def test_unknown_attribute_raises(self):
+        """Test accessing an unknown attribute raises AttributeError."""
+        # Arrange
+        import app.tasks as tasks
+
+        # Act & Assert
+        with pytest.raises(AttributeError):
+            _ = tasks.unknown_export
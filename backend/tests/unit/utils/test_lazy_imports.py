@@ -0,0 +1,54 @@
+"""
+Unit tests for the lazy package import helper.
+
+Author: Patryk Golabek
+Copyright: 2025 Patryk Golabek
+"""
+
+import sys
+from types import ModuleType
+
+import pytest
+
+from app.utils.lazy_imports import lazy_imports
+
+
+@pytest.fixture
+def package(monkeypatch):
+    """Register a throwaway package exporting ``value`` from its ``value`` submodule."""
+    package = ModuleType("lazy_pkg")
+    package.__path__ = []
+    submodule = ModuleType("lazy_pkg.value")
+    submodule.value = object()
+    monkeypatch.setitem(sys.modules, "lazy_pkg", package)
+    monkeypatch.setitem(sys.modules, "lazy_pkg.value", submodule)
+    lazy_imports("lazy_pkg", {"value": "lazy_pkg.value"})
+    return package
+
+
+@pytest.mark.unit
+class TestLazyImports:
+    """Test cases for lazy_imports."""
+
+    def test_exported_name_is_imported_on_first_access(self, package):
+        """Test an exported name resolves to the object defined in its submodule."""
+        # Act
+        value = package.value
+
+        # Assert
+        assert value is sys.modules["lazy_pkg.value"].value
+        assert package.__dict__["value"] is value
+
+    def test_submodule_of_the_same_name_does_not_shadow_export(self, package):
+        """Test binding the submodule to the package keeps the exported object."""
+        # Act
+        package.value = sys.modules["lazy_pkg.value"]
+
+        # Assert
+        assert package.value is sys.modules["lazy_pkg.value"].value
+
+    def test_unknown_name_raises_attribute_error(self, package):
+        """Test names that are not exported raise AttributeError."""
+        # Act / Assert
+        with pytest.raises(AttributeError, match="has no attribute 'missing'"):
+            _ = package.missing
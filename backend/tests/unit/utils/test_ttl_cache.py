@@ -0,0 +1,77 @@
+"""
+Unit tests for the TTL cache utility.
+
+Author: Patryk Golabek
+Copyright: 2025 Patryk Golabek
+"""
+
+import pytest
+
+from app.utils import ttl_cache
+from app.utils.ttl_cache import TTLCache
+
+
+@pytest.mark.unit
+class TestTTLCache:
+    """Test cases for TTLCache."""
+
+    def test_get_returns_stored_value(self):
+        """Test a stored value is returned until it expires."""
+        # Arrange
+        cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=60)
+
+        # Act
+        cache.set("a", 1)
+
+        # Assert
+        assert cache.get("a") == 1
+        assert cache.get("missing") is None
+
+    def test_get_drops_expired_entry(self, monkeypatch):
+        """Test an entry past its TTL is treated as missing and removed."""
+        # Arrange
+        now = [100.0]
+        monkeypatch.setattr(ttl_cache.time, "monotonic", lambda: now[0])
+        cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=10)
+        cache.set("a", 1)
+
+        # Act
+        now[0] = 110.0
+        result = cache.get("a")
+
+        # Assert
+        assert result is None
+        assert len(cache) == 0
+
+    def test_set_evicts_least_recently_used(self):
+        """Test a full cache evicts the entry read least recently."""
+        # Arrange
+        cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+
+        # Act
+        cache.set("c", 3)
+
+        # Assert
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_pop_and_clear_remove_entries(self):
+        """Test pop removes one entry and clear removes all of them."""
+        # Arrange
+        cache: TTLCache[str, int] = TTLCache(maxsize=4, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        # Act
+        popped = cache.pop("a")
+        missing = cache.pop("a")
+        cache.clear()
+
+        # Assert
+        assert popped == 1
+        assert missing is None
+        assert len(cache) == 0
@@ -0,0 +1,6 @@
+"""
+Unit tests for workers.
+
+Author: Patryk Golabek
+Copyright: 2025 Patryk Golabek
+"""
@@ -0,0 +1,65 @@
+"""
+Unit tests for CompilationWorker.
+
+Author: Patryk Golabek
+Copyright: 2025 Patryk Golabek
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.db.models.extraction import CompiledStatement
+from app.workers.compilation_worker import CompilationWorker
+
+
+@pytest.mark.unit
+class TestCompilationWorker:
+    """Test cases for CompilationWorker."""
+
+    @pytest.mark.asyncio
+    async def test_compile_company_statements_stores_all_types_in_one_upsert(self):
+        """Test every compiled statement type is written with a single bulk upsert."""
+        # Arrange
+        worker = CompilationWorker(MagicMock())
+        extraction = {"raw_data": {"line_items": []}}
+        worker._prefetch_extractions = AsyncMock(
+            return_value={
+                "income_statement": [extraction],
+                "balance_sheet": [],
+                "cash_flow_statement": [extraction],
+            }
+        )
+        worker._compile_statement = MagicMock(
+            side_effect=lambda statement_type, _: {"statement_type": statement_type}
+        )
+        worker.compiled_statement_repo.bulk_upsert = AsyncMock(
+            return_value=[
+                CompiledStatement(id=7, company_id=1, statement_type="income_statement"),
+                CompiledStatement(id=8, company_id=1, statement_type="cash_flow_statement"),
+            ]
+        )
+
+        # Act
+        result = await worker.compile_company_statements(1)
+
+        # Assert
+        worker.compiled_statement_repo.bulk_upsert.assert_called_once_with(
+            [
+                {
+                    "company_id": 1,
+                    "statement_type": "income_statement",
+                    "data": {"statement_type": "income_statement"},
+                },
+                {
+                    "company_id": 1,
+                    "statement_type": "cash_flow_statement",
+                    "data": {"statement_type": "cash_flow_statement"},
+                },
+            ]
+        )
+        statements = result["statements"]
+        assert list(statements) == ["income_statement", "balance_sheet", "cash_flow_statement"]
+        assert statements["income_statement"]["compiled_statement_id"] == 7
+        assert statements["balance_sheet"]["message"] == "no_extractions_found"
+        assert statements["cash_flow_statement"]["compiled_statement_id"] == 8
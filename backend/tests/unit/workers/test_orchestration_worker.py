@@ -0,0 +1,64 @@
+"""
+Unit tests for OrchestrationWorker.
+
+Author: Patryk Golabek
+Copyright: 2025 Patryk Golabek
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.workers.orchestration_worker import OrchestrationWorker
+
+
+@pytest.mark.unit
+class TestOrchestrationWorker:
+    """Test cases for OrchestrationWorker."""
+
+    @pytest.mark.asyncio
+    async def test_process_all_documents_overlaps_company_check_and_listing(self):
+        """Test the company check and the document listing run concurrently."""
+        # Arrange
+        worker = OrchestrationWorker(MagicMock(), MagicMock(), MagicMock(), MagicMock())
+        both_started = asyncio.Event()
+        started = 0
+
+        async def wait_for_both():
+            nonlocal started
+            started += 1
+            if started == 2:
+                both_started.set()
+            await asyncio.wait_for(both_started.wait(), timeout=1)
+
+        async def company_exists(_):
+            await wait_for_both()
+            return True
+
+        async def get_by_company(_):
+            await wait_for_both()
+            return []
+
+        worker._company_exists = AsyncMock(side_effect=company_exists)
+        worker.document_repo.get_by_company = AsyncMock(side_effect=get_by_company)
+
+        # Act
+        result = await worker.process_all_documents(1)
+
+        # Assert
+        assert result["message"] == "no_documents_found"
+        worker._company_exists.assert_awaited_once_with(1)
+        worker.document_repo.get_by_company.assert_awaited_once_with(1)
+
+    @pytest.mark.asyncio
+    async def test_process_all_documents_unknown_company(self):
+        """Test an unknown company is reported even though its listing was fetched."""
+        # Arrange
+        worker = OrchestrationWorker(MagicMock(), MagicMock(), MagicMock(), MagicMock())
+        worker._company_exists = AsyncMock(return_value=False)
+        worker.document_repo.get_by_company = AsyncMock(return_value=[])
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="Company with id 999 not found"):
+            await worker.process_all_documents(999)